@@ -14,12 +14,49 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 # --- BOILER --------------------------------------------------------------------
 
-from quickbooks_gui_api.managers import FileManager
+import os
+import sys
+import time
+import tempfile
+import threading
+
+from quickbooks_gui_api.managers.file import FileManager
+from quickbooks_gui_api.managers.hashing import DIGESTS, HashCache, digest_file
 
 file_manager = FileManager(logger=logger)
 
-file_path = Path(r"samples\file_manager\Test Case - File Manager.txt")
-not_file = Path(r"samples\file_manager\NOT Test Case - File Manager.txt")
+file_path = Path(__file__).parent.joinpath("Test Case - File Manager.txt")
+not_file = Path(__file__).parent.joinpath("NOT Test Case - File Manager.txt")
+
+logger.info("=== wait_for_file notification test ===")
+with tempfile.TemporaryDirectory() as temp_dir:
+    arriving = Path(temp_dir).joinpath("arriving.pdf")
+    created_at = []
+    def _create():
+        time.sleep(0.3)
+        created_at.append(datetime.now())
+        arriving.write_bytes(b"%PDF-1.4")
+    threading.Thread(target=_create).start()
+    result = file_manager.wait_for_file(arriving, 5, poll_frequency=2.0)
+    stop = datetime.now()
+logger.debug(f"Result: `{result}`")
+logger.info(f"Woke `{stop - created_at[0]}` after the file was created.\n")
+
+logger.info("=== wait_for_file rename notification test ===")
+with tempfile.TemporaryDirectory() as temp_dir:
+    partial = Path(temp_dir).joinpath("arriving.csv.part")
+    partial.write_text("a,b\n1,2\n")
+    arriving = Path(temp_dir).joinpath("arriving.csv")
+    renamed_at = []
+    def _rename():
+        time.sleep(0.3)
+        renamed_at.append(datetime.now())
+        partial.rename(arriving)
+    threading.Thread(target=_rename).start()
+    result = file_manager.wait_for_file(arriving, 5, poll_frequency=2.0)
+    stop = datetime.now()
+logger.debug(f"Result: `{result}`")
+logger.info(f"Woke `{stop - renamed_at[0]}` after the file was renamed into place.\n")
 
 logger.info("=== is_locked test ===")
 start = datetime.now()
@@ -59,8 +96,31 @@ logger.info(f"Previous operation time: `{stop - start}`.\n")
 
 target = Path(r"C:\Users\Derek\CFS - Derek\Programming\Python\Collections-V4\Ingest Data\Data Export - All Invoices.CSV") 
 
-logger.info("=== Starting File Hashing ===")
-start = datetime.now()
-hash = file_manager.hash_file(target)
-stop = datetime.now()
-logger.info(f"File hashed in: `{stop - start}`\nResulting Hash: `{hash}`")
+if sys.platform == "win32" and target.is_file():
+    logger.info("=== Starting File Hashing ===")
+    start = datetime.now()
+    hash = file_manager.hash_file(target)
+    stop = datetime.now()
+    logger.info(f"File hashed in: `{stop - start}`\nResulting Hash: `{hash}`")
+
+
+logger.info("=== Hash throughput benchmark ===")
+with tempfile.TemporaryDirectory() as temp_dir:
+    for size_mib in (1, 16, 128):
+        sample = Path(temp_dir).joinpath(f"benchmark_{size_mib}.csv")
+        sample.write_bytes(os.urandom(size_mib * 2**20))
+        for algorithm in DIGESTS:
+            try:
+                start = datetime.now()
+                digest_file(sample, algorithm)
+                seconds = (datetime.now() - start).total_seconds()
+            except ValueError as e:
+                logger.info(f"`{algorithm}` skipped: {e}")
+                continue
+            logger.info(f"`{algorithm}` on `{size_mib}` MiB: `{size_mib / max(seconds, 1e-9):.0f}` MiB/s.")
+
+        cache = HashCache(Path(temp_dir).joinpath("hash_cache.json"))
+        cache.digest(sample, "crc32")
+        start = datetime.now()
+        cache.digest(sample, "crc32")
+        logger.info(f"Cached digest of unchanged `{size_mib}` MiB file: `{datetime.now() - start}`.\n")
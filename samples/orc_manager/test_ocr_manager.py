@@ -42,3 +42,16 @@ stop = datetime.now()
 for i, (_, result_text) in enumerate(results.items()):
     logger.debug(f"Result {i}: {result_text}")
 logger.info(f"Previous operation time: `{stop - start}`.\n")
+
+from quickbooks_gui_api.managers import StringManager
+
+string_manager = StringManager(logger=logger)
+
+logger.info("=== OCR confusion aware match test ===")
+start = datetime.now()
+confidence = string_manager.ocr_match(text, "Hello World!!")
+matched = string_manager.is_ocr_match(text, "Hello World!!")
+cost_per_char, highest_match, lowest_distinct = string_manager.ocr_scorer.calibrate()
+stop = datetime.now()
+logger.debug(f"Confidence: `{confidence}`. Match: `{matched}`. Calibrated cost per character: `{cost_per_char}` (highest match `{highest_match}`, lowest distinct `{lowest_distinct}`).")
+logger.info(f"Previous operation time: `{stop - start}`.\n")
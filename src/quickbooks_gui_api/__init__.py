@@ -4,11 +4,13 @@ from importlib.metadata import version as _version
 
 from .gui_api import QuickBookGUIAPI
 from .config_init import ConfigInit
+from .warm_start import WarmStarter
 
 __version__ = _version("qb-gui-api")
 
 __all__ = [
            "QuickBookGUIAPI",
            "ConfigInit",
+           "WarmStarter",
            "__version__",
           ]
\ No newline at end of file
@@ -20,3 +20,8 @@ class ExpectedDialogNotFound(APIException):
 
 class InvalidPrinter(APIException):
     """The currently selected printed does not match the `VALID_INVOICE_PRINTER` defined in the config."""
+
+class ReportNameUnresolved(APIException):
+    """The requested report name could not be resolved to a single memorized report."""
+    def __init__(self, name: str, detail: str) -> None:
+        super().__init__(f"Unable to resolve the report name `{name}`. {detail}")
@@ -12,9 +12,11 @@ from pywinauto import Application, WindowSpecification
 
 
 from quickbooks_gui_api.managers import WindowManager, FileManager, Color, Helper
-from quickbooks_gui_api.models import Invoice, Element
+from quickbooks_gui_api.managers.hashing import HashCache
+from quickbooks_gui_api.models import Invoice, Element, ELEMENT_CACHE
 
 from quickbooks_gui_api.apis.api_exceptions import ConfigFileNotFound, InvalidPrinter
+from quickbooks_gui_api.managers.manager_exceptions import TextEntryFailed
 
 # Shortened window and dialog names:
 NEW_INVOICE_WINDOW:         Element = Element("Window", "Create Invoices - Accounts Receivable (Editing Transaction...) ",  65280)
@@ -63,8 +65,11 @@ class Invoices:
         self.app    = application
         self.window = window
 
-        self.window_manager = WindowManager()
-        self.file_manager = FileManager()
+        self.window_manager = WindowManager(measure_latency=self.MEASURE_INPUT_LATENCY)
+        self.file_manager = FileManager(
+            hash_algorithm  = self.FILE_HASH_ALGORITHM,
+            hash_cache      = HashCache(Path(self.HASH_CACHE_PATH), max_entries=self.HASH_CACHE_MAX_ENTRIES, logger=self.logger) if self.HASH_CACHE_PATH else None,
+        )
         self.helper = Helper()
             
     def load_config(self, path) -> None:
@@ -92,14 +97,28 @@ class Invoices:
             self.ACCEPTABLE_FILE_AGE:       float   = config["ACCEPTABLE_FILE_AGE"]
             self.VALID_INVOICE_PRINTER:     str     = config["VALID_INVOICE_PRINTER"]
             self.QUICKBOOKS_WINDOW_NAME:    str     = config["QUICKBOOKS_WINDOW_NAME"]
+            self.WATCH_DIALOG_EVENTS:       bool    = config["WATCH_DIALOG_EVENTS"]
+            self.MEASURE_INPUT_LATENCY:     bool    = config["MEASURE_INPUT_LATENCY"]
+            self.LATENCY_EXPORT_PATH:       str     = config["LATENCY_EXPORT_PATH"]
+            self.LOCATOR_STORE_PATH:        str     = config["LOCATOR_STORE_PATH"]
+            self.FILE_QUIET_WINDOW:         float   = config["FILE_QUIET_WINDOW"]
+            self.FILE_HASH_ALGORITHM:       str     = config["FILE_HASH_ALGORITHM"]
+            self.HASH_CACHE_PATH:           str     = config["HASH_CACHE_PATH"]
+            self.HASH_CACHE_MAX_ENTRIES:    int     = config["HASH_CACHE_MAX_ENTRIES"]
             self.HOME_TRIES:                int     = 10
 
+            # Compiled locator paths are only valid for the build they were learned on.
+            ELEMENT_CACHE.locators.configure(
+                self.QUICKBOOKS_WINDOW_NAME,
+                Path(self.LOCATOR_STORE_PATH) if self.LOCATOR_STORE_PATH else None,
+            )
+
         except Exception as e:
             self.logger.error(e)
             raise e
 
     def home(self) -> None:
-        self.window.set_focus()
+        self.window_manager.set_focus(self.window)
       
         for i in range(self.HOME_TRIES):
             titles = self.window_manager.get_all_dialog_titles(self.app)
@@ -109,6 +128,7 @@ class Invoices:
                 top_title = self.window_manager.top_dialog(self.app)
                 try:
                     self.window.child_window(control_type = "Window", title = top_title).close()
+                    self.window_manager.invalidate_snapshot(self.app)
                     self.logger.debug(f"Closed window `{top_title}`. Attempt `{i+1}`/`{self.HOME_TRIES}`.")
                 except Exception:
                     self.logger.exception(f"Error attempting to close targeted window, `{top_title}`")
@@ -117,6 +137,26 @@ class Invoices:
     def save(
         self, 
         invoices: Invoice | list[Invoice],
+    ) -> None:
+        if self.WATCH_DIALOG_EVENTS:
+            self.window_manager.start_watching(self.app)
+        try:
+            self._save(invoices)
+        finally:
+            self.window_manager.stop_watching()
+            if self.file_manager.hash_cache is not None:
+                self.file_manager.hash_cache.save()
+            for key, stats in self.window_manager.latency.summary().items():
+                self.logger.debug(f"Latency `{key}`: {stats}.")
+            if self.MEASURE_INPUT_LATENCY and self.LATENCY_EXPORT_PATH:
+                try:
+                    self.window_manager.latency.export(Path(self.LATENCY_EXPORT_PATH))
+                except OSError as e:
+                    self.logger.warning(f"Unable to export input latency to `{self.LATENCY_EXPORT_PATH}`: {e}")
+
+    def _save(
+        self, 
+        invoices: Invoice | list[Invoice],
         # save_directory: Path,
     ) -> None:
 
@@ -134,32 +174,44 @@ class Invoices:
 
         self.home()
 
-        self.window.set_focus()
-        self.window_manager.send_input(["ctrl", "i"])
+        with self.window_manager.input_lock:
+            self.window_manager.set_focus(self.window)
+            self.window_manager.send_input(["ctrl", "i"])
 
 # --- HELPERS START --------------------------------------------------------------------------
 
         def _find_invoice():
-            self.window.set_focus()
-
-            self.window_manager.send_input(keys=["ctrl", "f"])
+            with self.window_manager.input_lock:
+                self.window_manager.set_focus(self.window)
+                self.window_manager.send_input(keys=["ctrl", "f"])
 
             if self.window_manager.is_element_active(FIND_INVOICE_WINDOW.as_element(self.window), timeout=self.DIALOG_LOAD_DELAY, retry_interval=0.05, attempt_focus=True):
                 self.logger.debug("The find_invoice_dialog was found and determined to be active. Proceeding to enter invoice number...")
 
-                # send the initial navigation inputs
-                self.window_manager.send_input(keys=["tab"], send_count=3)
-
-                remaining_attempts = 10
-                # loop until the field is active or attempts run out
-                while not self.window_manager.is_element_active(INVOICE_NUMBER_FIELD.as_element(self.window), timeout= 0.2, retry_interval=0.05, attempt_focus=True) and remaining_attempts > 0:
-                    self.logger.warning(f"Unable to initially focus on the invoice number field, reattempting. Attempts remaining `{remaining_attempts}`.")
-                    self.window_manager.send_input('tab')
-                    remaining_attempts -= 1
-
-                self.logger.debug("Invoice number field is active, inserting number.")
-                self.window_manager.send_input(string=queue[0].number)
-                FIND_BUTTON.as_element(self.window).click_input()
+                try:
+                    strategy = self.window_manager.enter_text(INVOICE_NUMBER_FIELD.as_element(self.window), queue[0].number)
+                    self.logger.debug(f"Invoice number entered with strategy `{strategy}`.")
+                except TextEntryFailed:
+                    self.logger.warning("Unable to set the invoice number field directly, falling back to tabbing into it.")
+
+                    # Tabbing depends on where focus is, so hold input until the number is typed.
+                    with self.window_manager.input_lock:
+                        self.window_manager.set_focus(FIND_INVOICE_WINDOW.as_element(self.window))
+                        # send the initial navigation inputs
+                        self.window_manager.send_input(keys=["tab"], send_count=3)
+
+                        remaining_attempts = 10
+                        field_active = {"field": self.window_manager.element_condition(INVOICE_NUMBER_FIELD.as_element(self.window), attempt_focus=True)}
+                        # loop until the field is active or attempts run out
+                        while self.window_manager.wait_any(field_active, timeout=0.2) is None and remaining_attempts > 0:
+                            self.logger.warning(f"Unable to initially focus on the invoice number field, reattempting. Attempts remaining `{remaining_attempts}`.")
+                            self.window_manager.send_input('tab')
+                            remaining_attempts -= 1
+
+                        self.logger.debug("Invoice number field is active, inserting number.")
+                        self.window_manager.send_input(string=queue[0].number)
+
+                self.window_manager.press(FIND_BUTTON.as_element(self.window))
             else:
                 error = ValueError(f"Unable to ascertain that the find_invoice_dialog is active in the set interval of DIALOG_LOAD_DELAY = `{self.DIALOG_LOAD_DELAY}`. Current dialog is `{self.window_manager.top_dialog(self.app)}`.")
                 self.logger.error(error)
@@ -167,24 +219,27 @@ class Invoices:
 
         
         def _print_to_pdf():
-            self.window.set_focus()
-            self.window_manager.send_input(keys=["ctrl","p"])
+            with self.window_manager.input_lock:
+                self.window_manager.set_focus(self.window)
+                self.window_manager.send_input(keys=["ctrl","p"])
             
             if self.window_manager.is_element_active(PRINT_INVOICE_WINDOW.as_element(self.window), timeout=self.DIALOG_LOAD_DELAY, retry_interval=0.05, attempt_focus=True):
                 self.logger.debug("The print_invoice_dialog was found and determined to be active. Proceeding to verify and select printer...")
 
-                valid_printer = self.helper.capture_isolate_ocr_match(
+                valid_printer, printer, match_confidence = self.helper.capture_isolate_ocr_match(
                                     PRINT_INVOICE_WINDOW.as_element(self.window),
                                     single_or_multi="single",
                                     color = Color(hex_val="4e9e19"),
                                     target_text= self.VALID_INVOICE_PRINTER,
-                                    match_threshold= self.STRING_MATCH_THRESHOLD
+                                    match_threshold= self.STRING_MATCH_THRESHOLD or None
                                 )
 
                 if valid_printer:
-                    self.window_manager.send_input(keys=["enter"])
+                    with self.window_manager.input_lock:
+                        self.window_manager.set_focus(PRINT_INVOICE_WINDOW.as_element(self.window))
+                        self.window_manager.send_input(keys=["enter"])
                 else:
-                    self.logger.error(InvalidPrinter)
+                    self.logger.error(f"Selected printer `{printer}` does not match `{self.VALID_INVOICE_PRINTER}`. Match confidence is {match_confidence}.")
                     raise InvalidPrinter
             
             else:
@@ -194,15 +249,17 @@ class Invoices:
 
 
         def _save_pdf_file():
-            self.window.set_focus()
+            self.window_manager.set_focus(self.window)
             # save_file_dialog = self.window.child_window(control_type = "Window", title = SAVE_PRINT_AS) # Throws error, multiple windows share title somehow?
             FILE_NAME_FIELD.as_element(self.window)
             
             if self.window_manager.is_element_active(FILE_NAME_FIELD.as_element(self.window), timeout=self.DIALOG_LOAD_DELAY, retry_interval=0.05, attempt_focus=True):
                 # abs_path = save_directory.joinpath(queue[0].file_name)
-                self.window_manager.send_input(['alt','n'])
-                FILE_NAME_FIELD.as_element(self.window).set_text(str(queue[0].export_path()))
-                self.window_manager.send_input(['alt','s'])
+                with self.window_manager.input_lock:
+                    self.window_manager.set_focus(FILE_NAME_FIELD.as_element(self.window))
+                    self.window_manager.send_input(['alt','n'])
+                    self.window_manager.enter_text(FILE_NAME_FIELD.as_element(self.window), str(queue[0].export_path()))
+                    self.window_manager.send_input(['alt','s'])
             else:
                 error = ValueError(f"Unable to ascertain that the save_file_dialog is active in the set interval of DIALOG_LOAD_DELAY = `{self.DIALOG_LOAD_DELAY}`. Current dialog is `{self.window_manager.top_dialog(self.app)}`.")
                 self.logger.error(error)
@@ -216,28 +273,30 @@ class Invoices:
             def focus():
                 self.logger.debug(f"Unwanted dialog detected. `{top_dialog_title}` Accommodating...")
                 unwanted_dialog = self.window.child_window(control_type= "Window", title = top_dialog_title)
-                unwanted_dialog.set_focus()    
+                self.window_manager.set_focus(unwanted_dialog)
 
-            if top_dialog_title == AVAILABLE_CREDITS_POPUP.title:
-                focus()
-                self.window_manager.send_input(keys=['alt', 'n'])
+            # Hold input across focus and keys so the popup suppressor cannot interleave.
+            with self.window_manager.input_lock:
+                if top_dialog_title == AVAILABLE_CREDITS_POPUP.title:
+                    focus()
+                    self.window_manager.send_input(keys=['alt', 'n'])
 
-            elif top_dialog_title == CHANGED_TRANSACTION_POPUP.title:
-                focus()
-                self.window_manager.send_input(keys=['alt', 'n'])
+                elif top_dialog_title == CHANGED_TRANSACTION_POPUP.title:
+                    focus()
+                    self.window_manager.send_input(keys=['alt', 'n'])
 
-            elif top_dialog_title == ESTIMATE_LINKED_POPUP.title:
-                focus()
-                self.window_manager.send_input(keys=['alt', 'n'])
+                elif top_dialog_title == ESTIMATE_LINKED_POPUP.title:
+                    focus()
+                    self.window_manager.send_input(keys=['alt', 'n'])
 
-            elif top_dialog_title == OVERWRITE_FILE_POPUP.title:
-                focus()
-                self.window_manager.send_input(keys=['y'])
+                elif top_dialog_title == OVERWRITE_FILE_POPUP.title:
+                    focus()
+                    self.window_manager.send_input(keys=['y'])
 
-            elif top_dialog_title == DATE_LOCKED_WINDOW.title:
-                focus()
-                self.window_manager.send_input(keys=['esc'])
-                REVERT_BUTTON.as_element(self.window).click_input()
+                elif top_dialog_title == DATE_LOCKED_WINDOW.title:
+                    focus()
+                    self.window_manager.send_input(keys=['esc'])
+                    self.window_manager.press(REVERT_BUTTON.as_element(self.window))
 
 # --- HELPERS END --------------------------------------------------------------------------
 
@@ -246,16 +305,18 @@ class Invoices:
         loop_start = datetime.now()
         while len(queue) != 0:      
             self.logger.info(f"Now saving invoice `{((number_of_invoices-len(queue)) + 1)}`/`{ number_of_invoices}`...")
-            self.window.set_focus()
+            self.window_manager.set_focus(self.window)
             
             save_path = queue[0].export_path() 
             pre_existing_file = save_path.exists()
+            pre_existing_stat = save_path.stat() if pre_existing_file else None
 
             if pre_existing_file:
                 pre_existing_file_hash = self.file_manager.hash_file(save_path)
 
             start = datetime.now()
-            if self.window_manager.top_dialog(self.app) == NEW_INVOICE_WINDOW.title or self.window_manager.top_dialog(self.app) == VIEWING_INVOICE_WINDOW.title:
+            top_dialog_title = self.window_manager.top_dialog(self.app)
+            if top_dialog_title == NEW_INVOICE_WINDOW.title or top_dialog_title == VIEWING_INVOICE_WINDOW.title:
                 _find_invoice()
                 _handle_unwanted_dialog()
 
@@ -264,7 +325,7 @@ class Invoices:
                 _handle_unwanted_dialog()
             
 
-            if  self.window_manager.top_dialog(self.app) == SAVE_PRINT_AS_WINDOW.title:
+            if self.window_manager.top_dialog(self.app) == SAVE_PRINT_AS_WINDOW.title:
                 _save_pdf_file()
                 _handle_unwanted_dialog()
 
@@ -273,8 +334,14 @@ class Invoices:
             if self.file_manager.wait_for_file(save_path, self.MAX_INVOICE_SAVE_TIME):
                 time.sleep(0.15) # Annoyingly necessary delay. Break without it.
                 self.logger.debug(f"The report file, `{save_path.name}`, exists.")
-                self.file_manager.wait_till_stable(save_path, self.MAX_INVOICE_SAVE_TIME)
-                self.logger.debug(f"The report file, `{save_path.name}`, is stable.")
+                self.file_manager.wait_till_complete(
+                    save_path,
+                    self.MAX_INVOICE_SAVE_TIME,
+                    previous        = pre_existing_stat,
+                    quiet_window    = self.FILE_QUIET_WINDOW,
+                    expected_size   = pre_existing_stat.st_size if pre_existing_stat else None,
+                )
+                self.logger.debug(f"The report file, `{save_path.name}`, is complete.")
                
                 if pre_existing_file:
                     self.logger.warning(f"The file `{save_path.name}` existed before the report was saved. Comparing the file hashes and inspecting 'last modified' time...")
@@ -2,14 +2,16 @@
 import logging
 import pytomlpp
 
-from typing     import Any
+from typing     import Any, Iterable
 from datetime   import datetime
 from pathlib    import Path
 from pywinauto  import Application, WindowSpecification
 
-from quickbooks_gui_api.managers            import WindowManager, FileManager
-from quickbooks_gui_api.models              import Report, Element
-from quickbooks_gui_api.apis.api_exceptions import ConfigFileNotFound
+from quickbooks_gui_api.managers            import WindowManager, FileManager, StringManager
+from quickbooks_gui_api.managers.hashing    import HashCache
+from quickbooks_gui_api.managers.file       import StabilityProgress
+from quickbooks_gui_api.models              import Report, Element, ELEMENT_CACHE
+from quickbooks_gui_api.apis.api_exceptions import ConfigFileNotFound, ReportNameUnresolved
 
 
 # Shortened window and dialog names:
@@ -28,6 +30,9 @@ HAVE_ANY_QUESTIONS          = Element("Window", None,
 NEW_FEATURE                 = Element("Pane",  "QB WPF Host",                                   None)
 QUICKBOOKS_PAYMENTS         = Element("Window",'QuickBooks Payments',                           None)
 
+# Control types of the rows of the memorized report list.
+REPORT_LIST_ITEM_TYPES      = ("ListItem", "TreeItem", "DataItem")
+
 
 
 
@@ -44,7 +49,8 @@ class Reports:
             application: Application,
             window: WindowSpecification,
             config_path: Path | None = Path(r"configs\config.toml"),
-            logger: Any = logging.getLogger(__name__)
+            logger: Any = logging.getLogger(__name__),
+            report_catalog: Iterable[str] | None = None,
             ) -> None:
         self.logger = logger 
             
@@ -61,11 +67,19 @@ class Reports:
         self.window = window
 
         # self.img_man = ImageManager() 
-        # self.str_man = StringManager()
         # self.ocr_man = OCRManager()
         # self.helper = Helper()
-        self.window_manager = WindowManager()
-        self.file_manager    = FileManager()
+        self.window_manager = WindowManager(measure_latency=self.MEASURE_INPUT_LATENCY)
+        self.file_manager    = FileManager(
+            hash_algorithm  = self.FILE_HASH_ALGORITHM,
+            hash_cache      = HashCache(Path(self.HASH_CACHE_PATH), max_entries=self.HASH_CACHE_MAX_ENTRIES, logger=self.logger) if self.HASH_CACHE_PATH else None,
+        )
+        self.string_manager  = StringManager()
+
+        # Known memorized report names. When populated, every requested name is
+        # resolved against it before any keystroke is sent. Without a catalog from
+        # the caller or `REPORT_CATALOG`, it is read from the memorized report list.
+        self.report_index    = self.string_manager.build_index(report_catalog or self.REPORT_CATALOG)
             
     def load_config(self, path) -> None:
         if path is None:
@@ -89,9 +103,25 @@ class Reports:
             self.MAX_REPORT_SAVE_TIME:      float   = config["MAX_REPORT_SAVE_TIME"]
             self.QUICKBOOKS_WINDOW_NAME:    str     = config["QUICKBOOKS_WINDOW_NAME"]
             self.ACCEPTABLE_FILE_AGE:       float   = config["ACCEPTABLE_FILE_AGE"]
+            self.WATCH_DIALOG_EVENTS:       bool    = config["WATCH_DIALOG_EVENTS"]
+            self.MEASURE_INPUT_LATENCY:     bool    = config["MEASURE_INPUT_LATENCY"]
+            self.LATENCY_EXPORT_PATH:       str     = config["LATENCY_EXPORT_PATH"]
+            self.LOCATOR_STORE_PATH:        str     = config["LOCATOR_STORE_PATH"]
+            self.FILE_QUIET_WINDOW:         float   = config["FILE_QUIET_WINDOW"]
+            self.FILE_HASH_ALGORITHM:       str     = config["FILE_HASH_ALGORITHM"]
+            self.HASH_CACHE_PATH:           str     = config["HASH_CACHE_PATH"]
+            self.HASH_CACHE_MAX_ENTRIES:    int     = config["HASH_CACHE_MAX_ENTRIES"]
             self.HOME_TRIES:                int     = 10
 
             self.REPORT_NAME_MATCH_THRESHOLD: float   = config["REPORT_NAME_MATCH_THRESHOLD"]
+            self.REPORT_NAME_AMBIGUITY_MARGIN: float  = config["REPORT_NAME_AMBIGUITY_MARGIN"]
+            self.REPORT_CATALOG:            list[str] = config["REPORT_CATALOG"]
+
+            # Compiled locator paths are only valid for the build they were learned on.
+            ELEMENT_CACHE.locators.configure(
+                self.QUICKBOOKS_WINDOW_NAME,
+                Path(self.LOCATOR_STORE_PATH) if self.LOCATOR_STORE_PATH else None,
+            )
 
         except Exception as e:
             self.logger.error(e)
@@ -100,27 +130,90 @@ class Reports:
     def _handle_global_popups(self):
         all_titles = self.window_manager.get_all_dialog_titles(self.app)
 
-        if HAVE_ANY_QUESTIONS.title in all_titles:
-            self.logger.debug(f"Unwanted dialog detected. `{HAVE_ANY_QUESTIONS.title}` Closing...")
+        # Untitled, so it can only be found by its automation id.
+        if HAVE_ANY_QUESTIONS.as_element(self.window).exists(timeout=0):
+            self.logger.debug(f"Unwanted dialog detected. `{HAVE_ANY_QUESTIONS.auto_id}` Closing...")
             HAVE_ANY_QUESTIONS.as_element(self.window).close()
+            self.window_manager.invalidate_snapshot(self.app)
 
         if NEW_FEATURE.title in all_titles:
             self.logger.debug(f"Unwanted dialog detected. `{NEW_FEATURE.title}` Closing...")
-            NEW_FEATURE.as_element(self.window).set_focus()
-            self.window_manager.send_input('enter')
+            with self.window_manager.input_lock:
+                self.window_manager.set_focus(NEW_FEATURE.as_element(self.window))
+                self.window_manager.send_input('enter')
 
         if QUICKBOOKS_PAYMENTS.title in all_titles:
             self.logger.debug(f"Unwanted dialog detected. `{QUICKBOOKS_PAYMENTS.title}` Closing...")
-            QUICKBOOKS_PAYMENTS.as_element(self.window).set_focus()
-            self.window_manager.send_input('esc')
+            with self.window_manager.input_lock:
+                self.window_manager.set_focus(QUICKBOOKS_PAYMENTS.as_element(self.window))
+                self.window_manager.send_input('esc')
+
+    def read_report_catalog(self) -> int:
+        """
+        Indexes the report names shown in the open memorized report list, unless a
+        catalog is already loaded. A list that cannot be read leaves the index empty,
+        so names are used as given.
+
+        :returns: The number of indexed report names.
+        :rtype: int
+        """
+        if len(self.report_index) > 0:
+            return len(self.report_index)
+
+        try:
+            report_list = MEMORIZED_REPORTS_WINDOW.as_element(self.window)
+            names = {
+                item.window_text().strip()
+                for item in report_list.descendants()
+                if item.element_info.control_type in REPORT_LIST_ITEM_TYPES
+            }
+        except Exception:
+            self.logger.exception("Unable to read the memorized report list. Report names will be used as given.")
+            return 0
+
+        for name in names:
+            if name:
+                self.report_index.add(name)
+        self.logger.debug(f"Indexed `{len(self.report_index)}` memorized report names.")
+        return len(self.report_index)
+
+    def resolve_report_name(self, name: str) -> str:
+        """
+        Resolves `name` against the known memorized report catalog.
+
+        :param name: The requested report name.
+        :type  name: str
+        :returns: The catalog entry `name` resolves to, or `name` unchanged if no catalog is loaded.
+        :rtype: str
+        :raises ReportNameUnresolved: If no entry is confident enough or the runner-up is too close.
+        """
+        if len(self.report_index) == 0:
+            return name
+
+        result = self.report_index.lookup(name)
+
+        if result.best is None or result.best.confidence < self.REPORT_NAME_MATCH_THRESHOLD:
+            error = ReportNameUnresolved(name, f"Best candidate `{result.best}` is below REPORT_NAME_MATCH_THRESHOLD = `{self.REPORT_NAME_MATCH_THRESHOLD}`.")
+            self.logger.error(error)
+            raise error
+
+        if not result.is_unambiguous(self.REPORT_NAME_MATCH_THRESHOLD, self.REPORT_NAME_AMBIGUITY_MARGIN):
+            error = ReportNameUnresolved(name, f"Candidates `{result.best}` and `{result.runner_up}` are within REPORT_NAME_AMBIGUITY_MARGIN = `{self.REPORT_NAME_AMBIGUITY_MARGIN}`.")
+            self.logger.error(error)
+            raise error
+
+        if result.best.entry != name:
+            self.logger.debug(f"Resolved report name `{name}` to `{result.best.entry}` with a confidence of `{result.best.confidence}`.")
+        return result.best.entry
 
     def home(self, true_home: bool = False) -> None:
-        self.window.set_focus()
+        self.window_manager.set_focus(self.window)
         
         def attempt_close(i: int):
             top_title = self.window_manager.top_dialog(self.app)
             try:
                 self.window.child_window(control_type = "Window", title = top_title).close()
+                self.window_manager.invalidate_snapshot(self.app)
                 self.logger.debug(f"Closed window `{top_title}`. Attempt `{i+1}`/`{self.HOME_TRIES}`.")
             except Exception:
                 self.logger.exception(f"Error attempting to close targeted window, `{top_title}`")
@@ -167,6 +260,26 @@ class Reports:
     def save(
         self, 
         reports: Report | list[Report],
+    ) -> None:
+        if self.WATCH_DIALOG_EVENTS:
+            self.window_manager.start_watching(self.app)
+        try:
+            self._save(reports)
+        finally:
+            self.window_manager.stop_watching()
+            if self.file_manager.hash_cache is not None:
+                self.file_manager.hash_cache.save()
+            for key, stats in self.window_manager.latency.summary().items():
+                self.logger.debug(f"Latency `{key}`: {stats}.")
+            if self.MEASURE_INPUT_LATENCY and self.LATENCY_EXPORT_PATH:
+                try:
+                    self.window_manager.latency.export(Path(self.LATENCY_EXPORT_PATH))
+                except OSError as e:
+                    self.logger.warning(f"Unable to export input latency to `{self.LATENCY_EXPORT_PATH}`: {e}")
+
+    def _save(
+        self, 
+        reports: Report | list[Report],
         # save_directory: Path,
     ) -> None:
 
@@ -185,26 +298,30 @@ class Reports:
         self._handle_global_popups()
         self.home(True)
 
-        self.window.set_focus()
+        self.window_manager.set_focus(self.window)
 
 # --- HELPERS START --------------------------------------------------------------------------
 
         def _memorized_reports():
-            self.window.set_focus()
-            self.window_manager.send_input(['alt', 'R'])
-            self.window_manager.send_input('z')
-            self.window_manager.send_input('enter')
+            # Menu navigation; a popup taking focus midway would swallow the keys.
+            with self.window_manager.input_lock:
+                self.window_manager.set_focus(self.window)
+                self.window_manager.send_input(['alt', 'R'])
+                self.window_manager.send_input('z')
+                self.window_manager.send_input('enter')
         
         def _find_report():
-            self.window.set_focus()
+            self.window_manager.set_focus(self.window)
 
-            report_name = queue[0].name
+            self.read_report_catalog()
+            report_name = self.resolve_report_name(queue[0].name)
 
             if report_name in self.window_manager.get_all_dialog_titles(self.app):
                 self.logger.warning(f"The report `{report_name}` is already open, calling home function to close everything...")
                 self.home(True)
             
-            self.window_manager.send_input(string=report_name, char_at_a_time=True)
+            # The report list selects by type-ahead, so the name is typed, but as a single batched input.
+            self.window_manager.send_input(string=report_name)
 
             self.window_manager.send_input(["alt","s"])
 
@@ -216,35 +333,40 @@ class Reports:
                 )
 
         def _save_as_new_worksheet():
-            self.window.set_focus()
-            EXCEL_BUTTON.as_element(self.window).click_input()
+            self.window_manager.set_focus(self.window)
+            self.window_manager.press(EXCEL_BUTTON.as_element(self.window), opens_modal=True)
             self.window_manager.send_input('n')
 
         def _save_as_csv():
-            self.window.set_focus()
-            AS_CSV_BUTTON.as_element(self.window).click_input()
+            self.window_manager.set_focus(self.window)
+            self.window_manager.press(AS_CSV_BUTTON.as_element(self.window), opens_modal=True)
             self.window_manager.send_input(['alt', 'x'])
 
         def _save_file(path: Path):
-            self.window.set_focus()
-            FILE_NAME_FIELD.as_element(self.window).set_text(str(path))
+            self.window_manager.set_focus(self.window)
+            self.window_manager.enter_text(FILE_NAME_FIELD.as_element(self.window), str(path))
             self.window_manager.send_input(keys='enter') 
 
         def _handle_unwanted_dialog():
-            self.window.set_focus()
+            self.window_manager.set_focus(self.window)
             top_dialog_title = self.window_manager.top_dialog(self.app)
 
             def focus():
                 self.logger.debug(f"Unwanted dialog detected. `{top_dialog_title}` Accommodating...")
                 unwanted_dialog = self.window.child_window(control_type= "Window", title = top_dialog_title)
-                unwanted_dialog.set_focus()
+                self.window_manager.set_focus(unwanted_dialog)
 
             if top_dialog_title == CONFIRM_SAVE_AS.title:
-                focus()
-                self.window_manager.send_input(keys=['y'])
+                with self.window_manager.input_lock:
+                    focus()
+                    self.window_manager.send_input(keys=['y'])
 
             self._handle_global_popups()
 
+        def _report_progress(progress: StabilityProgress):
+            eta = f", about `{progress.eta:.0f}`s left" if progress.eta is not None else ""
+            self.logger.info(f"`{progress.path.name}`: `{progress.size / 2**20:.1f}` MiB written at `{progress.rate / 2**20:.2f}` MiB/s{eta}.")
+
 # --- HELPERS END --------------------------------------------------------------------------
         
         pre_existing_file_hash: str = ""
@@ -256,6 +378,7 @@ class Reports:
 
             save_path = queue[0].export_path() 
             pre_existing_file = save_path.exists()
+            pre_existing_stat = save_path.stat() if pre_existing_file else None
 
             if pre_existing_file:
                 pre_existing_file_hash = self.file_manager.hash_file(save_path)
@@ -268,17 +391,27 @@ class Reports:
             else:
                 _memorized_reports()
 
-            if self.window_manager.is_element_active(EXCEL_BUTTON.as_element(self.window), timeout=self.WINDOW_LOAD_DELAY):
+            # Each export step can land on any later step, so wait on all of them at once.
+            stages = {
+                "excel":        self.window_manager.element_condition(EXCEL_BUTTON.as_element(self.window)),
+                "csv":          self.window_manager.element_condition(AS_CSV_BUTTON.as_element(self.window)),
+                "file_name":    self.window_manager.element_condition(FILE_NAME_FIELD.as_element(self.window)),
+            }
+            stage = self.window_manager.wait_any(stages, self.WINDOW_LOAD_DELAY)
+
+            if stage == "excel":
                 self.logger.debug("Selected report is detected and focused...")
                 _save_as_new_worksheet()
                 _handle_unwanted_dialog()
+                stage = self.window_manager.wait_any({key: stages[key] for key in ("csv", "file_name")}, self.WINDOW_LOAD_DELAY)
             
-            if self.window_manager.is_element_active(AS_CSV_BUTTON.as_element(self.window), timeout=self.WINDOW_LOAD_DELAY):
+            if stage == "csv":
                 self.logger.debug(f"`{AS_CSV_BUTTON.title}` Button is detected and focused...")
                 _save_as_csv()
                 _handle_unwanted_dialog()
+                stage = self.window_manager.wait_any({"file_name": stages["file_name"]}, self.WINDOW_LOAD_DELAY)
 
-            if self.window_manager.is_element_active(FILE_NAME_FIELD.as_element(self.window), timeout=self.WINDOW_LOAD_DELAY):
+            if stage == "file_name":
                 self.logger.debug(f"`{SAVE_FILE_AS_WINDOW.title}` Window is detected and focused...")
                 _save_file(save_path)
                 _handle_unwanted_dialog()
@@ -287,8 +420,15 @@ class Reports:
 
             if self.file_manager.wait_for_file(save_path, self.MAX_REPORT_SAVE_TIME):
                 self.logger.debug(f"The report file, `{save_path.name}`, exists.")
-                self.file_manager.wait_till_stable(save_path, self.MAX_REPORT_SAVE_TIME)
-                self.logger.debug(f"The report file, `{save_path.name}`, is stable.")
+                self.file_manager.wait_till_complete(
+                    save_path,
+                    self.MAX_REPORT_SAVE_TIME,
+                    previous        = pre_existing_stat,
+                    quiet_window    = self.FILE_QUIET_WINDOW,
+                    expected_size   = pre_existing_stat.st_size if pre_existing_stat else None,
+                    progress        = _report_progress,
+                )
+                self.logger.debug(f"The report file, `{save_path.name}`, is complete.")
                 
                 if pre_existing_file:
                     self.logger.warning(f"The file `{save_path.name}` existed before the report was saved. Comparing the file hashes and inspecting 'last modified' time...")
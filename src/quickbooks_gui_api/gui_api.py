@@ -11,12 +11,19 @@ from pathlib    import Path
 from typing     import Final, Any
 from pywinauto  import Application, WindowSpecification, findwindows, timings, win32functions, win32defines
 
-from quickbooks_gui_api.models      import Invoice, Report, Element
+from quickbooks_gui_api.models      import Invoice, Report, Element, ELEMENT_CACHE
 from quickbooks_gui_api.managers    import Color, ProcessManager, WindowManager, StringManager, Helper
+from quickbooks_gui_api.managers.processes import ProcessProfile
+from quickbooks_gui_api.managers.popups import PopupRule, PopupSuppressor
+from quickbooks_gui_api.managers.readiness import ReadinessGate, company_file_loaded
+from quickbooks_gui_api.managers.monitor import ResourceMonitor, RecyclePolicy, RecycleAdvice
+from quickbooks_gui_api.managers.desktop import select_top_dialog
 
 
 COMPANY_NOT_LOADED: Final[str] = "No QuickBooks Company Loaded"
 LOGIN:              Final[str] = "QuickBooks Desktop Login"
+MULTI_USER_INFO:    Final[str] = "QuickBooks Desktop Information"
+UPDATE_SERVICE:     Final[str] = "QuickBooks Update Service"
 
 cwd = Path(os.getcwd())
 
@@ -27,8 +34,15 @@ DEFAULT_CONFIG_FILE_NAME:           Final[str]  = "config.toml"
 COMPANY_FILE_WINDOW:    Element = Element("Window",     "No QuickBooks Company Loaded",     65280)
 USERNAME_FIELD:         Element = Element("Edit",       None,                               15922)
 PASSWORD_FIELD:         Element = Element("Edit",       None,                               15924)
-MULTI_USER_FILE:        Element = Element("Window",     "QuickBooks Desktop Information",   None)
-SERVICE_UPDATE:         Element = Element("Window",     "QuickBooks Update Service",        None)
+MULTI_USER_FILE:        Element = Element("Window",     MULTI_USER_INFO,                    None)
+SERVICE_UPDATE:         Element = Element("Window",     UPDATE_SERVICE,                     None)
+
+KNOWN_DIALOGS:          list[str] = [
+                                     COMPANY_NOT_LOADED,
+                                     LOGIN,
+                                     MULTI_USER_INFO,
+                                     UPDATE_SERVICE,
+                                    ]
 
 QUICKBOOKS_PROCESSES:   list[str] = [
                                      "QBW.EXE", 
@@ -55,8 +69,17 @@ class QuickBookGUIAPI:
         self.window_manager = WindowManager()
         self.helper = Helper()
 
+        self.title_matcher = self.string_manager.title_matcher(KNOWN_DIALOGS, 95.0)
+        # The configured start, company and login delays are ceilings for these probes.
+        self.readiness = ReadinessGate(logger=self.logger)
+
         self.app:       Application
         self.window:    WindowSpecification
+
+        self.popup_suppressor: PopupSuppressor | None = None
+        self.resource_monitor: ResourceMonitor | None = None
+        self.recycle_policy:   RecyclePolicy | None = None
+        self._startup_args:    tuple[str, str, Path, str, bool] | None = None
     
     def _load_config_basic(self,
             config_directory: Path, 
@@ -73,6 +96,24 @@ class QuickBookGUIAPI:
             self.process_start_delay        = config["QuickBooksGUIAPI"]["PROCESS_START_DELAY"]
             self.company_file_load_delay    = config["QuickBooksGUIAPI"]["COMPANY_FILE_LOAD_DELAY"]            
             self.login_delay                = config["QuickBooksGUIAPI"]["LOGIN_DELAY"]
+            self.suppress_popups            = config["QuickBooksGUIAPI"]["SUPPRESS_POPUPS"]
+            self.nuisance_popups            = PopupRule.from_config(config["QuickBooksGUIAPI"]["NUISANCE_POPUPS"])
+            self.popup_poll_interval        = config["QuickBooksGUIAPI"]["POPUP_POLL_INTERVAL"]
+            self.window_load_delay          = config["QuickBooksGUIAPI"]["WINDOW_LOAD_DELAY"]
+            self.quickbooks_profile         = ProcessProfile.from_config(config["QuickBooksGUIAPI"]["QUICKBOOKS_PROFILE"])
+            self.background_profile         = ProcessProfile.from_config(config["QuickBooksGUIAPI"]["BACKGROUND_PROFILE"])
+            self.automation_profile         = ProcessProfile.from_config(config["QuickBooksGUIAPI"]["AUTOMATION_PROFILE"])
+            self.warm_lead_time             = config["QuickBooksGUIAPI"]["WARM_START_LEAD_TIME"]
+            self.warm_idle_timeout          = config["QuickBooksGUIAPI"]["WARM_START_IDLE_TIMEOUT"]
+            self.warm_health_interval       = config["QuickBooksGUIAPI"]["WARM_START_HEALTH_INTERVAL"]
+            self.monitor_interval           = config["QuickBooksGUIAPI"]["MONITOR_INTERVAL"]
+            self.auto_recycle               = config["QuickBooksGUIAPI"]["AUTO_RECYCLE"]
+            # A threshold of 0 disables it.
+            self.recycle_policy             = RecyclePolicy(
+                max_rss         = int(config["QuickBooksGUIAPI"]["RECYCLE_MAX_RSS_MB"] * 2**20) or None,
+                max_handles     = config["QuickBooksGUIAPI"]["RECYCLE_MAX_HANDLES"] or None,
+                max_slowdown    = config["QuickBooksGUIAPI"]["RECYCLE_MAX_SLOWDOWN"] or None,
+            )
         except KeyError:
             e = KeyError("KeyError Raised when attempting to retrieve `QuickBooksGUIAPI` config data. There is a problem with the config file.")
             self.logger.error(e)
@@ -87,7 +128,7 @@ class QuickBookGUIAPI:
             self.logger.debug("QuickBook was not running. Attempting to start...")
             try:
                 self.process_manager.start(path = Path(self.exe_path))
-                time.sleep(self.process_start_delay)
+                self.readiness.wait("QuickBooks started", self._main_window_ready, self.process_start_delay)
                 if self.process_manager.is_running(path = Path(self.exe_path)):
                     self.logger.debug("Attempt successful.")
                     return True
@@ -102,24 +143,156 @@ class QuickBookGUIAPI:
             return True
 
 
+    def _main_window_ready(self) -> bool:
+        """Probe: the main window exists and its thread answers messages."""
+        pid = self.process_manager.find_pid(path=Path(self.exe_path))
+        if pid is None:
+            return False
+        backend = self.window_manager.window_backend
+        main, _ = select_top_dialog(backend.list_windows(pid))
+        return main is not None and backend.responds(main.handle)
+
+    def _company_list_ready(self) -> bool:
+        """Probe: the company selection window lists at least one company."""
+        # The list rows are not windows, so this needs the full tree.
+        snapshot = self.window_manager.snapshot(self.app, max_age=0, scope="full")
+        for dialog in snapshot.find(lambda node: node.is_dialog and self.title_matcher.matches(node.name, COMPANY_NOT_LOADED)):
+            if any(node.control_type in ("ListItem", "DataItem") for node in dialog.walk()):
+                return True
+        return False
+
+    def _company_loaded(self) -> bool:
+        """Probe: the company file's login dialog is up, or the main title names the company."""
+        self.window_manager.invalidate_snapshot(self.app)
+        return company_file_loaded(
+            self.window_manager.get_all_dialog_titles(self.app),
+            self.company_file_name,
+            lambda title: self.title_matcher.matches(title, LOGIN),
+        )
+
+    def _login_complete(self) -> bool:
+        """Probe: the login dialog is gone and the main title names the company."""
+        self.window_manager.invalidate_snapshot(self.app)
+        titles = self.window_manager.get_all_dialog_titles(self.app)
+        if not titles or self.title_matcher.any_matches(titles, LOGIN):
+            return False
+        return self.company_file_name.lower() in titles[0].lower()
+
+    def is_healthy(self) -> bool:
+        """
+        Checks that QuickBooks is running, responsive and still logged in to the company.
+
+        :rtype: bool
+        """
+        try:
+            return self._main_window_ready() and self._login_complete()
+        except Exception as e:
+            self.logger.debug(f"Health check failed: {e}")
+            return False
+
     def _handle_startup_popups(self, app: Application) -> None:
         dialog_titles = self.window_manager.get_all_dialog_titles(app)
         
-        if SERVICE_UPDATE.title in dialog_titles:
+        # Dialogs that are answered with key presses are matched exactly, so a similarly
+        # titled dialog never receives the keys.
+        if UPDATE_SERVICE in dialog_titles:
             self.logger.debug(f"Unwanted dialog detected. `{SERVICE_UPDATE.title}` Accommodating...")
             self.window_manager.send_input('enter')
 
     def _focus_popup(self, title: str):
         self.logger.debug(f"Unwanted dialog detected. `{title}` Accommodating...")
         unwanted_dialog = self.window.child_window(control_type= "Window", title = title)
-        unwanted_dialog.set_focus()
+        self.window_manager.set_focus(unwanted_dialog)
 
     def _handle_running_popups(self):
         top_dialog_title = self.window_manager.top_dialog(self.app)
 
-        if top_dialog_title == MULTI_USER_FILE.title:
-            self._focus_popup(top_dialog_title)
-            self.window_manager.send_input(keys=['alt', 'n'])
+        if top_dialog_title == MULTI_USER_INFO:
+            with self.window_manager.input_lock:
+                self._focus_popup(top_dialog_title)
+                self.window_manager.send_input(keys=['alt', 'n'])
+
+    def _start_popup_suppressor(self, app: Application) -> None:
+        if not self.suppress_popups or self.popup_suppressor is not None:
+            return
+        self.popup_suppressor = PopupSuppressor(
+            self.window_manager,
+            app.process,
+            self.nuisance_popups,
+            poll_interval   = self.popup_poll_interval,
+            stall_cost      = self.window_load_delay,
+            logger          = self.logger,
+        )
+        self.popup_suppressor.start()
+
+    def _stop_popup_suppressor(self) -> None:
+        if self.popup_suppressor is not None:
+            self.popup_suppressor.stop()
+            self.logger.info(f"Popup suppressor: {self.popup_suppressor.stats()}")
+            self.popup_suppressor = None
+
+    def _apply_process_profiles(self) -> None:
+        """
+        Applies the configured priority and affinity profiles. QuickBooks' own helper
+        processes and AvaTax take the background profile.
+        """
+        self.process_manager.set_profile(self.quickbooks_profile, paths=[Path(self.exe_path)])
+        self.process_manager.set_profile(self.automation_profile, pids=[os.getpid()])
+
+        main_exe = Path(self.exe_path).name.lower()
+        background = [name for name in QUICKBOOKS_PROCESSES + AVATAX_PROCESSES if name.lower() != main_exe]
+        self.process_manager.set_profile(self.background_profile, names=background)
+
+    def _start_resource_monitor(self) -> None:
+        if self.resource_monitor is None:
+            self.resource_monitor = self.process_manager.monitor(
+                paths       = [Path(self.exe_path)],
+                interval    = self.monitor_interval,
+            )
+
+    def _stop_resource_monitor(self) -> None:
+        if self.resource_monitor is not None:
+            self.resource_monitor.stop()
+            self.logger.info(f"QuickBooks resource usage at shutdown: {self.resource_monitor.latest()}")
+            self.resource_monitor = None
+
+    def recycle_advice(self) -> RecycleAdvice:
+        """
+        Checks the latest resource sample and job throughput against the recycle policy.
+        Samples are only read here; taking one would reset the monitor's CPU counters
+        from this thread.
+
+        :returns: Whether QuickBooks should be restarted before the next job, and why.
+        :rtype: RecycleAdvice
+        """
+        if self.recycle_policy is None or self.resource_monitor is None:
+            return RecycleAdvice(False)
+        return self.recycle_policy.evaluate(self.resource_monitor.latest())
+
+    def recycle(self) -> tuple[Application, WindowSpecification]:
+        """
+        Restarts QuickBooks with the arguments of the last `startup`.
+
+        :raises RuntimeError: If `startup` has not been called.
+        """
+        if self._startup_args is None:
+            raise RuntimeError("QuickBooks cannot be recycled before `startup` has been called.")
+        self.logger.info("Recycling QuickBooks...")
+        self.shutdown()
+        return self.startup(*self._startup_args)
+
+    def _after_job(self, kind: str, items: int, elapsed: float) -> None:
+        if self.recycle_policy is not None:
+            self.recycle_policy.record_job(items, elapsed, kind)
+
+        advice = self.recycle_advice()
+        if not advice.recycle:
+            return
+        if self.auto_recycle:
+            self.logger.info(f"Recycling QuickBooks between jobs: {'; '.join(advice.reasons)}.")
+            self.recycle()
+        else:
+            self.logger.warning(f"Restarting QuickBooks is recommended: {'; '.join(advice.reasons)}.")
 
     def _kill_avatax(self) -> None:
         self._terminate_processes(AVATAX_PROCESSES)
@@ -127,7 +300,12 @@ class QuickBookGUIAPI:
     def _connect_to_app(self) -> tuple[Application, WindowSpecification]:
         self.logger.debug("Attempting to connect pywinauto to application...")
         try:
-            self.app = Application(backend='uia').connect(path=self.exe_path)
+            # Connecting by PID skips pywinauto's own scan of every process.
+            pid = self.process_manager.find_pid(path=Path(self.exe_path))
+            if pid is not None:
+                self.app = Application(backend='uia').connect(process=pid)
+            else:
+                self.app = Application(backend='uia').connect(path=self.exe_path)
             self.window = self.app.window(title_re=".*QuickBooks.*")
         except Exception:
             self.logger.exception
@@ -138,9 +316,10 @@ class QuickBookGUIAPI:
     
     def _select_company_file(self, window: WindowSpecification) -> None:
         self.logger.debug("Company file selection step detected...")
-        window.set_focus()
+        self.window_manager.set_focus(window)
 
         company_file_window = window.child_window(title = "No QuickBooks Company Loaded", auto_id = "65280")
+        self.readiness.wait("Company list populated", self._company_list_ready, self.company_file_load_delay)
 
         
 
@@ -151,13 +330,12 @@ class QuickBookGUIAPI:
                                                                     tolerance= 5.0, 
                                                                     min_area= 5000, 
                                                                     target_text=self.company_file_name, 
-                                                                    match_threshold= 90.0
                                                                 )
 
         if correct_company:
             self.logger.debug(f"ORC'd selected company `{selected_company}` file sufficiently matches target `{self.company_file_name}`.")
             self.window_manager.send_input("enter")
-            time.sleep(self.company_file_load_delay)
+            self.readiness.wait("Company file loaded", self._company_loaded, self.company_file_load_delay)
         else:
             self.logger.error(f"Unrecognized company file `{selected_company}` currently selected. Match confidence is {match_confidence} with target `{self.company_file_name}`.")
             raise ValueError
@@ -165,28 +343,35 @@ class QuickBookGUIAPI:
     def _login(self, window: WindowSpecification, username: str, password: str) -> None:
             self.logger.debug("User login step detected...")
         
-            window.set_focus()
-            self.window_manager.send_input(["alt","u"])
-            self.helper.safely_set_text(username, root=window, control_type = "Edit", auto_id = "15922") # type: ignore
+            # Hold input for the whole sequence so the popup suppressor cannot steal focus mid-login.
+            with self.window_manager.input_lock:
+                self.window_manager.set_focus(window)
+                self.window_manager.send_input(["alt","u"])
+                self.helper.safely_set_text(username, root=window, control_type = "Edit", auto_id = "15922") # type: ignore
 
 
 
-            self.window_manager.send_input(["alt","p"])
-            self.helper.safely_set_text(password, root=window, control_type = "Edit", auto_id = "15924") # type: ignore
-            
-            self.window_manager.send_input("enter")
+                self.window_manager.send_input(["alt","p"])
+                self.helper.safely_set_text(password, root=window, control_type = "Edit", auto_id = "15924") # type: ignore
+                
+                self.window_manager.send_input("enter")
 
             self._handle_running_popups()
-            time.sleep(self.login_delay)
+            self.readiness.wait("Login complete", self._login_complete, self.login_delay)
 
 
     def _terminate_processes(self, processes: list[str]) -> None:
-        for process in processes:
-            try:
-                self.process_manager.terminate(name= process)
-            except Exception:
-                self.logger.exception(f"Error occurred while attempting to terminate the following process: `{process}`.")
-                continue
+        try:
+            outcomes = self.process_manager.terminate_all(names=processes)
+        except Exception:
+            self.logger.exception(f"Error occurred while attempting to terminate the following processes: `{processes}`.")
+            return
+
+        for outcome in outcomes:
+            if outcome.result in ("denied", "survived"):
+                self.logger.warning(f"Process `{outcome.name}` (PID {outcome.pid}) could not be terminated: `{outcome.result}`.")
+            else:
+                self.logger.debug(f"Process `{outcome.name}` (PID {outcome.pid}): `{outcome.result}`.")
        
         self.logger.info("All provided processes have been terminated.")
 
@@ -200,11 +385,14 @@ class QuickBookGUIAPI:
         self.logger.info("Entering startup routine...")
 
         config = self._load_config_basic(config_directory, config_file_name)
+        self._startup_args = (username, password, config_directory, config_file_name, kill_avatax)
 
         self._start_quickbooks()
         app, window = self._connect_to_app()
+        self._start_popup_suppressor(app)
+        self._start_resource_monitor()
 
-        window.set_focus()
+        self.window_manager.set_focus(window)
 
         self._handle_startup_popups(app)
 
@@ -219,7 +407,7 @@ class QuickBookGUIAPI:
                 win32functions.ShowWindow(main_window_wrapper.handle, win32defines.SW_RESTORE)
                 time.sleep(0.5)  # Give a moment for the window to draw
 
-            main_window_wrapper.set_focus()
+            self.window_manager.set_focus(main_window_wrapper)
             self.logger.debug("Main window is ready and focused.")
 
             # Update self.window and the local `window` to the spec we know works.
@@ -229,32 +417,46 @@ class QuickBookGUIAPI:
             self.logger.error(f"Could not find or restore the main QuickBooks window: {e}")
             raise e
 
-        if self.string_manager.is_match_in_list(COMPANY_NOT_LOADED, self.window_manager.get_all_dialog_titles(app), 95.0):
+        if self.title_matcher.any_matches(self.window_manager.get_all_dialog_titles(app), COMPANY_NOT_LOADED):
            self._select_company_file(window)
             
-        if self.string_manager.is_match_in_list(LOGIN, self.window_manager.get_all_dialog_titles(app), 95.0):    
+        if self.title_matcher.any_matches(self.window_manager.get_all_dialog_titles(app), LOGIN):    
             self._login(window, username, password)
 
         if kill_avatax:
             self._kill_avatax()
 
-        window.set_focus()
+        # After login, so the helper processes QuickBooks spawns late are included.
+        self._apply_process_profiles()
+
+        self.window_manager.set_focus(window)
         
         return app, window
 
     def shutdown(self) -> None:
         self.logger.info("Entering shutdown routine...")
         
+        self._stop_popup_suppressor()
+        self._stop_resource_monitor()
+        session = getattr(getattr(self, "app", None), "process", None)
         self._terminate_processes(QUICKBOOKS_PROCESSES)
+        if session:
+            ELEMENT_CACHE.invalidate_session(session)
+        if self.recycle_policy is not None:
+            self.recycle_policy.reset()
 
     def save_invoices(self, invoices: Invoice | list[Invoice]):
         from quickbooks_gui_api.apis import Invoices
 
         if self.app is not None and self.window is not None:
+            start = time.monotonic()
             Invoices(self.app,self.window).save(invoices)
+            self._after_job("invoices", len(invoices) if isinstance(invoices, list) else 1, time.monotonic() - start)
 
     def save_reports (self, reports: Report | list[Report]):
         from quickbooks_gui_api.apis import Reports
 
         if self.app is not None and self.window is not None:
-            Reports(self.app,self.window).save(reports)
\ No newline at end of file
+            start = time.monotonic()
+            Reports(self.app,self.window).save(reports)
+            self._after_job("reports", len(reports) if isinstance(reports, list) else 1, time.monotonic() - start)
\ No newline at end of file
@@ -0,0 +1,278 @@
+# src\quickbooks_gui_api\managers\desktop.py
+
+from __future__ import annotations
+
+import re
+
+from abc    import ABC, abstractmethod
+from typing import NamedTuple, Sequence, Mapping
+
+
+class WindowRecord(NamedTuple):
+    """
+    A native window belonging to the QuickBooks process.
+    Attributes:
+        handle (int): The window handle.
+        title (str): The window text.
+        class_name (str): The window class name.
+        owner (int): Handle of the owning window, 0 if unowned.
+        frame (int): For MDI children, handle of the top-level frame hosting them. 0 for top-level windows.
+        z_order (int): Position among its siblings, 0 being the topmost.
+        visible (bool): Whether the window is visible.
+        enabled (bool): Whether the window accepts input. A window with an open modal is disabled.
+    """
+    handle:     int
+    title:      str
+    class_name: str
+    owner:      int
+    frame:      int
+    z_order:    int
+    visible:    bool = True
+    enabled:    bool = True
+
+
+class WindowBackend(ABC):
+    """Lists the native windows of a process in z-order."""
+
+    @abstractmethod
+    def list_windows(self, pid: int) -> list[WindowRecord]:
+        """
+        Lists the top-level and owned windows of `pid`, plus the MDI children of each frame.
+
+        :param pid: The process id.
+        :type  pid: int
+        :returns: The windows, top-level ones ordered topmost first.
+        :rtype: list[WindowRecord]
+        """
+
+    @abstractmethod
+    def responds(self, handle: int, timeout: float = 0.25) -> bool:
+        """Returns True if the window's thread processes a message within `timeout` seconds."""
+
+    @abstractmethod
+    def activate(self, handle: int) -> None:
+        """Brings the window `handle` to the foreground."""
+
+    @abstractmethod
+    def close(self, handle: int) -> None:
+        """Asks the window `handle` to close, as its close button would."""
+
+    @abstractmethod
+    def foreground(self) -> int:
+        """Returns the handle of the foreground window, 0 if there is none."""
+
+    @abstractmethod
+    def automation_id(self, handle: int) -> str:
+        """Returns the UI Automation id of the window `handle`, or an empty string."""
+
+
+class Win32WindowBackend(WindowBackend):
+    """
+    Lists windows through `EnumWindows`, which reports top-level windows in z-order,
+    and walks each frame's `MDIClient` children with `GetWindow`. Every call is a
+    local Win32 call; no UI Automation round trips are made.
+    """
+
+    def list_windows(self, pid: int) -> list[WindowRecord]:
+        import win32con
+        import win32gui
+        import win32process
+
+        handles: list[int] = []
+
+        def _collect(hwnd: int, _: object) -> bool:
+            if win32process.GetWindowThreadProcessId(hwnd)[1] == pid:
+                handles.append(hwnd)
+            return True
+
+        win32gui.EnumWindows(_collect, None)
+
+        def _record(hwnd: int, owner: int, frame: int, z_order: int) -> WindowRecord:
+            return WindowRecord(
+                handle      = hwnd,
+                title       = win32gui.GetWindowText(hwnd),
+                class_name  = win32gui.GetClassName(hwnd),
+                owner       = owner,
+                frame       = frame,
+                z_order     = z_order,
+                visible     = bool(win32gui.IsWindowVisible(hwnd)),
+                enabled     = bool(win32gui.IsWindowEnabled(hwnd)),
+            )
+
+        records: list[WindowRecord] = []
+        for z_order, hwnd in enumerate(handles):
+            owner = win32gui.GetWindow(hwnd, win32con.GW_OWNER)
+            record = _record(hwnd, owner, 0, z_order)
+            records.append(record)
+
+            if owner or not record.visible:
+                continue
+
+            mdi_client = self._find_mdi_client(hwnd)
+            child = win32gui.GetWindow(mdi_client, win32con.GW_CHILD) if mdi_client else 0
+            child_z = 0
+            while child:
+                records.append(_record(child, 0, hwnd, child_z))
+                child = win32gui.GetWindow(child, win32con.GW_HWNDNEXT)
+                child_z += 1
+
+        return records
+
+    def responds(self, handle: int, timeout: float = 0.25) -> bool:
+        import win32con
+        import win32gui
+        try:
+            win32gui.SendMessageTimeout(handle, win32con.WM_NULL, 0, 0, win32con.SMTO_ABORTIFHUNG, int(timeout * 1000))
+            return True
+        except Exception:
+            return False
+
+    def activate(self, handle: int) -> None:
+        # The Win32 wrapper makes no UI Automation calls, so it is safe off the main thread.
+        from pywinauto.controls.hwndwrapper import HwndWrapper
+        HwndWrapper(handle).set_focus()
+
+    def close(self, handle: int) -> None:
+        import win32con
+        import win32gui
+        win32gui.PostMessage(handle, win32con.WM_CLOSE, 0, 0)
+
+    def foreground(self) -> int:
+        import win32gui
+        return win32gui.GetForegroundWindow() or 0
+
+    def automation_id(self, handle: int) -> str:
+        import pythoncom
+        from pywinauto.uia_element_info import UIAElementInfo
+
+        # UI Automation is free-threaded, but the calling thread needs COM initialized.
+        try:
+            pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        except pythoncom.com_error:
+            pass  # Already initialized as a single-threaded apartment.
+        try:
+            return UIAElementInfo(handle).automation_id or ""
+        except Exception:
+            return ""
+
+    @staticmethod
+    def _find_mdi_client(frame: int) -> int:
+        import win32gui
+
+        mdi_client = win32gui.FindWindowEx(frame, 0, "MDIClient", None)
+        if mdi_client:
+            return mdi_client
+
+        found: list[int] = []
+
+        def _search(hwnd: int, _: object) -> bool:
+            if not found and win32gui.GetClassName(hwnd) == "MDIClient":
+                found.append(hwnd)
+            return True
+
+        try:
+            win32gui.EnumChildWindows(frame, _search, None)
+        except Exception:
+            pass
+        return found[0] if found else 0
+
+
+class FakeWindowBackend(WindowBackend):
+    """
+    Fake backend serving prepared window lists, for exercising dialog selection without Win32.
+    Attributes:
+        call_count (int): Number of `list_windows` calls served.
+        actions (list[tuple[str, int]]): Every `activate` and `close` call, in order.
+        unresponsive (set[int]): Handles `responds` reports as hung.
+        unfocusable (set[int]): Handles `activate` fails to bring to the foreground.
+        foreground_handle (int): The window `foreground` reports.
+        automation_ids (dict[int, str]): Automation ids served by `automation_id`.
+    """
+
+    def __init__(self, windows: Sequence[WindowRecord] | Mapping[int, Sequence[WindowRecord]]) -> None:
+        self._windows = windows
+        self.call_count = 0
+        self.actions: list[tuple[str, int]] = []
+        self.unresponsive: set[int] = set()
+        self.unfocusable: set[int] = set()
+        self.foreground_handle = 0
+        self.automation_ids: dict[int, str] = {}
+
+    def list_windows(self, pid: int) -> list[WindowRecord]:
+        self.call_count += 1
+        if isinstance(self._windows, Mapping):
+            return list(self._windows.get(pid, ()))
+        return list(self._windows)
+
+    def responds(self, handle: int, timeout: float = 0.25) -> bool:
+        return handle not in self.unresponsive
+
+    def activate(self, handle: int) -> None:
+        self.actions.append(("activate", handle))
+        if handle not in self.unfocusable:
+            self.foreground_handle = handle
+
+    def close(self, handle: int) -> None:
+        self.actions.append(("close", handle))
+        if isinstance(self._windows, Mapping):
+            self._windows = {pid: [r for r in records if r.handle != handle] for pid, records in self._windows.items()}
+        else:
+            self._windows = [r for r in self._windows if r.handle != handle]
+
+    def foreground(self) -> int:
+        return self.foreground_handle
+
+    def automation_id(self, handle: int) -> str:
+        return self.automation_ids.get(handle, "")
+
+
+def select_top_dialog(
+        records: Sequence[WindowRecord],
+        main_title_re: str = ".*QuickBooks.*",
+    ) -> tuple[WindowRecord | None, WindowRecord | None]:
+    """
+    Picks the main window and the dialog currently on top of it.
+
+    A modal owned window (directly or through other owned windows) sits above its
+    owner in z-order and is the only one enabled, so the topmost visible, enabled,
+    titled owned window wins. Without one, the topmost visible MDI child of the
+    main window is the top dialog.
+
+    :param records: Windows of the QuickBooks process as returned by a `WindowBackend`.
+    :type  records: Sequence[WindowRecord]
+    :param main_title_re: Regular expression the main window's title must match.
+    :type  main_title_re: str = ".*QuickBooks.*"
+    :returns: The main window (None if not found) and the top dialog (None if there is none).
+    :rtype: tuple[WindowRecord | None, WindowRecord | None]
+    """
+    top_level   = sorted((r for r in records if not r.frame), key=lambda r: r.z_order)
+    mdi_frames  = {r.frame for r in records if r.frame}
+    pattern     = re.compile(main_title_re)
+
+    candidates = [r for r in top_level if r.visible and not r.owner and pattern.match(r.title)]
+    if not candidates:
+        return None, None
+
+    main = next((r for r in candidates if r.handle in mdi_frames), candidates[0])
+
+    owners = {r.handle: r.owner for r in top_level}
+
+    def _owned_by_main(record: WindowRecord) -> bool:
+        seen: set[int] = set()
+        owner = record.owner
+        while owner and owner not in seen:
+            if owner == main.handle:
+                return True
+            seen.add(owner)
+            owner = owners.get(owner, 0)
+        return False
+
+    for record in top_level:
+        if record.visible and record.enabled and record.title.strip() and _owned_by_main(record):
+            return main, record
+
+    children = sorted(
+        (r for r in records if r.frame == main.handle and r.visible and r.title.strip()),
+        key=lambda r: r.z_order,
+    )
+    return main, children[0] if children else None
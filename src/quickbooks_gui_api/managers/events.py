@@ -0,0 +1,436 @@
+# src\quickbooks_gui_api\managers\events.py
+
+from __future__ import annotations
+
+import time
+import logging
+import threading
+
+from abc            import ABC, abstractmethod
+from collections    import OrderedDict
+from typing         import Callable, Literal, NamedTuple, Iterable
+
+from quickbooks_gui_api.managers.desktop    import WindowRecord
+from quickbooks_gui_api.managers.string     import normalize_title
+
+
+EventKind = Literal["opened", "closed", "focused", "renamed"]
+
+
+class WindowEvent(NamedTuple):
+    """
+    A window lifecycle notification for the QuickBooks process.
+    Attributes:
+        kind (EventKind): What happened to the window.
+        handle (int): The window handle.
+        title (str): The window text at the time of the event. Empty when unknown, e.g. on close.
+        timestamp (float): `time.monotonic()` timestamp of the event.
+        owner (int): Handle of the owning window, 0 if unowned or unknown.
+        frame (int): For MDI children, handle of the top-level frame hosting them. 0 otherwise.
+    """
+    kind:       EventKind
+    handle:     int
+    title:      str = ""
+    timestamp:  float = 0.0
+    owner:      int = 0
+    frame:      int = 0
+
+
+class DialogRegistry:
+    """
+    Live, thread-safe registry of the QuickBooks process's open dialogs in z-order,
+    kept current by window events. Reading the top dialog is O(1) (the main window
+    is the only entry ever skipped), and callers can block until a dialog appears
+    or closes instead of polling.
+
+    Like `select_top_dialog`, only visible, titled windows owned by the main window
+    (directly or through other owned windows) and MDI children of the main window
+    are tracked; other top-level windows of the process are ignored.
+    Attributes:
+        root (int): Handle of the main window. It is tracked but never reported as a dialog.
+            With no root, every titled window is tracked.
+    """
+
+    def __init__(self, root: int = 0) -> None:
+        self.root = root
+
+        self._condition = threading.Condition()
+        self._version   = 0
+        # handle -> title, last item is the topmost window
+        self._open:     OrderedDict[int, str] = OrderedDict()
+        # handle -> owner of every owned window seen, to follow ownership chains
+        self._owners:   dict[int, int] = {}
+        self._held:     list[WindowEvent] | None = None
+        self._listeners: list[Callable[[WindowEvent], None]] = []
+
+    def _belongs(self, owner: int, frame: int) -> bool:
+        """Whether a window with this owner and frame is a dialog of the main window."""
+        if not self.root:
+            return True
+        if frame:
+            return frame == self.root
+        seen: set[int] = set()
+        while owner and owner not in seen:
+            if owner == self.root:
+                return True
+            seen.add(owner)
+            owner = self._owners.get(owner, 0)
+        return False
+
+    def hold(self) -> None:
+        """
+        Queues events instead of applying them until the next `seed`, which replays them.
+        Start the event source after calling this and before listing the windows to
+        seed from, so events that race the listing are not lost.
+        """
+        with self._condition:
+            if self._held is None:
+                self._held = []
+
+    def seed(self, records: Iterable[WindowRecord]) -> None:
+        """
+        Replaces the registry's contents with a window list, e.g. from a `WindowBackend`,
+        then applies any events queued by `hold`.
+        Top-level windows are expected topmost first; MDI children sit beneath owned windows.
+        """
+        records = list(records)
+        owned       = sorted((r for r in records if not r.frame and r.handle != self.root), key=lambda r: r.z_order)
+        children    = sorted((r for r in records if r.frame), key=lambda r: r.z_order)
+
+        with self._condition:
+            self._open.clear()
+            self._owners = {r.handle: r.owner for r in records if r.owner}
+            if self.root:
+                self._open[self.root] = next((r.title for r in records if r.handle == self.root), "")
+            # Insert bottom-most first so the topmost window ends up last.
+            for record in reversed(children):
+                if record.visible and record.title.strip() and self._belongs(0, record.frame):
+                    self._open[record.handle] = record.title
+            for record in reversed(owned):
+                if record.visible and record.title.strip() and self._belongs(record.owner, 0):
+                    self._open[record.handle] = record.title
+            self._version += 1
+            self._condition.notify_all()
+
+            held, self._held = self._held or [], None
+
+        for event in held:
+            self.apply(event)
+
+    def add_listener(self, listener: Callable[[WindowEvent], None]) -> None:
+        """
+        Registers a callback invoked with every applied event, outside the registry lock.
+        Events without a title carry the one the registry last knew for the window.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[WindowEvent], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def apply(self, event: WindowEvent) -> None:
+        """
+        Applies a window event to the registry and wakes any waiters.
+
+        :param event: The event to apply.
+        :type  event: WindowEvent
+        """
+        with self._condition:
+            if self._held is not None:
+                self._held.append(event)
+                return
+
+            if event.owner:
+                self._owners[event.handle] = event.owner
+
+            if event.kind in ("opened", "focused"):
+                title = event.title or self._open.get(event.handle, "")
+                if event.handle != self.root:
+                    if not title.strip():
+                        return
+                    if event.handle not in self._open and not self._belongs(event.owner, event.frame):
+                        return
+                self._open[event.handle] = title
+                self._open.move_to_end(event.handle)
+                if not event.title:
+                    event = event._replace(title=title)
+
+            elif event.kind == "closed":
+                self._owners.pop(event.handle, None)
+                title = self._open.pop(event.handle, None)
+                if title is None:
+                    return
+                # A closed window has no text left to read; report the one it had.
+                if not event.title:
+                    event = event._replace(title=title)
+
+            elif event.kind == "renamed":
+                if event.handle not in self._open:
+                    return
+                self._open[event.handle] = event.title
+
+            self._version += 1
+            self._condition.notify_all()
+
+        for listener in list(self._listeners):
+            listener(event)
+
+    def top(self) -> tuple[int, str] | None:
+        """
+        Returns the handle and title of the topmost dialog, or None if only the main window is open.
+        Focus on the main window's frame does not hide the MDI children it hosts.
+        """
+        with self._condition:
+            for handle in reversed(self._open):
+                if handle != self.root:
+                    return handle, self._open[handle]
+            return None
+
+    def top_title(self) -> str:
+        """Returns the topmost dialog's title, or an empty string if there is none."""
+        top = self.top()
+        return top[1] if top is not None else ""
+
+    def titles(self) -> list[str]:
+        """Returns every open window's title, topmost first, main window included."""
+        with self._condition:
+            return [title for title in reversed(self._open.values())]
+
+    def windows(self) -> list[tuple[int, str]]:
+        """Returns every open window's handle and title, topmost first, main window included."""
+        with self._condition:
+            return [(handle, self._open[handle]) for handle in reversed(self._open)]
+
+    def find(self, title: str) -> int | None:
+        """Returns the handle of the topmost open window whose normalized title equals `title`'s."""
+        key = normalize_title(title)
+        with self._condition:
+            for handle in reversed(self._open):
+                if normalize_title(self._open[handle]) == key:
+                    return handle
+        return None
+
+    def wait_for(self, predicate: Callable[[DialogRegistry], bool], timeout: float) -> bool:
+        """
+        Blocks until `predicate(registry)` holds or `timeout` elapses.
+
+        :param predicate: Condition evaluated under the registry lock after every change.
+        :type  predicate: Callable[[DialogRegistry], bool]
+        :param timeout: Maximum time to wait in seconds.
+        :type  timeout: float
+        :returns: True if the condition held before the timeout, False otherwise.
+        :rtype: bool
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: predicate(self), timeout)
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """Blocks until any event changes the registry. Returns False on timeout."""
+        with self._condition:
+            version = self._version
+            return self._condition.wait_for(lambda: self._version != version, timeout)
+
+    def wait_for_dialog(self, title: str, timeout: float) -> int | None:
+        """
+        Blocks until the top dialog is titled `title`, matching `WindowManager.top_dialog`.
+        Returns its handle, or None on timeout.
+        """
+        key = normalize_title(title)
+
+        def _on_top(registry: DialogRegistry) -> bool:
+            return normalize_title(registry.top_title()) == key
+
+        if self.wait_for(_on_top, timeout):
+            top = self.top()
+            return top[0] if top is not None else None
+        return None
+
+    def wait_for_close(self, title: str, timeout: float) -> bool:
+        """Blocks until no window titled `title` is open."""
+        return self.wait_for(lambda registry: registry.find(title) is None, timeout)
+
+
+class EventSource(ABC):
+    """Delivers window events for a process to a sink until stopped."""
+
+    @abstractmethod
+    def start(self, pid: int, sink: Callable[[WindowEvent], None]) -> None:
+        """
+        Starts delivering the window events of `pid` to `sink`.
+
+        :param pid: The process id to watch.
+        :type  pid: int
+        :param sink: Callback receiving each event.
+        :type  sink: Callable[[WindowEvent], None]
+        """
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stops delivering events."""
+
+
+class SyntheticEventSource(EventSource):
+    """
+    Fake source whose events are pushed by the caller, for exercising the registry without Win32.
+    Events are delivered synchronously on the calling thread.
+    """
+
+    def __init__(self) -> None:
+        self._sink: Callable[[WindowEvent], None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._sink is not None
+
+    def start(self, pid: int, sink: Callable[[WindowEvent], None]) -> None:
+        self._sink = sink
+
+    def stop(self) -> None:
+        self._sink = None
+
+    def emit(self, kind: EventKind, handle: int, title: str = "", *, owner: int = 0, frame: int = 0) -> None:
+        """Delivers an event to the sink, if started."""
+        if self._sink is not None:
+            self._sink(WindowEvent(kind, handle, title, time.monotonic(), owner, frame))
+
+
+class WinEventSource(EventSource):
+    """
+    Subscribes to `SetWinEventHook` show, hide, destroy, focus, foreground and name
+    change notifications for the process on a background thread with its own
+    message loop. Only dialog-level windows are reported: top-level windows and
+    MDI children.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+    """
+
+    EVENT_SYSTEM_FOREGROUND:    int = 0x0003
+    EVENT_OBJECT_DESTROY:       int = 0x8001
+    EVENT_OBJECT_SHOW:          int = 0x8002
+    EVENT_OBJECT_HIDE:          int = 0x8003
+    EVENT_OBJECT_FOCUS:         int = 0x8005
+    EVENT_OBJECT_NAMECHANGE:    int = 0x800C
+    WINEVENT_OUTOFCONTEXT:      int = 0x0000
+    WINEVENT_SKIPOWNPROCESS:    int = 0x0002
+    OBJID_WINDOW:               int = 0
+    CHILDID_SELF:               int = 0
+    GA_ROOT:                    int = 2
+    GW_OWNER:                   int = 4
+    WM_QUIT:                    int = 0x0012
+
+    def __init__(self, logger: logging.Logger | None = None) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self._thread:       threading.Thread | None = None
+        self._thread_id:    int = 0
+        self._ready         = threading.Event()
+
+    def start(self, pid: int, sink: Callable[[WindowEvent], None]) -> None:
+        if self._thread is not None:
+            raise RuntimeError("The event source is already running.")
+
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, args=(pid, sink), name="qb-window-events", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(5.0):
+            raise RuntimeError("Window event hook thread failed to start.")
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+
+        import ctypes
+        ctypes.windll.user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+        self._thread.join(timeout=5.0)
+        self._thread = None
+
+    def _dialog_level(self, hwnd: int) -> int:
+        """Returns the top-level window or MDI child containing `hwnd`, or 0."""
+        import win32gui
+
+        current = hwnd
+        while current:
+            if win32gui.GetAncestor(current, self.GA_ROOT) == current:
+                return current
+            parent = win32gui.GetParent(current)
+            if parent and win32gui.GetClassName(parent) == "MDIClient":
+                return current
+            current = parent
+        return 0
+
+    def _run(self, pid: int, sink: Callable[[WindowEvent], None]) -> None:
+        import ctypes
+        import ctypes.wintypes as wintypes
+        import win32gui
+
+        user32      = ctypes.windll.user32
+        kernel32    = ctypes.windll.kernel32
+
+        WinEventProc = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+            wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD,
+        )
+        user32.SetWinEventHook.restype  = wintypes.HANDLE
+        user32.SetWinEventHook.argtypes = [
+            wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+            wintypes.DWORD, wintypes.DWORD, wintypes.DWORD,
+        ]
+        user32.UnhookWinEvent.argtypes  = [wintypes.HANDLE]
+
+        def _callback(hook, event, hwnd, id_object, id_child, thread, time_ms) -> None:
+            if not hwnd or id_object != self.OBJID_WINDOW or id_child != self.CHILDID_SELF:
+                return
+            try:
+                now = time.monotonic()
+                if event in (self.EVENT_OBJECT_DESTROY, self.EVENT_OBJECT_HIDE):
+                    sink(WindowEvent("closed", hwnd, "", now))
+                    return
+
+                handle = self._dialog_level(hwnd)
+                if not handle:
+                    return
+                if event in (self.EVENT_OBJECT_SHOW, self.EVENT_OBJECT_NAMECHANGE) and handle != hwnd:
+                    # A control inside a dialog was shown or renamed, not the dialog itself.
+                    return
+
+                title = win32gui.GetWindowText(handle)
+                owner = win32gui.GetWindow(handle, self.GW_OWNER)
+                parent = win32gui.GetParent(handle)
+                frame = win32gui.GetParent(parent) if parent and not owner and win32gui.GetClassName(parent) == "MDIClient" else 0
+                if event == self.EVENT_OBJECT_SHOW:
+                    sink(WindowEvent("opened", handle, title, now, owner, frame))
+                elif event == self.EVENT_OBJECT_NAMECHANGE:
+                    sink(WindowEvent("renamed", handle, title, now, owner, frame))
+                else:
+                    sink(WindowEvent("focused", handle, title, now, owner, frame))
+            except Exception:
+                self.logger.exception(f"Error handling window event `{event:#06x}` for `{hwnd}`.")
+
+        # Keep a reference to the callback for the lifetime of the hooks.
+        proc = WinEventProc(_callback)
+        flags = self.WINEVENT_OUTOFCONTEXT | self.WINEVENT_SKIPOWNPROCESS
+        ranges = [
+            (self.EVENT_SYSTEM_FOREGROUND, self.EVENT_SYSTEM_FOREGROUND),
+            (self.EVENT_OBJECT_DESTROY,    self.EVENT_OBJECT_HIDE),
+            (self.EVENT_OBJECT_FOCUS,      self.EVENT_OBJECT_FOCUS),
+            (self.EVENT_OBJECT_NAMECHANGE, self.EVENT_OBJECT_NAMECHANGE),
+        ]
+        hooks = [user32.SetWinEventHook(low, high, None, proc, pid, 0, flags) for low, high in ranges]
+
+        self._thread_id = kernel32.GetCurrentThreadId()
+        self._ready.set()
+
+        try:
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks:
+                if hook:
+                    user32.UnhookWinEvent(hook)
@@ -1,16 +1,54 @@
 # src\quickbooks_gui_api\managers\file.py
 
+import os
+import sys
 import time
-import msvcrt
+import ctypes
 import logging
-import hashlib
 
 from pathlib import Path
+from typing import Callable, NamedTuple
+
+try:
+    import msvcrt
+except ImportError:  # Not Windows.
+    msvcrt = None
+
+from quickbooks_gui_api.managers.watch import PollingWatcher, open_watcher
+from quickbooks_gui_api.managers.hashing import HashCache, digest_file
+from quickbooks_gui_api.managers import validation
+
+
+class StabilityProgress(NamedTuple):
+    """
+    Progress of a file being written, as reported by `FileManager.wait_till_stable`.
+    Attributes:
+        path (Path): The file.
+        size (int): Current size in bytes.
+        rate (float): Recent growth in bytes per second.
+        elapsed (float): Seconds since the wait began.
+        eta (float | None): Predicted seconds until the expected size is reached, if known.
+    """
+    path:       Path
+    size:       int
+    rate:       float
+    elapsed:    float
+    eta:        float | None
+
 
 class FileManager:
+    """
+    File arrival, stability and hashing helpers for exported files.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        hash_algorithm (str): Default digest of `hash_file`, one of `hashing.DIGESTS`.
+        hash_cache (HashCache | None): Digests of unchanged files, or None to always read.
+    """
 
     def __init__(self, 
-                 logger: logging.Logger | None = None
+                 logger: logging.Logger | None = None,
+                 hash_algorithm: str = "sha256",
+                 hash_cache: HashCache | None = None
                  ) -> None:
         
         if logger is None:
@@ -20,6 +58,9 @@ class FileManager:
                 self.logger = logger 
             else:
                 raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.hash_algorithm = hash_algorithm
+        self.hash_cache     = hash_cache
             
     def is_locked(self, path: Path) -> bool:
         """
@@ -35,6 +76,10 @@ class FileManager:
         if not path.exists() or not path.is_file():
             raise TypeError("The provided path does not exist or is not a file.")
 
+        if msvcrt is None:
+            # Only Windows has mandatory locks; elsewhere an open file does not block readers.
+            return False
+
         try:
             # open for append (so we don't truncate) and try to lock a single byte
             with open(path, "a") as fh:
@@ -49,6 +94,32 @@ class FileManager:
             self.logger.exception(f"Failed checking lock state for {path}")
             return True
         
+    def has_writer(self, path: Path) -> bool:
+        """
+        Detects whether another process has the file at `path` open for writing,
+        without opening it for write. On Windows the file is opened for read while
+        denying write sharing, which fails only if a writer holds it. Elsewhere there
+        are no mandatory locks and False is returned.
+
+        :param path: Path instance pointing to the file.
+        :returns: True if a writer holds the file open, False otherwise.
+        """
+        if sys.platform != "win32":
+            return False
+
+        GENERIC_READ            = 0x80000000
+        FILE_SHARE_READ         = 0x00000001
+        OPEN_EXISTING           = 3
+        ERROR_SHARING_VIOLATION = 32
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateFileW.restype = ctypes.c_void_p
+        handle = kernel32.CreateFileW(str(path), GENERIC_READ, FILE_SHARE_READ, None, OPEN_EXISTING, 0, None)
+        if handle is None or handle == ctypes.c_void_p(-1).value:
+            return ctypes.get_last_error() == ERROR_SHARING_VIOLATION
+        kernel32.CloseHandle(ctypes.c_void_p(handle))
+        return False
+
     def wait_for_file(
             self,
             path: Path,
@@ -57,9 +128,11 @@ class FileManager:
         ) -> bool:
         """Wait for ``path`` to exist.
 
-        The call will repeatedly poll ``path`` until it exists or the timeout is
-        reached.  ``True`` is returned if the file appeared before the timeout,
-        otherwise ``False``.
+        The parent directory is watched for change notifications, so the wait ends
+        as soon as ``path`` is created or renamed into place. Existence is still
+        re-checked every ``poll_frequency`` seconds, which is the only check where
+        notifications are unavailable.  ``True`` is returned if the file appeared
+        before the timeout, otherwise ``False``.
 
         :param path: Path instance pointing to the expected file location.
         :type  path: Path
@@ -72,59 +145,214 @@ class FileManager:
         """
 
         end_time = time.monotonic() + max_time
-        while time.monotonic() < end_time:
-            if path.exists():
-                return True
-            time.sleep(poll_frequency)
+        if path.exists():
+            return True
 
-        return False
+        # Open the watcher before the next check so a file created in between is not missed.
+        directory = path.parent
+        watcher = open_watcher(directory, self.logger) if directory.is_dir() else PollingWatcher()
+        with watcher:
+            while True:
+                if path.exists():
+                    return True
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    return False
+                watcher.wait(min(poll_frequency, remaining))
 
     def wait_till_stable(
             self,
             path: Path,
             max_time: float = 60.0,
-            poll_frequency: float = 1.0
+            poll_frequency: float = 1.0,
+            *,
+            quiet_window: float = 0.25,
+            initial_interval: float = 0.02,
+            backoff: float = 1.5,
+            expected_size: int | None = None,
+            progress: Callable[[StabilityProgress], None] | None = None,
+            progress_interval: float = 5.0
         ) -> None:
         """Block until ``path`` is stable.
 
-        Stability means the file exists, is not locked by another process and
-        its size and modification time remain unchanged for at least one poll
-        interval.  If the timeout is exceeded without reaching a stable state a
-        ``TimeoutError`` is raised.
+        Stability means the file exists, has no writer holding it open and its
+        size and modification time have not changed for ``quiet_window`` seconds.
+        Checks start ``initial_interval`` apart and back off by ``backoff`` up to
+        ``poll_frequency`` while the file keeps changing, so a file that is
+        already complete returns after about one quiet window. While the file
+        grows, the growth rate and ``expected_size`` (e.g. the size of the file
+        being replaced) predict when writing ends, and the next check is made
+        then rather than sooner. If the timeout is exceeded without reaching a
+        stable state a ``TimeoutError`` is raised.
 
         :param path: Path instance pointing to the file.
         :type  path: Path
         :param max_time: Maximum time to wait for stability.
         :type  max_time: float = 60.0
-        :param poll_frequency: Interval between checks.
+        :param poll_frequency: Longest interval between checks.
         :type  poll_frequency: float = 1.0
+        :param quiet_window: Seconds the file must stay unchanged.
+        :type  quiet_window: float = 0.25
+        :param initial_interval: First interval between checks.
+        :type  initial_interval: float = 0.02
+        :param backoff: Factor the interval grows by after each check that saw a change.
+        :type  backoff: float = 1.5
+        :param expected_size: Predicted final size in bytes, if known.
+        :type  expected_size: int | None = None
+        :param progress: Called with a `StabilityProgress` every ``progress_interval`` seconds while waiting.
+        :type  progress: Callable[[StabilityProgress], None] | None = None
+        :param progress_interval: Seconds between progress reports.
+        :type  progress_interval: float = 5.0
         :raises TimeoutError: If the file does not become stable in time.
         """
 
         if not path.exists() or not path.is_file():
             raise TypeError("The provided path does not pass Path.exists() and Path.is_file().")
 
-        prev_stat = path.stat()
-        end_time = time.monotonic() + max_time
+        start = time.monotonic()
+        end_time = start + max_time
+        next_report = start + progress_interval
 
-        while time.monotonic() < end_time:
-            if self.is_locked(path):
-                time.sleep(poll_frequency)
-                prev_stat = path.stat()
-                continue
+        prev_stat = path.stat()
+        prev_time = unchanged_since = start
+        interval = initial_interval
+        rate = 0.0
 
+        while True:
+            now = time.monotonic()
             current_stat = path.stat()
-            if (
-                current_stat.st_size == prev_stat.st_size
-                and current_stat.st_mtime == prev_stat.st_mtime
-            ):
-                return
 
-            prev_stat = current_stat
-            time.sleep(poll_frequency)
+            if (current_stat.st_size, current_stat.st_mtime_ns) != (prev_stat.st_size, prev_stat.st_mtime_ns):
+                if now > prev_time:
+                    rate = max(0.0, (current_stat.st_size - prev_stat.st_size) / (now - prev_time))
+                prev_stat, prev_time, unchanged_since = current_stat, now, now
+                interval = min(poll_frequency, interval * backoff)
+            elif now - unchanged_since >= quiet_window:
+                if not self.has_writer(path):
+                    self.logger.debug(f"`{path.name}` stable at `{current_stat.st_size}` bytes after `{now - start:.3f}`s.")
+                    return
+                interval = min(poll_frequency, interval * backoff)
+
+            eta = None
+            if expected_size is not None and rate > 0 and current_stat.st_size < expected_size:
+                eta = (expected_size - current_stat.st_size) / rate
+
+            if progress is not None and now >= next_report:
+                progress(StabilityProgress(path, current_stat.st_size, rate, now - start, eta))
+                next_report = now + progress_interval
+
+            if now >= end_time:
+                raise TimeoutError(f"File {path} did not become stable within {max_time} seconds")
+
+            # Sleep until the quiet window could end, or until predicted completion while growing.
+            delay = max(interval, unchanged_since + quiet_window - now)
+            if eta is not None:
+                delay = max(delay, eta)
+            time.sleep(max(0.0, min(delay, poll_frequency, end_time - now)))
+
+    def wait_till_complete(
+            self,
+            path: Path,
+            max_time: float = 60.0,
+            poll_frequency: float = 0.25,
+            *,
+            previous: os.stat_result | None = None,
+            quiet_window: float = 0.25,
+            expected_size: int | None = None,
+            progress: Callable[[StabilityProgress], None] | None = None,
+            progress_interval: float = 5.0,
+            **stable_kwargs
+        ) -> None:
+        """Block until the export at ``path`` is provably whole.
+
+        PDFs and CSVs are checked structurally by ``validation.check`` each time
+        the directory changes, and accepted as soon as they pass with no writer
+        holding them. Only where a writer cannot be detected (outside Windows)
+        must a file that passes also stay unchanged for ``quiet_window`` seconds.
+        A file still matching ``previous``, the stat taken before the export, is
+        the old file and is not accepted. Other file types fall back to
+        ``wait_till_stable``.
+
+        :param path: Path instance pointing to the file.
+        :type  path: Path
+        :param max_time: Maximum time to wait.
+        :type  max_time: float = 60.0
+        :param poll_frequency: Longest interval between checks.
+        :type  poll_frequency: float = 0.25
+        :param previous: ``path.stat()`` from before the export, if the file already existed.
+        :type  previous: os.stat_result | None = None
+        :param quiet_window: Seconds a passing file must stay unchanged where writers cannot be detected.
+        :type  quiet_window: float = 0.25
+        :param expected_size: Predicted final size in bytes, if known, for the progress estimate.
+        :type  expected_size: int | None = None
+        :param progress: Called with a `StabilityProgress` every ``progress_interval`` seconds while waiting.
+        :type  progress: Callable[[StabilityProgress], None] | None = None
+        :param progress_interval: Seconds between progress reports.
+        :type  progress_interval: float = 5.0
+        :param stable_kwargs: Passed to ``wait_till_stable`` for unsupported file types.
+        :raises TimeoutError: If the file is not complete in time.
+        """
+        if not validation.supports(path):
+            self.wait_till_stable(
+                path,
+                max_time,
+                quiet_window        = quiet_window,
+                expected_size       = expected_size,
+                progress            = progress,
+                progress_interval   = progress_interval,
+                **stable_kwargs
+            )
+            return
+
+        start = time.monotonic()
+        end_time = start + max_time
+        next_report = start + progress_interval
+        result = validation.ExportCheck(False, "not checked")
+        # Without a writer check, only a quiet window shows the writer has finished.
+        detects_writer = sys.platform == "win32"
+
+        last_seen: tuple[int, int] | None = None
+        changed_at = start
+        rate = 0.0
+
+        with open_watcher(path.parent, self.logger) as watcher:
+            while True:
+                now = time.monotonic()
+                settling = False
+                try:
+                    stat = path.stat()
+                    if (stat.st_size, stat.st_mtime_ns) != last_seen:
+                        if last_seen is not None and now > changed_at:
+                            rate = max(0.0, (stat.st_size - last_seen[0]) / (now - changed_at))
+                        last_seen, changed_at = (stat.st_size, stat.st_mtime_ns), now
+
+                    replaced = previous is None or (stat.st_size, stat.st_mtime_ns) != (previous.st_size, previous.st_mtime_ns)
+                    result = validation.check(path) if replaced else validation.ExportCheck(False, "not yet replaced")
+                    if result.complete and not self.has_writer(path):
+                        if detects_writer or now - changed_at >= quiet_window:
+                            self.logger.debug(f"`{path.name}` complete after `{now - start:.3f}`s.")
+                            return
+                        settling = True
+                        result = validation.ExportCheck(False, "still within the quiet window")
+                except FileNotFoundError:
+                    stat = None
+                    result = validation.ExportCheck(False, "missing")
+
+                if progress is not None and stat is not None and now >= next_report:
+                    eta = None
+                    if expected_size is not None and rate > 0 and stat.st_size < expected_size:
+                        eta = (expected_size - stat.st_size) / rate
+                    progress(StabilityProgress(path, stat.st_size, rate, now - start, eta))
+                    next_report = now + progress_interval
+
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"File {path} was not complete within {max_time} seconds: {result.reason}")
+                timeout = min(poll_frequency, remaining)
+                if settling:
+                    timeout = min(timeout, max(0.0, changed_at + quiet_window - now))
+                watcher.wait(timeout)
 
-        raise TimeoutError(f"File {path} did not become stable within {max_time} seconds")
-    
     def time_since_modified(self, path: Path) -> float:
         """Return seconds elapsed since ``path`` was last modified.
 
@@ -142,30 +370,27 @@ class FileManager:
         return time.time() - path.stat().st_mtime
     
     
-    def hash_file(self, path: Path) -> str:
+    def hash_file(self, path: Path, algorithm: str | None = None) -> str:
         """
-        Compute and return the SHA-256 hex digest of the file at `path`.
+        Compute and return the hex digest of the file at `path`. The file is read
+        only if `hash_cache` has no digest for its current size, mtime and inode.
 
         :param path: Path to the file to hash
         :type  path: Path
-        :returns: Hex-encoded SHA-256 digest
+        :param algorithm: Digest to use, one of `hashing.DIGESTS`. Defaults to `hash_algorithm`.
+        :type  algorithm: str | None = None
+        :returns: Hex-encoded digest
         :rtype: str
         :raises TypeError: if `path` is not a Path
         :raises FileNotFoundError: if `path` does not exist or is not a file
+        :raises ValueError: if `algorithm` is unknown or unavailable
         """
-        # 1. Validate input:
         if not isinstance(path, Path):
             raise TypeError("path must be an instance of pathlib.Path")
         if not path.exists() or not path.is_file():
             raise FileNotFoundError(f"File not found or not a file: {path!s}")
 
-        # 2. Initialize hasher
-        hasher = hashlib.sha256()
-
-        # 3. Read the file in chunks and update the hash
-        with path.open("rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-
-        # 4. Return the final hex digest
-        return hasher.hexdigest()
+        algorithm = algorithm or self.hash_algorithm
+        if self.hash_cache is not None:
+            return self.hash_cache.digest(path, algorithm)
+        return digest_file(path, algorithm)
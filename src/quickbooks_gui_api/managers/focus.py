@@ -0,0 +1,182 @@
+# src\quickbooks_gui_api\managers\focus.py
+
+from __future__ import annotations
+
+import ctypes
+import logging
+
+from abc    import ABC, abstractmethod
+from typing import Any, NamedTuple
+
+
+class FocusState(NamedTuple):
+    """
+    The desktop's input focus at one moment.
+    Attributes:
+        foreground (int): Handle of the foreground top-level window, 0 if none.
+        focused (int): Handle of the window with keyboard focus in the foreground thread, 0 if none.
+    """
+    foreground: int
+    focused:    int
+
+
+class FocusBackend(ABC):
+    """Reads the current focus state and answers window ancestry questions."""
+
+    @abstractmethod
+    def state(self) -> FocusState:
+        """Returns the current foreground and focused window handles."""
+
+    @abstractmethod
+    def is_child(self, parent: int, child: int) -> bool:
+        """Returns True if `child` is a descendant of `parent`."""
+
+
+class _RECT(ctypes.Structure):
+    _fields_ = [("left", ctypes.c_long), ("top", ctypes.c_long), ("right", ctypes.c_long), ("bottom", ctypes.c_long)]
+
+
+class _GUITHREADINFO(ctypes.Structure):
+    _fields_ = [
+        ("cbSize",          ctypes.c_ulong),
+        ("flags",           ctypes.c_ulong),
+        ("hwndActive",      ctypes.c_void_p),
+        ("hwndFocus",       ctypes.c_void_p),
+        ("hwndCapture",     ctypes.c_void_p),
+        ("hwndMenuOwner",   ctypes.c_void_p),
+        ("hwndMoveSize",    ctypes.c_void_p),
+        ("hwndCaret",       ctypes.c_void_p),
+        ("rcCaret",         _RECT),
+    ]
+
+
+class Win32FocusBackend(FocusBackend):
+    """
+    Reads focus with `GetForegroundWindow` and `GetGUIThreadInfo`. Both are local
+    calls answered by the window manager, with no round trip into QuickBooks.
+    """
+
+    def __init__(self) -> None:
+        self._user32 = None
+
+    @property
+    def user32(self):
+        if self._user32 is None:
+            self._user32 = ctypes.WinDLL("user32", use_last_error=True)
+            self._user32.GetForegroundWindow.restype = ctypes.c_void_p
+        return self._user32
+
+    def state(self) -> FocusState:
+        foreground = self.user32.GetForegroundWindow() or 0
+        if not foreground:
+            return FocusState(0, 0)
+
+        thread_id = self.user32.GetWindowThreadProcessId(ctypes.c_void_p(foreground), None)
+        info = _GUITHREADINFO(cbSize=ctypes.sizeof(_GUITHREADINFO))
+        if not self.user32.GetGUIThreadInfo(thread_id, ctypes.byref(info)):
+            return FocusState(foreground, 0)
+        return FocusState(foreground, info.hwndFocus or 0)
+
+    def is_child(self, parent: int, child: int) -> bool:
+        return bool(self.user32.IsChild(ctypes.c_void_p(parent), ctypes.c_void_p(child)))
+
+
+class FakeFocusBackend(FocusBackend):
+    """
+    Fake backend with a settable focus state and window tree, for exercising the
+    tracker without a desktop.
+    Attributes:
+        foreground (int): The foreground window handle served by `state`.
+        focused (int): The focused window handle served by `state`.
+        parents (dict[int, int]): Child handle to parent handle.
+    """
+
+    def __init__(self, foreground: int = 0, focused: int = 0, parents: dict[int, int] | None = None) -> None:
+        self.foreground = foreground
+        self.focused    = focused
+        self.parents    = dict(parents or {})
+
+    def state(self) -> FocusState:
+        return FocusState(self.foreground, self.focused)
+
+    def is_child(self, parent: int, child: int) -> bool:
+        seen: set[int] = set()
+        while child in self.parents and child not in seen:
+            seen.add(child)
+            child = self.parents[child]
+            if child == parent:
+                return True
+        return False
+
+
+class FocusTracker:
+    """
+    Performs `set_focus` only when focus is not already where it is wanted.
+
+    A window is satisfied when it is the foreground window, has keyboard focus, or
+    contains the focused control. A windowless control is satisfied when UIA reports
+    it has keyboard focus.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        backend (FocusBackend): Source of the focus state.
+        needed (int): `set_focus` calls that were made.
+        skipped (int): `set_focus` calls avoided because focus was already satisfied.
+    """
+
+    def __init__(self, backend: FocusBackend | None = None, logger: logging.Logger | None = None) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.backend    = backend or Win32FocusBackend()
+        self.needed     = 0
+        self.skipped    = 0
+
+    def is_satisfied(self, wrapper: Any) -> bool:
+        """
+        Checks whether `wrapper` already has the focus `set_focus` would give it.
+
+        :param wrapper: A resolved pywinauto wrapper.
+        :type  wrapper: pywinauto.controls.uiawrapper.UIAWrapper
+        :rtype: bool
+        """
+        handle = getattr(wrapper, "handle", None) or 0
+        if not handle:
+            try:
+                return bool(wrapper.has_keyboard_focus())
+            except Exception:
+                return False
+
+        foreground, focused = self.backend.state()
+        if handle in (foreground, focused):
+            return True
+        return bool(focused) and self.backend.is_child(handle, focused)
+
+    def ensure(self, wrapper: Any) -> bool:
+        """
+        Focuses `wrapper` unless it is already satisfied.
+
+        :param wrapper: A resolved pywinauto wrapper.
+        :type  wrapper: pywinauto.controls.uiawrapper.UIAWrapper
+        :returns: True if `set_focus` was called.
+        :rtype: bool
+        """
+        if self.is_satisfied(wrapper):
+            self.skipped += 1
+            return False
+
+        wrapper.set_focus()
+        self.needed += 1
+        return True
+
+    def stats(self) -> dict[str, float]:
+        """Returns the needed and skipped counts along with the skip rate."""
+        total = self.needed + self.skipped
+        return {
+            "needed":       self.needed,
+            "skipped":      self.skipped,
+            "skip_rate":    self.skipped / total if total else 0.0,
+        }
@@ -0,0 +1,234 @@
+# src\quickbooks_gui_api\managers\hashing.py
+
+from __future__ import annotations
+
+import os
+import json
+import mmap
+import time
+import zlib
+import hashlib
+import logging
+import threading
+
+from pathlib    import Path
+from typing     import Any, Callable, NamedTuple
+
+try:
+    import xxhash
+except ImportError:  # Optional; install the `fast-hash` extra.
+    xxhash = None
+
+
+# Files at least this large are hashed through a memory map rather than read into a buffer.
+MMAP_THRESHOLD:         int = 64 * 2**20
+DEFAULT_BUFFER_SIZE:    int = 2**20
+
+
+class _CRC32:
+    """`zlib.crc32` behind the `hashlib` update/hexdigest interface."""
+
+    def __init__(self) -> None:
+        self._value = 0
+
+    def update(self, data: Any) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def hexdigest(self) -> str:
+        return f"{self._value:08x}"
+
+
+def _xxh3_128() -> Any:
+    if xxhash is None:
+        raise ValueError("The `xxh3_128` digest requires the `xxhash` package.")
+    return xxhash.xxh3_128()
+
+
+# Digest name to constructor. `sha256` is cryptographic; the others only detect change.
+DIGESTS: dict[str, Callable[[], Any]] = {
+    "sha256":   hashlib.sha256,
+    "blake2b":  hashlib.blake2b,
+    "crc32":    _CRC32,
+    "xxh3_128": _xxh3_128,
+}
+
+
+def new_digest(algorithm: str) -> Any:
+    """
+    :raises ValueError: If `algorithm` is unknown or its package is not installed.
+    """
+    try:
+        constructor = DIGESTS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown digest `{algorithm}`. Expected one of `{list(DIGESTS)}`.") from None
+    return constructor()
+
+
+def digest_file(path: Path, algorithm: str = "sha256", buffer_size: int = DEFAULT_BUFFER_SIZE) -> str:
+    """
+    Returns the hex digest of the file at `path`. Large files are memory mapped;
+    others are read through one reused buffer of `buffer_size` bytes.
+    """
+    hasher = new_digest(algorithm)
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, buffer_size * 16):
+                        hasher.update(view[offset:offset + buffer_size * 16])
+                finally:
+                    view.release()
+        else:
+            buffer = bytearray(buffer_size)
+            view = memoryview(buffer)
+            while True:
+                count = f.readinto(buffer)
+                if not count:
+                    break
+                hasher.update(view[:count])
+    return hasher.hexdigest()
+
+
+class HashCacheEntry(NamedTuple):
+    """
+    A digest and the file state it was computed from.
+    Attributes:
+        size (int): File size in bytes.
+        mtime_ns (int): Modification time in nanoseconds.
+        inode (int): File index; a replaced file gets a new one.
+        digest (str): The hex digest.
+    """
+    size:       int
+    mtime_ns:   int
+    inode:      int
+    digest:     str
+
+
+class HashCache:
+    """
+    File digests keyed by path and algorithm, valid while the file's size, mtime and
+    inode are unchanged, so an unchanged file is never read twice. Optionally
+    persisted as JSON.
+
+    New digests are only held in memory until `save`, which callers make once per
+    job. Saving drops entries for files that no longer exist and, beyond
+    `max_entries`, the least recently used ones.
+
+    On filesystems with coarse timestamps (FAT: 2 s), set `racy_window` so a file
+    modified that recently is not cached, since a further write in the same tick
+    could leave its stat unchanged.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        path (Path | None): JSON file the cache is persisted to, or None to keep it in memory.
+        racy_window (float): Seconds after a modification during which a digest is not cached.
+        max_entries (int): Entries kept when saving, or 0 for no limit.
+        hits (int): Digests served from the cache.
+        misses (int): Digests computed.
+    """
+
+    def __init__(
+            self,
+            path: Path | None = None,
+            racy_window: float = 0.0,
+            max_entries: int = 4096,
+            logger: logging.Logger | None = None,
+        ) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.path           = path
+        self.racy_window    = racy_window
+        self.max_entries    = max_entries
+        self.hits           = 0
+        self.misses         = 0
+        self._lock          = threading.Lock()
+        self._dirty         = False
+        self._entries:      dict[str, HashCacheEntry] = {}
+        if path is not None:
+            self.load()
+
+    @staticmethod
+    def key(path: Path, algorithm: str) -> str:
+        return f"{algorithm}:{os.path.normcase(os.path.abspath(path))}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def digest(self, path: Path, algorithm: str = "sha256", buffer_size: int = DEFAULT_BUFFER_SIZE) -> str:
+        """Returns the digest of `path`, reading the file only if it changed since it was last hashed."""
+        stat = path.stat()
+        key = self.key(path, algorithm)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.size, entry.mtime_ns, entry.inode) == (stat.st_size, stat.st_mtime_ns, stat.st_ino):
+                # Re-inserting keeps the dict in least recently used order for `max_entries`.
+                self._entries[key] = self._entries.pop(key)
+                self.hits += 1
+                return entry.digest
+
+        self.misses += 1
+        digest = digest_file(path, algorithm, buffer_size)
+        after = path.stat()
+        if (after.st_size, after.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns) and time.time() - after.st_mtime >= self.racy_window:
+            with self._lock:
+                self._entries.pop(key, None)
+                self._entries[key] = HashCacheEntry(after.st_size, after.st_mtime_ns, after.st_ino, digest)
+                self._dirty = True
+        return digest
+
+    def _prune(self) -> None:
+        """Drops entries of missing files, then the least recently used beyond `max_entries`. Holds `_lock`."""
+        missing = [key for key in self._entries if not os.path.isfile(key.split(":", 1)[1])]
+        for key in missing:
+            del self._entries[key]
+
+        excess = len(self._entries) - self.max_entries if self.max_entries > 0 else 0
+        for key in list(self._entries)[:max(0, excess)]:
+            del self._entries[key]
+
+        if missing or excess > 0:
+            self._dirty = True
+
+    def load(self) -> None:
+        """Loads the cache from `path`. A missing or unreadable file leaves it empty."""
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            with self._lock:
+                self._entries = {key: HashCacheEntry(*entry) for key, entry in data.items()}
+                self._dirty = False
+                self._prune()
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable hash cache `{self.path}`: {e}")
+
+    def save(self) -> None:
+        """Prunes the cache and writes it to `path`, if anything changed since it was loaded or last saved."""
+        if self.path is None:
+            return
+        with self._lock:
+            self._prune()
+            if not self._dirty:
+                return
+            data = {key: list(entry) for key, entry in self._entries.items()}
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        except OSError as e:
+            with self._lock:
+                self._dirty = True
+            self.logger.warning(f"Unable to save hash cache `{self.path}`: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+        self.save()
@@ -9,6 +9,7 @@ from pywinauto.controls.uiawrapper  import UIAWrapper
 
 from quickbooks_gui_api.managers    import image, ocr, string, window
 from quickbooks_gui_api.models      import Image
+from quickbooks_gui_api.managers.manager_exceptions import WindowNotFound
 
 
 class Helper:
@@ -56,7 +57,7 @@ class Helper:
                 element = root.child_window(**child_kwargs)
 
         try:
-            element.set_focus()
+            self.win_man.set_focus(element)
         except Exception:
             pass
 
@@ -78,7 +79,7 @@ class Helper:
             min_size: tuple[int | None, int | None] = (None, None) ,
             min_area: int | None = None,
             target_text: str,
-            match_threshold: float = 100.0,
+            match_threshold: float | None = None,
             root: pywinauto.WindowSpecification | None = None,
             **child_kwargs: dict[str, Any],
         ) -> tuple [ bool , str , float]:
@@ -104,8 +105,8 @@ class Helper:
         :type  min_area:        int | None = None
         :param target_text:     The target text to compare the OCR'd text against.
         :type  target_text:     str
-        :param match_threshold: The match confidence needed to pass.
-        :type  match_threshold: float = 100.0
+        :param match_threshold: The match confidence needed to pass. Defaults to the length-aware `StringManager.is_ocr_match`.
+        :type  match_threshold: float | None = None
         :returns: Result of match, OCR'd text, match confidence. 
         :rtype: tuple [ bool , str , float]
         """
@@ -118,7 +119,7 @@ class Helper:
             element = root.child_window(**child_kwargs)
 
         try:
-            element.set_focus()
+            self.win_man.set_focus(element)
         except Exception:
             pass
 
@@ -139,7 +140,9 @@ class Helper:
         else:
             raise ValueError(f"Invalid parameter state. single_or_multi: Literal['single', 'multi'] = `{single_or_multi}`.")
 
-        match_confidence = self.str_man.match(pulled_text, target_text)
+        match_confidence = self.str_man.ocr_match(pulled_text, target_text)
+        if match_threshold is None:
+            return self.str_man.is_ocr_match(pulled_text, target_text), pulled_text, match_confidence
 
         return match_confidence >= match_threshold, pulled_text, match_confidence
     
@@ -150,9 +153,28 @@ class Helper:
             *,
             root: WindowSpecification | None = None,
             wait_time: float = 2.0,
+            verify: bool = True,
             # wait_parameters: str = "exists enabled visible ready",
             **child_kwargs: Dict[str, Any],
         ) -> None:
+        """
+        Waits for an edit control and sets its text through `WindowManager.enter_text`.
+
+        :param text:            The text to enter.
+        :type  text:            str
+        :param element:         pywinauto WindowSpecification instance.
+        :type  element:         pywinauto.WindowSpecification
+        :param root:            Parent element for creating an element from parameters.
+        :type  root:            pywinauto.WindowSpecification
+        :param wait_time:       Maximum time to wait for the control to become active.
+        :type  wait_time:       float = 2.0
+        :param verify:          Confirm the value by reading it back.
+        :type  verify:          bool = True
+        :param child_kwargs:    Parameters for creating an element. 
+        :type  child_kwargs:    Dict[str, Any]
+        :raises WindowNotFound: If the control is not active within `wait_time`.
+        :raises TextEntryFailed: If the text could not be set.
+        """
 
         if element is None:
             if root is None or not child_kwargs:
@@ -161,15 +183,16 @@ class Helper:
                 )
             element = root.child_window(**child_kwargs)
 
+        # The active check hit-tests the control, which fails while another window covers it.
         try:
-            element.set_focus()
+            self.win_man.set_focus(element)
         except Exception:
             pass
-        
-        if self.win_man.is_element_active(element,timeout= wait_time):
-            element.set_text(text)  
-        else:
-            raise
+
+        if not self.win_man.is_element_active(element, timeout=wait_time):
+            raise WindowNotFound(f"The element `{element}` was not active within `{wait_time}` seconds.")
+
+        self.win_man.enter_text(element, text, verify=verify)
 
     def await_element(
             self,
@@ -189,7 +212,7 @@ class Helper:
             element = root.child_window(**child_kwargs)
 
         try:
-            element.set_focus()
+            self.win_man.set_focus(element)
         except Exception:
             pass
 
@@ -0,0 +1,285 @@
+# src\quickbooks_gui_api\managers\keyboard.py
+
+from __future__ import annotations
+
+import time
+import ctypes
+
+from abc    import ABC, abstractmethod
+from typing import List, NamedTuple, Sequence
+
+
+class KeyStroke(NamedTuple):
+    """
+    A single key transition in a compiled input sequence.
+    Attributes:
+        key (str): Key name as used by `send_input` (e.g. `enter`, `ctrl`, `f`), or the character to type when `text` is set.
+        down (bool): True for a key press, False for a release.
+        text (bool): The key is a literal character sent as unicode rather than a virtual key.
+        delay (float): Seconds to wait after this transition. Zero means the next one follows in the same batch.
+    """
+    key:    str
+    down:   bool = True
+    text:   bool = False
+    delay:  float = 0.0
+
+
+def _tap(key: str, *, text: bool = False, delay: float = 0.0) -> list[KeyStroke]:
+    return [KeyStroke(key, True, text), KeyStroke(key, False, text, delay)]
+
+
+def _hotkey(keys: Sequence[str], delay: float = 0.0) -> list[KeyStroke]:
+    strokes = [KeyStroke(key, True) for key in keys]
+    strokes += [KeyStroke(key, False) for key in reversed(keys)]
+    return strokes[:-1] + [strokes[-1]._replace(delay=delay)]
+
+
+def compile_input(
+        keys: str | List[str] | List[List[str]] | None = None,
+        *,
+        string: str | None = None,
+        send_count: int = 1,
+        char_at_a_time: bool = False,
+        delay: float = 0.0,
+        interval: float = 0.0,
+    ) -> list[KeyStroke]:
+    """
+    Compiles the arguments of `WindowManager.send_input` into a flat key sequence.
+
+    :param  keys:           A key, a hotkey (flat list) or several hotkeys (nested list).
+    :type   keys:           str | List[str] | List[List[str]] | None = None
+    :param  string:         Text to type. Ignored when `keys` is provided.
+    :type   string:         str | None = None
+    :param  send_count:     Number of times to repeat the input.
+    :type   send_count:     int = 1
+    :param  char_at_a_time: Apply `delay` after every character of `string` rather than after the whole string.
+    :type   char_at_a_time: bool = False
+    :param  delay:          Delay after each repetition, hotkey batch, or character.
+    :type   delay:          float = 0.0
+    :param  interval:       Minimum delay after every key transition.
+    :type   interval:       float = 0.0
+    :returns: The compiled sequence.
+    :rtype: list[KeyStroke]
+    :raises ValueError: If neither `keys` nor `string` is provided, or `keys` is malformed.
+    """
+    if keys is None and string is None:
+        raise ValueError("Either 'keys' or 'string' must be provided.")
+
+    strokes: list[KeyStroke] = []
+    for _ in range(send_count):
+        if keys is not None:
+            if isinstance(keys, str):
+                strokes += _tap(keys, delay=delay)
+            elif isinstance(keys, list) and keys and all(isinstance(k, str) for k in keys):
+                strokes += _hotkey(keys, delay)
+            elif isinstance(keys, list) and keys and all(isinstance(k, list) and k for k in keys):
+                for batch in keys:
+                    strokes += _hotkey(batch, delay)
+            else:
+                raise ValueError("Invalid format for 'keys'. Must be str or List[str].")
+        else:
+            assert string is not None
+            for index, char in enumerate(string):
+                last = index == len(string) - 1
+                strokes += _tap(char, text=True, delay=delay if (char_at_a_time or last) else 0.0)
+
+    if interval > 0:
+        strokes = [s._replace(delay=max(s.delay, interval)) for s in strokes]
+    return strokes
+
+
+class InputBackend(ABC):
+    """Delivers compiled key sequences to the foreground window."""
+
+    @abstractmethod
+    def send(self, strokes: Sequence[KeyStroke]) -> None:
+        """
+        Delivers `strokes` in order, honouring each stroke's `delay`.
+
+        :param strokes: The compiled sequence.
+        :type  strokes: Sequence[KeyStroke]
+        """
+
+
+# Virtual key codes for the key names used throughout the apis (pyautogui naming).
+VIRTUAL_KEYS: dict[str, int] = {
+    "backspace": 0x08, "tab": 0x09, "enter": 0x0D, "return": 0x0D,
+    "shift": 0x10, "ctrl": 0x11, "control": 0x11, "alt": 0x12, "pause": 0x13,
+    "capslock": 0x14, "esc": 0x1B, "escape": 0x1B, "space": 0x20,
+    "pageup": 0x21, "pgup": 0x21, "pagedown": 0x22, "pgdn": 0x22,
+    "end": 0x23, "home": 0x24, "left": 0x25, "up": 0x26, "right": 0x27, "down": 0x28,
+    "printscreen": 0x2C, "insert": 0x2D, "delete": 0x2E, "del": 0x2E,
+    "win": 0x5B, "winleft": 0x5B, "winright": 0x5C, "apps": 0x5D,
+    "shiftleft": 0xA0, "shiftright": 0xA1, "ctrlleft": 0xA2, "ctrlright": 0xA3,
+    "altleft": 0xA4, "altright": 0xA5,
+    **{f"f{n}": 0x6F + n for n in range(1, 25)},
+}
+
+# Keys that must be flagged as extended or Windows maps them to the numeric keypad.
+EXTENDED_KEYS: frozenset[int] = frozenset({
+    0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28, 0x2D, 0x2E, 0x5B, 0x5C, 0x5D, 0xA3, 0xA5,
+})
+
+_INPUT_KEYBOARD         = 1
+_KEYEVENTF_EXTENDEDKEY  = 0x0001
+_KEYEVENTF_KEYUP        = 0x0002
+_KEYEVENTF_UNICODE      = 0x0004
+_VK_SHIFT, _VK_CONTROL, _VK_MENU = 0x10, 0x11, 0x12
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk",         ctypes.c_ushort),
+        ("wScan",       ctypes.c_ushort),
+        ("dwFlags",     ctypes.c_ulong),
+        ("time",        ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx",          ctypes.c_long),
+        ("dy",          ctypes.c_long),
+        ("mouseData",   ctypes.c_ulong),
+        ("dwFlags",     ctypes.c_ulong),
+        ("time",        ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # The mouse member is only here so the union, and so INPUT, has the size SendInput expects.
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("union", _INPUTUNION)]
+
+
+class Win32InputBackend(InputBackend):
+    """
+    Delivers key sequences with `SendInput`. Consecutive strokes without a delay are
+    submitted in a single call, so the system queues them atomically and no other
+    input can interleave. Literal text is sent as unicode, independent of the keyboard
+    layout; single characters in hotkeys are mapped with `VkKeyScanW`.
+    Attributes:
+        submissions (int): Number of `SendInput` calls made.
+    """
+
+    def __init__(self) -> None:
+        self.submissions = 0
+        self._user32 = None
+
+    @property
+    def user32(self):
+        if self._user32 is None:
+            self._user32 = ctypes.WinDLL("user32", use_last_error=True)
+            # SHORT, so an unmapped character reads as -1 rather than 0xFFFF.
+            self._user32.VkKeyScanW.restype = ctypes.c_short
+            self._user32.VkKeyScanW.argtypes = [ctypes.c_wchar]
+        return self._user32
+
+    @staticmethod
+    def _key(vk: int, scan: int, flags: int) -> _INPUT:
+        return _INPUT(type=_INPUT_KEYBOARD, union=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, wScan=scan, dwFlags=flags)))
+
+    def _virtual_key(self, key: str) -> tuple[int, list[int]]:
+        """Returns the virtual key of `key` and the modifiers it needs held."""
+        name = key.lower()
+        if name in VIRTUAL_KEYS:
+            return VIRTUAL_KEYS[name], []
+        if len(key) != 1:
+            raise ValueError(f"Unknown key name `{key}`.")
+
+        scan = self.user32.VkKeyScanW(ctypes.c_wchar(key))
+        if scan == -1:
+            raise ValueError(f"The character `{key}` has no key on the current layout.")
+
+        shift_state = (scan >> 8) & 0xFF
+        modifiers = [vk for bit, vk in ((1, _VK_SHIFT), (2, _VK_CONTROL), (4, _VK_MENU)) if shift_state & bit]
+        return scan & 0xFF, modifiers
+
+    def _inputs(self, stroke: KeyStroke) -> list[_INPUT]:
+        up = 0 if stroke.down else _KEYEVENTF_KEYUP
+
+        if stroke.text:
+            if stroke.key in ("\n", "\r"):
+                return [self._key(VIRTUAL_KEYS["enter"], 0, up)]
+            if stroke.key == "\t":
+                return [self._key(VIRTUAL_KEYS["tab"], 0, up)]
+            return [self._key(0, ord(unit), _KEYEVENTF_UNICODE | up) for unit in self._utf16(stroke.key)]
+
+        vk, modifiers = self._virtual_key(stroke.key)
+        extended = _KEYEVENTF_EXTENDEDKEY if vk in EXTENDED_KEYS else 0
+        key = self._key(vk, 0, extended | up)
+        if stroke.down:
+            return [self._key(mod, 0, 0) for mod in modifiers] + [key]
+        return [key] + [self._key(mod, 0, _KEYEVENTF_KEYUP) for mod in reversed(modifiers)]
+
+    @staticmethod
+    def _utf16(char: str) -> list[str]:
+        # Characters outside the BMP are sent as their surrogate pair.
+        data = char.encode("utf-16-le")
+        return [data[i:i + 2].decode("utf-16-le", "surrogatepass") for i in range(0, len(data), 2)]
+
+    def _submit(self, batch: list[_INPUT]) -> None:
+        if not batch:
+            return
+        array = (_INPUT * len(batch))(*batch)
+        sent = self.user32.SendInput(len(batch), array, ctypes.sizeof(_INPUT))
+        self.submissions += 1
+        if sent != len(batch):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def send(self, strokes: Sequence[KeyStroke]) -> None:
+        batch: list[_INPUT] = []
+        for stroke in strokes:
+            batch += self._inputs(stroke)
+            if stroke.delay > 0:
+                self._submit(batch)
+                batch = []
+                time.sleep(stroke.delay)
+        self._submit(batch)
+
+
+class RecordingInputBackend(InputBackend):
+    """
+    Fake backend that records sequences instead of delivering them, for asserting
+    key sequences and timings without a desktop. Delays advance a virtual clock
+    rather than sleeping.
+    Attributes:
+        strokes (list[tuple[float, KeyStroke]]): Every stroke with the virtual time it was delivered at.
+        submissions (int): Number of batches a native backend would have submitted.
+        elapsed (float): Total virtual time spent in delays.
+    """
+
+    def __init__(self) -> None:
+        self.strokes:       list[tuple[float, KeyStroke]] = []
+        self.submissions    = 0
+        self.elapsed        = 0.0
+
+    def send(self, strokes: Sequence[KeyStroke]) -> None:
+        pending = False
+        for stroke in strokes:
+            self.strokes.append((self.elapsed, stroke))
+            pending = True
+            if stroke.delay > 0:
+                self.submissions += 1
+                pending = False
+                self.elapsed += stroke.delay
+        if pending:
+            self.submissions += 1
+
+    def typed_text(self) -> str:
+        """Returns the literal text delivered so far."""
+        return "".join(stroke.key for _, stroke in self.strokes if stroke.text and stroke.down)
+
+    def presses(self) -> list[str]:
+        """Returns the names of the virtual keys pressed so far, in order."""
+        return [stroke.key for _, stroke in self.strokes if not stroke.text and stroke.down]
+
+    def clear(self) -> None:
+        self.strokes.clear()
+        self.submissions = 0
+        self.elapsed = 0.0
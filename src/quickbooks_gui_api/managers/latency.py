@@ -0,0 +1,210 @@
+# src\quickbooks_gui_api\managers\latency.py
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+import time
+import bisect
+import logging
+import threading
+
+from pathlib        import Path
+from collections    import deque
+from typing         import Callable, Literal, NamedTuple, Sequence
+
+
+# Histogram bucket upper bounds in seconds, roughly logarithmic from 5 ms to 30 s.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.15, 0.25, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+ActionKind = Literal["keys", "press", "click"]
+EffectKind = Literal["opened", "closed", "focused", "renamed", "condition"]
+
+# The effects each kind of input is paired with. Focus changes follow keystrokes
+# that open dialogs too, so only clicks, which move focus themselves, claim them.
+EXPECTED_EFFECTS: dict[str, frozenset[str]] = {
+    "keys":     frozenset({"opened", "closed", "renamed", "condition"}),
+    "press":    frozenset({"opened", "closed", "renamed", "condition"}),
+    "click":    frozenset({"opened", "closed", "renamed", "focused", "condition"}),
+}
+
+
+class LatencySummary(NamedTuple):
+    """
+    Latency statistics of one action → effect pair, in seconds.
+    Attributes:
+        count (int): Number of samples.
+        p50 (float): Median.
+        p90 (float): 90th percentile.
+        p99 (float): 99th percentile, the value to base a timeout on.
+        max (float): Slowest sample.
+    """
+    count:  int
+    p50:    float
+    p90:    float
+    p99:    float
+    max:    float
+
+
+class LatencyRecorder:
+    """
+    Measures the time from an input (`begin`) to its first observed effect (`observe`),
+    per action → effect pair, e.g. `ctrl+f → Find Invoices opened`.
+
+    An effect is attributed to each pending action whose kind expects that kind of
+    effect (see `EXPECTED_EFFECTS`), after which those actions stop pending; other
+    actions keep waiting. Actions with no effect within `max_wait` are discarded.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        enabled (bool): Whether `begin` records anything. Recording is off by default.
+        buckets (tuple[float, ...]): Histogram bucket upper bounds in seconds.
+        max_wait (float): Seconds an action waits for an effect before it is discarded.
+    """
+
+    def __init__(
+            self,
+            *,
+            enabled: bool = False,
+            buckets: Sequence[float] = DEFAULT_BUCKETS,
+            max_wait: float = 30.0,
+            max_samples: int = 1024,
+            clock: Callable[[], float] = time.monotonic,
+            logger: logging.Logger | None = None,
+        ) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.enabled    = enabled
+        self.buckets    = tuple(sorted(buckets))
+        self.max_wait   = max_wait
+
+        self._clock         = clock
+        self._max_samples   = max_samples
+        self._lock          = threading.Lock()
+        self._pending:      list[tuple[str, ActionKind, float]] = []
+        self._samples:      dict[str, deque[float]] = {}
+        self._counts:       dict[str, list[int]] = {}
+
+    @staticmethod
+    def key(action: str, effect: str) -> str:
+        return f"{action} → {effect}"
+
+    def begin(self, action: str, kind: ActionKind = "keys") -> None:
+        """Marks `action`, an input of `kind`, as sent now."""
+        if not self.enabled:
+            return
+        if kind not in EXPECTED_EFFECTS:
+            raise ValueError(f"Unknown action kind `{kind}`.")
+        with self._lock:
+            self._pending.append((action, kind, self._clock()))
+
+    def observe(self, effect: str, kind: EffectKind = "condition") -> list[str]:
+        """
+        Records `effect` against every pending action that expects an effect of `kind`.
+
+        :param effect: Description of the effect, e.g. `Find Invoices opened`.
+        :type  effect: str
+        :param kind: What kind of effect it is.
+        :type  kind: EffectKind = "condition"
+        :returns: The keys that received a sample.
+        :rtype: list[str]
+        """
+        now = self._clock()
+        recorded: list[str] = []
+        with self._lock:
+            pending, self._pending = self._pending, []
+            for action, action_kind, started in pending:
+                elapsed = now - started
+                if elapsed > self.max_wait:
+                    continue
+                if kind not in EXPECTED_EFFECTS[action_kind]:
+                    self._pending.append((action, action_kind, started))
+                    continue
+                key = self.key(action, effect)
+                self._record(key, elapsed)
+                recorded.append(key)
+        for key in recorded:
+            self.logger.debug(f"Latency `{key}`: `{self._samples[key][-1]:.4f}`s.")
+        return recorded
+
+    def _record(self, key: str, elapsed: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self._max_samples)
+            self._counts[key] = [0] * (len(self.buckets) + 1)
+        samples.append(elapsed)
+        self._counts[key][bisect.bisect_left(self.buckets, elapsed)] += 1
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return sorted(self._samples)
+
+    def histogram(self, key: str) -> list[tuple[float, int]]:
+        """
+        Returns the histogram of `key` as (bucket upper bound, count) pairs. The last
+        bound is `inf` and counts samples above the largest bucket.
+        """
+        with self._lock:
+            counts = list(self._counts.get(key, [0] * (len(self.buckets) + 1)))
+        return list(zip(self.buckets + (math.inf,), counts))
+
+    def percentile(self, key: str, q: float) -> float:
+        """Returns the `q`th percentile (0-100) of the retained samples of `key`, nearest-rank."""
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * len(samples)))
+        return samples[min(rank, len(samples)) - 1]
+
+    def summary(self) -> dict[str, LatencySummary]:
+        result: dict[str, LatencySummary] = {}
+        for key in self.keys():
+            with self._lock:
+                samples = list(self._samples[key])
+            result[key] = LatencySummary(
+                count   = len(samples),
+                p50     = self.percentile(key, 50),
+                p90     = self.percentile(key, 90),
+                p99     = self.percentile(key, 99),
+                max     = max(samples),
+            )
+        return result
+
+    def export(self, path: Path) -> None:
+        """
+        Writes every summary and histogram to `path`, as CSV if it ends in `.csv`,
+        otherwise as JSON.
+        """
+        summary = self.summary()
+
+        if path.suffix.lower() == ".csv":
+            with path.open("w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(["key", *LatencySummary._fields, *(f"le_{bound}" for bound in self.buckets), "le_inf"])
+                for key, stats in summary.items():
+                    writer.writerow([key, *stats, *(count for _, count in self.histogram(key))])
+            return
+
+        data = {
+            key: {
+                **stats._asdict(),
+                "histogram": [[None if math.isinf(bound) else bound, count] for bound, count in self.histogram(key)],
+            }
+            for key, stats in summary.items()
+        }
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._samples.clear()
+            self._counts.clear()
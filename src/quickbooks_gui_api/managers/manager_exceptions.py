@@ -21,6 +21,14 @@ class WindowNotFound(ManagerException):
 class UnexpectedState(ManagerException):
     pass
 
+class TextEntryFailed(ManagerException):
+    """No text-entry strategy could set and confirm a field's value."""
+    def __init__(self, target: str, attempts: dict[str, str]) -> None:
+        tried = "; ".join(f"{strategy}: {reason}" for strategy, reason in attempts.items())
+        message = (f"Unable to enter text into '{target}'. Attempts: {tried or 'none'}.")
+        super().__init__(message)
+        self.attempts = attempts
+
 # --- Image Manager   ------------------------------------------------------------------
 
 class CaptureFailed(ManagerException):
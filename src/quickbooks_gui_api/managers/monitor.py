@@ -0,0 +1,230 @@
+# src\quickbooks_gui_api\managers\monitor.py
+
+from __future__ import annotations
+
+import time
+import logging
+import threading
+
+from collections    import deque
+from typing         import Callable, Iterable, Mapping, NamedTuple, Sequence
+
+import psutil
+
+
+class ResourceSample(NamedTuple):
+    """
+    Resource usage of one process at one moment.
+    Attributes:
+        timestamp (float): `time.monotonic()` when the sample was taken.
+        pid (int): The process id.
+        cpu_percent (float): CPU use since the previous sample, 100 being one full core.
+        rss (int): Resident memory in bytes.
+        handles (int): Open handles (file descriptors outside Windows).
+        threads (int): Thread count.
+    """
+    timestamp:      float
+    pid:            int
+    cpu_percent:    float
+    rss:            int
+    handles:        int
+    threads:        int
+
+
+class ResourceMonitor:
+    """
+    Samples the resource usage of a set of processes on a background thread.
+    The set is re-read on every sample, so it follows QuickBooks across restarts.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        interval (float): Seconds between samples.
+        samples (deque[ResourceSample]): The most recent samples of every process, oldest first.
+    """
+
+    def __init__(
+            self,
+            pids: Callable[[], Iterable[int]],
+            *,
+            interval: float = 5.0,
+            max_samples: int = 4096,
+            logger: logging.Logger | None = None,
+        ) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.interval   = interval
+        self.samples:   deque[ResourceSample] = deque(maxlen=max_samples)
+
+        self._pids      = pids
+        self._procs:    dict[int, psutil.Process] = {}
+        self._lock      = threading.Lock()
+        self._stop      = threading.Event()
+        self._thread:   threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ResourceMonitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception:
+                self.logger.debug("Resource sample failed.", exc_info=True)
+            self._stop.wait(self.interval)
+
+    def sample(self) -> list[ResourceSample]:
+        """Takes and stores one sample of every current process."""
+        taken: list[ResourceSample] = []
+        now = time.monotonic()
+        pids = set(self._pids())
+
+        for pid in list(self._procs):
+            if pid not in pids:
+                del self._procs[pid]
+
+        for pid in pids:
+            proc = self._procs.get(pid)
+            try:
+                if proc is None:
+                    proc = self._procs[pid] = psutil.Process(pid)
+                    # The first call only primes the CPU counter.
+                    proc.cpu_percent(None)
+                with proc.oneshot():
+                    handles = proc.num_handles() if hasattr(proc, "num_handles") else proc.num_fds()
+                    taken.append(ResourceSample(
+                        timestamp   = now,
+                        pid         = pid,
+                        cpu_percent = proc.cpu_percent(None),
+                        rss         = proc.memory_info().rss,
+                        handles     = handles,
+                        threads     = proc.num_threads(),
+                    ))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                self._procs.pop(pid, None)
+
+        with self._lock:
+            self.samples.extend(taken)
+        return taken
+
+    def series(self, metric: str, pid: int | None = None) -> list[tuple[float, float]]:
+        """
+        Returns (timestamp, value) pairs of `metric`, for one process or summed over all.
+
+        :param metric: One of `cpu_percent`, `rss`, `handles` or `threads`.
+        :type  metric: str
+        :param pid: The process, or None to sum every process sampled at the same moment.
+        :type  pid: int | None = None
+        :rtype: list[tuple[float, float]]
+        """
+        if metric not in ("cpu_percent", "rss", "handles", "threads"):
+            raise ValueError(f"Unknown metric `{metric}`.")
+
+        with self._lock:
+            samples = list(self.samples)
+
+        if pid is not None:
+            return [(s.timestamp, getattr(s, metric)) for s in samples if s.pid == pid]
+
+        totals: dict[float, float] = {}
+        for s in samples:
+            totals[s.timestamp] = totals.get(s.timestamp, 0) + getattr(s, metric)
+        return sorted(totals.items())
+
+    def latest(self) -> dict[str, float]:
+        """Returns the most recent value of every metric, summed over all processes."""
+        latest = {metric: self.series(metric) for metric in ("cpu_percent", "rss", "handles", "threads")}
+        return {metric: values[-1][1] if values else 0.0 for metric, values in latest.items()}
+
+
+class RecycleAdvice(NamedTuple):
+    """
+    Whether QuickBooks should be restarted before the next job.
+    Attributes:
+        recycle (bool): True if any threshold was crossed.
+        reasons (tuple[str, ...]): A description of every threshold crossed.
+    """
+    recycle:    bool
+    reasons:    tuple[str, ...] = ()
+
+
+class RecyclePolicy:
+    """
+    Recommends restarting QuickBooks between jobs once it has grown too large or
+    become too slow. Slowdown compares the recent mean seconds per item against the
+    mean of the first jobs since the last restart, separately for each kind of job,
+    since an invoice and a report take very different times per item.
+    Attributes:
+        max_rss (int | None): Resident memory ceiling in bytes.
+        max_handles (int | None): Handle count ceiling.
+        max_slowdown (float | None): Allowed ratio of recent to baseline seconds per item.
+        window (int): Number of jobs in the baseline and in the recent mean.
+    """
+
+    def __init__(
+            self,
+            *,
+            max_rss: int | None = None,
+            max_handles: int | None = None,
+            max_slowdown: float | None = None,
+            window: int = 3,
+        ) -> None:
+        self.max_rss        = max_rss
+        self.max_handles    = max_handles
+        self.max_slowdown   = max_slowdown
+        self.window         = window
+        self._job_rates:    dict[str, list[float]] = {}
+
+    def record_job(self, items: int, seconds: float, kind: str = "default") -> None:
+        """Records a finished job's throughput under its kind, e.g. `invoices` or `reports`."""
+        if items > 0:
+            self._job_rates.setdefault(kind, []).append(seconds / items)
+
+    def reset(self) -> None:
+        """Forgets recorded throughput, e.g. after a restart."""
+        self._job_rates.clear()
+
+    def evaluate(self, latest: dict[str, float], job_rates: Mapping[str, Sequence[float]] | None = None) -> RecycleAdvice:
+        """
+        :param latest: Current usage, as from `ResourceMonitor.latest`.
+        :type  latest: dict[str, float]
+        :param job_rates: Seconds per item of past jobs by kind, oldest first. Defaults to those recorded.
+        :type  job_rates: Mapping[str, Sequence[float]] | None = None
+        :rtype: RecycleAdvice
+        """
+        series = self._job_rates if job_rates is None else job_rates
+        reasons: list[str] = []
+
+        if self.max_rss is not None and latest.get("rss", 0) > self.max_rss:
+            reasons.append(f"resident memory {latest['rss'] / 2**20:.0f} MiB exceeds {self.max_rss / 2**20:.0f} MiB")
+
+        if self.max_handles is not None and latest.get("handles", 0) > self.max_handles:
+            reasons.append(f"{latest['handles']:.0f} handles exceeds {self.max_handles}")
+
+        if self.max_slowdown is not None:
+            for kind, rates in series.items():
+                if len(rates) < 2 * self.window:
+                    continue
+                baseline = sum(rates[:self.window]) / self.window
+                recent = sum(rates[-self.window:]) / self.window
+                if baseline > 0 and recent / baseline > self.max_slowdown:
+                    reasons.append(f"{kind}: {recent:.2f}s per item is {recent / baseline:.2f}x the {baseline:.2f}s baseline")
+
+        return RecycleAdvice(bool(reasons), tuple(reasons))
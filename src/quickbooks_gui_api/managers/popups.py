@@ -0,0 +1,213 @@
+# src\quickbooks_gui_api\managers\popups.py
+
+from __future__ import annotations
+
+import time
+import logging
+import threading
+
+from typing import Any, Callable, Iterable, Mapping, NamedTuple
+
+from quickbooks_gui_api.managers.string import normalize_title
+
+
+class PopupRule(NamedTuple):
+    """
+    A nuisance window and how to dismiss it.
+    Attributes:
+        title (str): The window title. Empty to match by `auto_id` alone.
+        keys (tuple[str, ...]): Hotkey that dismisses it once focused. Empty to close the window instead.
+        auto_id (str): The window's UI Automation id, for popups without a title.
+    """
+    title:      str
+    keys:       tuple[str, ...] = ()
+    auto_id:    str = ""
+
+    @property
+    def name(self) -> str:
+        return self.title or self.auto_id
+
+    @classmethod
+    def from_config(cls, entries: Iterable[Mapping[str, Any]]) -> list[PopupRule]:
+        """
+        Builds rules from config entries such as `{ title = "QuickBooks Payments", keys = ["esc"] }`
+        or `{ auto_id = "FloatingViewerFrame" }`.
+
+        :raises ValueError: If an entry has neither a title nor an automation id.
+        """
+        rules: list[PopupRule] = []
+        for entry in entries:
+            title = str(entry.get("title", "")).strip()
+            auto_id = str(entry.get("auto_id", "")).strip()
+            if not title and not auto_id:
+                raise ValueError(f"Nuisance popup entry `{entry}` has neither a title nor an auto_id.")
+            keys = entry.get("keys", ())
+            rules.append(cls(title, (keys,) if isinstance(keys, str) else tuple(keys), auto_id))
+        return rules
+
+
+class PopupSuppressor:
+    """
+    Background thread that dismisses nuisance popups as soon as they appear, rather
+    than leaving them to stall the main flow until a timeout and a fixed-point handler.
+
+    Windows are read from the `WindowManager`'s dialog registry while it is watching,
+    otherwise from its native window backend. Rules matched by automation id need
+    untitled windows, which the registry does not track, so they always list windows
+    through the backend and read one automation id per new window.
+
+    A popup is only dismissed while holding `WindowManager.input_lock`, so an input
+    sequence in progress on the main thread is never interleaved. Keys are only sent
+    once the popup is confirmed to be the foreground window.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        rules (list[PopupRule]): The popups to dismiss.
+        poll_interval (float): Seconds between sweeps when no window events are available.
+        stall_cost (float): Assumed seconds the main flow would have waited on a popup it did not expect.
+        dismissed (dict[str, int]): Dismissal count per rule name.
+        estimated_time_saved (float): `stall_cost` less the reaction time, summed over dismissals.
+            An estimate from the assumed stall cost, not a measurement.
+    """
+
+    def __init__(
+            self,
+            window_manager: Any,
+            pid: int,
+            rules: Iterable[PopupRule],
+            *,
+            poll_interval: float = 0.25,
+            stall_cost: float = 0.5,
+            clock: Callable[[], float] = time.monotonic,
+            logger: logging.Logger | None = None,
+        ) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.window_manager = window_manager
+        self.pid            = pid
+        self.rules          = list(rules)
+        self.poll_interval  = poll_interval
+        self.stall_cost     = stall_cost
+
+        self.dismissed:     dict[str, int] = {}
+        self.estimated_time_saved = 0.0
+
+        self._clock         = clock
+        # Exact matches on normalized titles only: a fuzzy match could dismiss a dialog the flow needs.
+        self._by_title      = {normalize_title(rule.title): rule for rule in self.rules if rule.title}
+        self._by_auto_id    = {rule.auto_id: rule for rule in self.rules if rule.auto_id and not rule.title}
+        self._auto_ids:     dict[int, str] = {}
+        self._first_seen:   dict[int, float] = {}
+        self._stop          = threading.Event()
+        self._thread:       threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running or not self.rules:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="PopupSuppressor", daemon=True)
+        self._thread.start()
+        self.logger.debug(f"Popup suppressor started for `{[rule.name for rule in self.rules]}`.")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.logger.debug(f"Popup suppressor stopped. {self.stats()}")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except Exception:
+                self.logger.debug("Popup sweep failed.", exc_info=True)
+
+            registry = self.window_manager.dialogs
+            if registry is not None:
+                registry.wait_for_change(self.poll_interval)
+            else:
+                self._stop.wait(self.poll_interval)
+
+    def _windows(self) -> list[tuple[int, str]]:
+        registry = self.window_manager.dialogs
+        if registry is not None and not self._by_auto_id:
+            return registry.windows()
+        return [
+            (record.handle, record.title)
+            for record in self.window_manager.window_backend.list_windows(self.pid)
+            if record.visible
+        ]
+
+    def _match(self, handle: int, title: str) -> PopupRule | None:
+        rule = self._by_title.get(normalize_title(title))
+        if rule is not None or not self._by_auto_id:
+            return rule
+        auto_id = self._auto_ids.get(handle)
+        if auto_id is None:
+            auto_id = self._auto_ids[handle] = self.window_manager.window_backend.automation_id(handle)
+        return self._by_auto_id.get(auto_id)
+
+    def sweep(self) -> int:
+        """
+        Dismisses every nuisance popup currently open.
+
+        :returns: The number of popups dismissed.
+        :rtype: int
+        """
+        windows = self._windows()
+        now = self._clock()
+        open_handles = {handle for handle, _ in windows}
+        self._first_seen = {h: t for h, t in self._first_seen.items() if h in open_handles}
+        self._auto_ids = {h: a for h, a in self._auto_ids.items() if h in open_handles}
+
+        backend = self.window_manager.window_backend
+        count = 0
+        for handle, title in windows:
+            rule = self._match(handle, title)
+            if rule is None:
+                continue
+            first_seen = self._first_seen.setdefault(handle, now)
+
+            # Wait for the main thread to finish its input sequence; retry next sweep otherwise.
+            if not self.window_manager.input_lock.acquire(timeout=self.poll_interval):
+                break
+            try:
+                if rule.keys:
+                    backend.activate(handle)
+                    # Keys go to whatever has focus; never send them anywhere but the popup.
+                    if backend.foreground() != handle:
+                        self.logger.debug(f"`{rule.name}` did not come to the foreground; retrying next sweep.")
+                        continue
+                    self.window_manager.send_input(list(rule.keys) if len(rule.keys) > 1 else rule.keys[0])
+                else:
+                    backend.close(handle)
+            except Exception as e:
+                self.logger.warning(f"Unable to dismiss `{rule.name}`: {e}")
+                continue
+            finally:
+                self.window_manager.input_lock.release()
+
+            self.window_manager.invalidate_snapshot()
+            reaction = self._clock() - first_seen
+            self.estimated_time_saved += max(0.0, self.stall_cost - reaction)
+            self.dismissed[rule.name] = self.dismissed.get(rule.name, 0) + 1
+            self._first_seen.pop(handle, None)
+            count += 1
+            self.logger.info(f"Dismissed nuisance popup `{rule.name}` `{reaction:.3f}`s after it appeared.")
+
+        return count
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "dismissed":    dict(self.dismissed),
+            "estimated_time_saved": round(self.estimated_time_saved, 3),
+        }
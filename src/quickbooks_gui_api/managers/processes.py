@@ -1,12 +1,145 @@
+import os
 import logging
 from pathlib import Path
+from typing import Any, Mapping, NamedTuple, Iterable, Literal
 import psutil
 
+from quickbooks_gui_api.managers.monitor import ResourceMonitor
+
+
+class TrackedProcess(NamedTuple):
+    """
+    A process known to `ProcessManager` by PID.
+    Attributes:
+        pid (int): The process id.
+        create_time (float): The process creation time, which tells a live process from a reused PID.
+        name (str): Lower-cased executable name.
+        exe (str): Lower-cased executable path, empty if unknown.
+    """
+    pid:            int
+    create_time:    float
+    name:           str
+    exe:            str = ""
+
+
+TerminationResult = Literal["terminated", "killed", "gone", "denied", "survived"]
+
+
+class TerminationOutcome(NamedTuple):
+    """
+    What happened to one process during `ProcessManager.terminate_all`.
+    Attributes:
+        pid (int): The process id.
+        name (str): The executable name.
+        result (TerminationResult): `terminated` (exited on request), `killed` (exited once killed),
+            `gone` (exited before it was signalled), `denied` (could not be signalled) or `survived` (still running).
+        exit_code (int | None): The exit code, if known.
+    """
+    pid:        int
+    name:       str
+    result:     TerminationResult
+    exit_code:  int | None = None
+
+
+# Priority class names, with the Windows priority class attribute and the POSIX nice value.
+PRIORITY_CLASSES: dict[str, tuple[str, int]] = {
+    "idle":         ("IDLE_PRIORITY_CLASS",          19),
+    "below_normal": ("BELOW_NORMAL_PRIORITY_CLASS",  10),
+    "normal":       ("NORMAL_PRIORITY_CLASS",         0),
+    "above_normal": ("ABOVE_NORMAL_PRIORITY_CLASS",  -5),
+    "high":         ("HIGH_PRIORITY_CLASS",         -10),
+}
+
+
+class ProcessProfile(NamedTuple):
+    """
+    Scheduling settings for a process. Unset fields leave the process as it is.
+    Attributes:
+        priority (str | None): One of `PRIORITY_CLASSES`.
+        affinity (tuple[int, ...]): Logical CPUs the process may run on. Empty for all.
+    """
+    priority:   str | None = None
+    affinity:   tuple[int, ...] = ()
+
+    @classmethod
+    def from_config(cls, entry: Mapping[str, Any]) -> "ProcessProfile":
+        """
+        Builds a profile from a config entry such as `{ priority = "above_normal", affinity = [0, 1] }`.
+
+        :raises ValueError: If the priority is unknown or the affinity is not a list of CPU indices.
+        """
+        priority = entry.get("priority") or None
+        if priority is not None:
+            priority = str(priority).lower()
+            if priority not in PRIORITY_CLASSES:
+                raise ValueError(f"Unknown priority `{priority}`. Expected one of `{list(PRIORITY_CLASSES)}`.")
+
+        affinity = entry.get("affinity") or ()
+        if not all(isinstance(cpu, int) and cpu >= 0 for cpu in affinity):
+            raise ValueError(f"Affinity `{affinity}` must be a list of CPU indices.")
+        return cls(priority, tuple(affinity))
+
+    @property
+    def is_empty(self) -> bool:
+        return self.priority is None and not self.affinity
+
+
+def apply_profile(proc: psutil.Process, profile: ProcessProfile, logger: logging.Logger | None = None) -> bool:
+    """
+    Applies `profile` to `proc`. Settings the platform or the account's privileges do
+    not allow are logged and skipped.
+
+    :returns: True if every setting in the profile was applied.
+    :rtype: bool
+    """
+    logger = logger or logging.getLogger(__name__)
+    applied = True
+
+    if profile.priority is not None:
+        attr, nice = PRIORITY_CLASSES[profile.priority]
+        try:
+            proc.nice(getattr(psutil, attr) if os.name == "nt" else nice)
+        except (psutil.AccessDenied, PermissionError):
+            logger.warning(f"Not permitted to set priority `{profile.priority}` on PID {proc.pid}.")
+            applied = False
+
+    if profile.affinity:
+        try:
+            available = set(range(psutil.cpu_count() or 1))
+            cpus = [cpu for cpu in profile.affinity if cpu in available]
+            if not cpus:
+                logger.warning(f"None of the CPUs `{list(profile.affinity)}` exist on this machine; affinity of PID {proc.pid} left unchanged.")
+                applied = False
+            else:
+                proc.cpu_affinity(cpus)
+        except AttributeError:
+            logger.warning("CPU affinity is not supported on this platform.")
+            applied = False
+        except (psutil.AccessDenied, PermissionError):
+            logger.warning(f"Not permitted to set the CPU affinity of PID {proc.pid}.")
+            applied = False
+
+    return applied
+
+
+def apply_current_profile(profile: ProcessProfile) -> None:
+    """
+    Applies `profile` to the calling process. Pass it as a worker pool initializer,
+    e.g. `Pool(initializer=apply_current_profile, initargs=(profile,))`, so workers
+    are scheduled like the automation process that started them.
+    """
+    if not profile.is_empty:
+        apply_profile(psutil.Process(), profile)
+
+
 class ProcessManager:
     """
     Manages Windows processes. Can start, stop, and detect.
+    Processes that are started or found are tracked by PID and creation time, so
+    later checks query that one process instead of scanning the whole machine.
     Attributes:
         logger (logging.Logger): Logger instance for logging operations.
+        tracked (dict[int, TrackedProcess]): Known processes by PID.
     """
 
     def __init__(self, 
@@ -21,6 +154,182 @@ class ProcessManager:
             else:
                 raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
 
+        self.tracked: dict[int, TrackedProcess] = {}
+
+    def track(self, proc: psutil.Process, exe: str | None = None) -> TrackedProcess | None:
+        """
+        Adds `proc` to the index.
+
+        :param proc: The process.
+        :type  proc: psutil.Process
+        :param exe: Its executable path, if already known; avoids a lookup.
+        :type  exe: str | None = None
+        :returns: The index entry, or None if the process is gone or inaccessible.
+        :rtype: TrackedProcess | None
+        """
+        try:
+            with proc.oneshot():
+                entry = TrackedProcess(
+                    pid         = proc.pid,
+                    create_time = proc.create_time(),
+                    name        = proc.name().lower(),
+                    exe         = (exe if exe is not None else proc.exe() or "").lower(),
+                )
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+        self.tracked[entry.pid] = entry
+        return entry
+
+    def is_alive(self, pid: int) -> bool:
+        """
+        Checks a tracked PID in O(1). A PID whose process exited, or was reused by
+        another process, is dropped from the index.
+        """
+        entry = self.tracked.get(pid)
+        if entry is None:
+            return False
+        try:
+            proc = psutil.Process(pid)
+            if proc.create_time() == entry.create_time and proc.status() != psutil.STATUS_ZOMBIE:
+                return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            pass
+        # Another thread may have dropped it already.
+        self.tracked.pop(pid, None)
+        return False
+
+    def _tracked_match(self, name: str | None, path_str: str | None) -> int | None:
+        for entry in list(self.tracked.values()):
+            if (name and entry.name == name) or (path_str and entry.exe == path_str):
+                if self.is_alive(entry.pid):
+                    return entry.pid
+        return None
+
+    def _scan(self, names: set[str], paths: set[str]) -> list[int]:
+        """Scans every process once, tracking and returning each match in scan order."""
+        # Compare names first; the slow and often denied `exe` lookup is only made
+        # for processes whose name matches one of the target paths' file names.
+        path_names = {Path(path).name for path in paths}
+
+        found: list[int] = []
+        for proc in psutil.process_iter(['name']):
+            try:
+                proc_name = (proc.info.get('name') or '').lower()
+
+                if proc_name in names:
+                    self.logger.debug(f"Found process by name: {proc_name}")
+                    self.track(proc)
+                    found.append(proc.pid)
+
+                elif proc_name in path_names:
+                    exe = (proc.exe() or '').lower()
+                    if exe in paths:
+                        self.logger.debug(f"Found process by path: {exe}")
+                        self.track(proc, exe)
+                        found.append(proc.pid)
+
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                # that process disappeared or we can’t inspect it — skip it
+                continue
+
+        return found
+
+    def find_pid(self,
+                 *,
+                 name: str | None = None,
+                 path: Path | None = None
+                 ) -> int | None:
+        """
+        Returns the PID of a running process with the given name or executable path.
+        Tracked processes are checked first; the machine is only scanned on a miss.
+
+        :param name: The name of the process to target.
+        :param path: The full executable path to target.
+        :returns: The PID, or None if no such process is running.
+        """
+        if not (name or path):
+            self.logger.debug("No name or path provided to find_pid()")
+            return None
+
+        name = name.lower() if name else None
+        path_str = str(path).lower() if path else None
+
+        pid = self._tracked_match(name, path_str)
+        if pid is None:
+            found = self._scan({name} if name else set(), {path_str} if path_str else set())
+            pid = found[0] if found else None
+        if pid is None:
+            self.logger.debug(f"No matching process found (name={name}, path={path})")
+        return pid
+
+    def pids(self,
+             names: Iterable[str] = (),
+             paths: Iterable[Path] = ()
+             ) -> list[int]:
+        """
+        Returns the PIDs of every running process with one of the given names or paths.
+        Tracked processes are checked first; the machine is scanned, once for all targets,
+        only when some name or path has no live tracked process.
+        """
+        name_set = {name.lower() for name in names}
+        path_set = {str(path).lower() for path in paths}
+
+        def _tracked() -> list[TrackedProcess]:
+            return [
+                entry for entry in list(self.tracked.values())
+                if (entry.name in name_set or entry.exe in path_set) and self.is_alive(entry.pid)
+            ]
+
+        live = _tracked()
+        if name_set - {entry.name for entry in live} or path_set - {entry.exe for entry in live}:
+            self._scan(name_set, path_set)
+            live = _tracked()
+        return [entry.pid for entry in live]
+
+    def monitor(self,
+                names: Iterable[str] = (),
+                paths: Iterable[Path] = (),
+                interval: float = 5.0) -> ResourceMonitor:
+        """
+        Starts sampling CPU, resident memory, handles and threads of the matching
+        processes every `interval` seconds on a background thread.
+
+        :returns: The running monitor. Call `stop()` on it when done.
+        :rtype: ResourceMonitor
+        """
+        names, paths = list(names), list(paths)
+        monitor = ResourceMonitor(lambda: self.pids(names, paths), interval=interval, logger=self.logger)
+        monitor.start()
+        return monitor
+
+    def set_profile(self,
+                    profile: ProcessProfile,
+                    *,
+                    names: Iterable[str] = (),
+                    paths: Iterable[Path] = (),
+                    pids: Iterable[int] = ()
+                    ) -> int:
+        """
+        Applies `profile` to the given processes and to every running process with one
+        of the given names or paths.
+
+        :returns: The number of processes the profile was fully applied to.
+        :rtype: int
+        """
+        if profile.is_empty:
+            return 0
+
+        targets = set(pids) | set(self.pids(names, paths))
+        applied = 0
+        for pid in targets:
+            try:
+                if apply_profile(psutil.Process(pid), profile, self.logger):
+                    applied += 1
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                continue
+        self.logger.debug(f"Applied `{profile}` to {applied} of {len(targets)} processes.")
+        return applied
+
     def is_running(self,
                    *,
                    name: str | None = None,
@@ -37,56 +346,113 @@ class ProcessManager:
             self.logger.debug("No name or path provided to is_running()")
             return False
 
-        name = name.lower() if name else None
-        path_str = str(path).lower() if path else None
+        return self.find_pid(name=name, path=path) is not None
 
-        for proc in psutil.process_iter(['name', 'exe']):
-            try:
-                info = proc.info
-                proc_name = info.get('name', '') or ''
-                proc_exe  = info.get('exe', '')  or ''
-
-                if name and proc_name.lower() == name:
-                    self.logger.debug(f"Found process by name: {name}")
-                    return True
-
-                if path_str and proc_exe.lower() == path_str:
-                    self.logger.debug(f"Found process by path: {path_str}")
-                    return True
-
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                # that process disappeared or we can’t inspect it — skip it
-                continue
-
-        self.logger.debug(f"No matching process found (name={name}, path={path})")
-        return False
-
-    def start(self, path: Path | None) -> bool:
+    def start(self, path: Path | None) -> int | None:
         """
-        Attempts to start the process at the given location.
+        Attempts to start the process at the given location and tracks it.
 
         :param location: The path to the process to target.
         :type location: Path
 
-        :returns: The success status.  
-        :rtype: bool        
+        :returns: The PID of the started process, or None on failure.
+        :rtype: int | None
         """
         if path is None:
             self.logger.error("No location provided to start()")
-            return False
+            return None
 
         exe = str(path)
         if not path.exists():
             self.logger.error(f"Executable not found: {exe}")
-            return False
+            return None
 
         try:
             proc = psutil.Popen([exe])
+            self.track(proc, exe)
             self.logger.info(f"Started process {exe} (PID {proc.pid})")
-            return True
+            return proc.pid
         except Exception:
             self.logger.exception(f"Failed to start process: {exe}")
-            return False
+            return None
+
+    def terminate_all(self,
+                      names: Iterable[str] = (),
+                      paths: Iterable[Path] = (),
+                      timeout: float = 5.0) -> list[TerminationOutcome]:
+        """
+        Terminate every process matching any of the given names or paths.
+
+        Matches are found in a single scan and all are asked to terminate at once.
+        They are then waited on together against one `timeout` deadline, and any
+        still running are killed and waited on for up to `timeout` again.
+
+        :param names: Executable names to target, case-insensitive.
+        :type names: Iterable[str]
+        :param paths: Full executable paths to target.
+        :type paths: Iterable[Path]
+        :param timeout: Seconds to wait for the processes to exit, before and after killing.
+        :type timeout: float = 5.0
+
+        :returns: The outcome for every matched process.
+        :rtype: list[TerminationOutcome]
+        """
+        name_set = {name.lower() for name in names}
+        path_set = {str(path).lower() for path in paths}
+        path_names = {Path(path).name for path in path_set}
+
+        if not (name_set or path_set):
+            self.logger.debug("No names or paths provided to terminate_all()")
+            return []
+
+        outcomes: dict[int, TerminationOutcome] = {}
+        names_by_pid: dict[int, str] = {}
+        targets: list[psutil.Process] = []
+
+        for proc in psutil.process_iter(['name']):
+            try:
+                proc_name = proc.info.get('name') or ''
+                lowered = proc_name.lower()
+                if lowered not in name_set and not (lowered in path_names and (proc.exe() or '').lower() in path_set):
+                    continue
+                names_by_pid[proc.pid] = proc_name
+                proc.terminate()
+                targets.append(proc)
+                self.logger.debug(f"Terminating PID {proc.pid} ({proc_name})")
+            except psutil.NoSuchProcess:
+                if proc.pid in names_by_pid:
+                    outcomes[proc.pid] = TerminationOutcome(proc.pid, names_by_pid[proc.pid], "gone")
+            except psutil.AccessDenied:
+                if proc.pid in names_by_pid:
+                    outcomes[proc.pid] = TerminationOutcome(proc.pid, names_by_pid[proc.pid], "denied")
+
+        gone, alive = psutil.wait_procs(targets, timeout=timeout)
+        for proc in gone:
+            outcomes[proc.pid] = TerminationOutcome(proc.pid, names_by_pid[proc.pid], "terminated", proc.returncode)
+
+        if alive:
+            self.logger.warning(f"PIDs {[p.pid for p in alive]} did not exit; killing")
+            for proc in alive:
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+                except psutil.AccessDenied:
+                    outcomes[proc.pid] = TerminationOutcome(proc.pid, names_by_pid[proc.pid], "denied")
+
+            killed, survivors = psutil.wait_procs([p for p in alive if p.pid not in outcomes], timeout=timeout)
+            for proc in killed:
+                outcomes[proc.pid] = TerminationOutcome(proc.pid, names_by_pid[proc.pid], "killed", proc.returncode)
+            for proc in survivors:
+                outcomes[proc.pid] = TerminationOutcome(proc.pid, names_by_pid[proc.pid], "survived")
+
+        for pid, outcome in outcomes.items():
+            if outcome.result != "survived":
+                self.tracked.pop(pid, None)
+
+        if not outcomes:
+            self.logger.debug(f"No processes matched (names={sorted(name_set)}, paths={sorted(path_set)})")
+        return list(outcomes.values())
 
     def terminate(self,
                   name: str | None = None,
@@ -107,39 +473,8 @@ class ProcessManager:
             self.logger.debug("No name or location provided to terminate()")
             return False
 
-        name = name.lower() if name else None
-        path = str(location).lower() if location else None
-
-        found_any = False
-        for proc in psutil.process_iter(['pid', 'name', 'exe']):
-            info = proc.info
-            try:
-                match = (
-                    (name and info.get('name') and info['name'].lower() == name)
-                    or
-                    (path and info.get('exe') and info['exe'].lower() == path)
-                )
-                if not match:
-                    continue
-
-                found_any = True
-                p = psutil.Process(info['pid'])
-                self.logger.debug(f"Terminating PID {p.pid} ({info.get('name')})")
-                p.terminate()
-                try:
-                    p.wait(timeout=5)
-                except psutil.TimeoutExpired:
-                    self.logger.warning(f"PID {p.pid} did not exit; killing")
-                    p.kill()
-                    p.wait()
-
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                # already gone or cannot terminate, skip
-                continue
-            except Exception:
-                self.logger.exception(f"Error terminating PID {info.get('pid')}")
-                continue
-
-        if not found_any:
-            self.logger.debug(f"No processes matched (name={name}, path={path})")
-        return found_any
+        outcomes = self.terminate_all(
+            names = [name] if name else (),
+            paths = [location] if location else (),
+        )
+        return any(outcome.result in ("terminated", "killed", "gone") for outcome in outcomes)
@@ -0,0 +1,158 @@
+# src\quickbooks_gui_api\managers\readiness.py
+
+from __future__ import annotations
+
+import time
+import logging
+
+from typing import Callable, Iterable, NamedTuple, Sequence
+
+
+class ProbeResult(NamedTuple):
+    """
+    The outcome of waiting on one readiness probe.
+    Attributes:
+        name (str): The phase the probe guards, e.g. `QuickBooks started`.
+        ready (bool): True if the probe passed before the ceiling.
+        elapsed (float): Seconds spent waiting.
+        attempts (int): Number of times the probe was evaluated.
+    """
+    name:       str
+    ready:      bool
+    elapsed:    float
+    attempts:   int
+
+
+class ReadinessGate:
+    """
+    Waits for a phase to be ready by polling a probe, with the phase's configured
+    delay as a hard ceiling. A phase that is ready early ends the wait early; one
+    that never reports ready costs no more than the old fixed delay.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        interval (float): Seconds between probe evaluations.
+        history (list[ProbeResult]): Every wait so far, in order.
+    """
+
+    def __init__(
+            self,
+            *,
+            interval: float = 0.25,
+            clock: Callable[[], float] = time.monotonic,
+            sleep: Callable[[float], None] = time.sleep,
+            logger: logging.Logger | None = None,
+        ) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.interval   = interval
+        self.history:   list[ProbeResult] = []
+
+        self._clock = clock
+        self._sleep = sleep
+
+    def wait(self, name: str, probe: Callable[[], bool], ceiling: float) -> ProbeResult:
+        """
+        Polls `probe` until it returns True or `ceiling` seconds pass. A probe that
+        raises counts as not ready, since the application may still be starting.
+
+        :param name: The phase being waited on, for logging.
+        :type  name: str
+        :param probe: Returns True once the phase is ready.
+        :type  probe: Callable[[], bool]
+        :param ceiling: Maximum seconds to wait.
+        :type  ceiling: float
+        :returns: The outcome of the wait.
+        :rtype: ProbeResult
+        """
+        start = self._clock()
+        deadline = start + ceiling
+        attempts = 0
+
+        while True:
+            attempts += 1
+            try:
+                ready = bool(probe())
+            except Exception as e:
+                self.logger.debug(f"Readiness probe `{name}` raised: {e}")
+                ready = False
+
+            now = self._clock()
+            if ready or now >= deadline:
+                break
+            self._sleep(min(self.interval, deadline - now))
+
+        result = ProbeResult(name, ready, now - start, attempts)
+        self.history.append(result)
+
+        if ready:
+            self.logger.debug(f"`{name}` ready after `{result.elapsed:.2f}`s (ceiling `{ceiling}`s, `{attempts}` probes).")
+        else:
+            self.logger.warning(f"`{name}` not confirmed ready within the `{ceiling}`s ceiling. Continuing.")
+        return result
+
+
+def company_file_loaded(titles: Sequence[str], company: str, is_login: Callable[[str], bool]) -> bool:
+    """
+    Decides whether QuickBooks has finished opening a company file. The selection
+    window closes while the file is still opening, so that alone is too early: the
+    file is loaded once its login dialog shows or, when it needs no login, once the
+    main window's title names the company.
+
+    :param titles: Dialog titles, main window first, as from `WindowManager.get_all_dialog_titles`.
+    :type  titles: Sequence[str]
+    :param company: The company file name.
+    :type  company: str
+    :param is_login: Returns True for the login dialog's title.
+    :type  is_login: Callable[[str], bool]
+    :rtype: bool
+    """
+    if any(is_login(title) for title in titles):
+        return True
+    return bool(titles) and company.lower() in titles[0].lower()
+
+
+class ScriptedProbe:
+    """
+    Fake probe that returns, or raises, scripted outcomes in order and repeats the
+    last one once exhausted.
+    Attributes:
+        calls (int): Number of evaluations so far.
+    """
+
+    def __init__(self, outcomes: Iterable[bool | BaseException]) -> None:
+        self._outcomes = list(outcomes)
+        if not self._outcomes:
+            raise ValueError("At least one outcome must be provided.")
+        self.calls = 0
+
+    def __call__(self) -> bool:
+        outcome = self._outcomes[min(self.calls, len(self._outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+class FakeClock:
+    """
+    Manually advanced clock. Pass the instance as `clock` and its `sleep` as `sleep`,
+    so waits complete instantly while reporting the time they would have taken.
+    Attributes:
+        now (float): The current time.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += max(0.0, seconds)
+
+    advance = sleep
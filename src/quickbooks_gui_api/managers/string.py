@@ -1,9 +1,567 @@
 # src\quickbooks_gui_api\managers\string.py
 
+import re
+import heapq
+import numpy
 import logging
 
-from rapidfuzz import fuzz
-from typing import Tuple, overload
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from rapidfuzz import fuzz, process
+from typing import Tuple, overload, Iterable, Iterator, NamedTuple, Mapping, Final
+
+
+# Substitution costs for single characters OCR commonly confuses. Pairs are symmetric.
+OCR_CONFUSION_COSTS: Final[dict[tuple[str, str], float]] = {
+    ("0", "O"): 0.10,   ("0", "o"): 0.20,   ("0", "D"): 0.30,   ("0", "Q"): 0.35,
+    ("1", "l"): 0.10,   ("1", "I"): 0.10,   ("l", "I"): 0.10,   ("1", "|"): 0.10,
+    ("l", "|"): 0.10,   ("I", "|"): 0.10,   ("1", "i"): 0.30,   ("l", "i"): 0.30,
+    ("5", "S"): 0.15,   ("5", "s"): 0.25,   ("8", "B"): 0.20,   ("2", "Z"): 0.25,
+    ("6", "G"): 0.30,   ("9", "g"): 0.30,   ("9", "q"): 0.35,   ("4", "A"): 0.40,
+    ("7", "T"): 0.40,   ("c", "e"): 0.40,   ("u", "v"): 0.40,   ("n", "h"): 0.45,
+    (",", "."): 0.20,   (":", ";"): 0.20,   ("'", "`"): 0.10,   ("-", "_"): 0.20,
+    ("-", "~"): 0.30,   ("-", "\u2014"): 0.10,
+}
+
+# Character sequences OCR splits or merges. Pairs are symmetric.
+OCR_SEQUENCE_COSTS: Final[dict[tuple[str, str], float]] = {
+    ("rn", "m"): 0.15,  ("cl", "d"): 0.30,  ("vv", "w"): 0.15,  ("VV", "W"): 0.15,
+    ("\\/\\/", "W"): 0.20, ("ri", "n"): 0.40, ("li", "h"): 0.45, ("nn", "m"): 0.45,
+}
+
+# Characters OCR picks up from borders and selection edges around the text. Stripped
+# from the ends of OCR'd input unless the expected text ends with them too.
+OCR_EDGE_NOISE: Final[str] = " |[]()'`.,:;_-~"
+
+# The most any match may cost: less than one plain edit, since a single substituted,
+# missing or extra character is exactly what separates look-alike names.
+OCR_MAX_COST: Final[float] = 0.9
+# The least any match is allowed, so a short name still tolerates one likely confusion.
+OCR_MIN_COST: Final[float] = 0.3
+
+# Sample OCR output paired with the on-screen text it was read from. Used to
+# calibrate `OCRScorer`: real matches must cost little per character while
+# look-alike names that differ in significant characters must stay apart.
+OCR_CALIBRATION_MATCHES: Final[list[tuple[str, str]]] = [
+    ("Microsoft Print to PDF on P0RTPR0MPT:",   "Microsoft Print to PDF on PORTPROMPT:"),
+    ("Microsoft Print to PDF on PORTPROMPT;",   "Microsoft Print to PDF on PORTPROMPT:"),
+    ("Cornpany File 2O24.QBW",                  "Company File 2024.QBW"),
+    ("Hel1o World!!",                           "Hello World!!"),
+    ("Data Export - A1l Invoices - V 3",        "Data Export - All Invoices - V 3"),
+    ("Manufacturing and Whole5ale",             "Manufacturing and Wholesale"),
+    ("ACME lndustries, Inc.",                   "ACME Industries, Inc."),
+]
+OCR_CALIBRATION_DISTINCT: Final[list[tuple[str, str]]] = [
+    ("Company File 2023.QBW",                   "Company File 2024.QBW"),
+    ("Data Export - All Invoices - V 2",        "Data Export - All Invoices - V 3"),
+    ("Microsoft Print to PDF on PORTPROMPT:",   "Microsoft XPS Document Writer"),
+    ("ACME Industries, Inc.",                   "ACNE Industries, Inc."),
+    ("Hello World!!",                           "Yellow World!!"),
+]
+
+
+class IndexMatch(NamedTuple):
+    """A single candidate returned by a `StringIndex` lookup."""
+    entry:      str
+    confidence: float
+
+
+class IndexResult(NamedTuple):
+    """The best and runner-up candidates of a `StringIndex` lookup."""
+    best:       IndexMatch | None
+    runner_up:  IndexMatch | None
+
+    @property
+    def margin(self) -> float:
+        """Confidence gap between the best and runner-up candidates."""
+        if self.best is None:
+            return 0.0
+        if self.runner_up is None:
+            return self.best.confidence
+        return self.best.confidence - self.runner_up.confidence
+
+    def is_unambiguous(self, threshold: float, min_margin: float = 0.0) -> bool:
+        """
+        Determines if the best candidate is confident enough and clearly ahead of the runner-up.
+
+        :param threshold:   Minimum confidence the best candidate must reach.
+        :type  threshold:   float
+        :param min_margin:  Minimum lead the best candidate must hold over the runner-up.
+        :type  min_margin:  float = 0.0
+        :returns: True if the lookup resolved to a single entry, False otherwise.
+        :rtype: bool
+        """
+        if self.best is None or self.best.confidence < threshold:
+            return False
+        # An exact hit is never ambiguous, even if a near duplicate exists.
+        if self.best.confidence >= 100.0:
+            return True
+        return self.margin >= min_margin
+
+
+class StringIndex:
+    """
+    Persistent fuzzy lookup index for large name catalogs (memorized reports, company files).
+    Entries are blocked on shared character n-grams so only a handful of candidates
+    are rescored with `fuzz.ratio` on each lookup. Supports incremental add and remove.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        ngram_size (int): Length of the character n-grams used for blocking.
+        max_candidates (int): Maximum number of blocked candidates rescored per lookup.
+    """
+
+    def __init__(
+            self,
+            entries: Iterable[str] = (),
+            *,
+            ngram_size: int = 3,
+            max_candidates: int = 32,
+            logger: logging.Logger | None = None,
+        ) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        if ngram_size < 1:
+            raise ValueError("Parameter `ngram_size` must be at least 1.")
+        if max_candidates < 2:
+            raise ValueError("Parameter `max_candidates` must be at least 2.")
+
+        self.ngram_size     = ngram_size
+        self.max_candidates = max_candidates
+
+        # normalized key -> original entry
+        self._entries:  dict[str, str] = {}
+        # n-gram -> normalized keys containing it
+        self._postings: dict[str, set[str]] = {}
+
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, entry: object) -> bool:
+        return isinstance(entry, str) and self.normalize(entry) in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries.values())
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Casefold and collapse whitespace so lookups ignore cosmetic differences."""
+        return re.sub(r"\s+", " ", text).strip().casefold()
+
+    def _ngrams(self, key: str) -> set[str]:
+        padded = f" {key} "
+        if len(padded) <= self.ngram_size:
+            return {padded}
+        return {padded[i:i + self.ngram_size] for i in range(len(padded) - self.ngram_size + 1)}
+
+    def add(self, entry: str) -> None:
+        """
+        Adds an entry to the index. Re-adding an entry replaces the stored original.
+
+        :param entry: The string to index.
+        :type  entry: str
+        """
+        key = self.normalize(entry)
+        if not key:
+            raise ValueError("Cannot index an empty string.")
+
+        self._entries[key] = entry
+        for gram in self._ngrams(key):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, entry: str) -> bool:
+        """
+        Removes an entry from the index.
+
+        :param entry: The string to remove.
+        :type  entry: str
+        :returns: True if the entry was indexed, False otherwise.
+        :rtype: bool
+        """
+        key = self.normalize(entry)
+        if self._entries.pop(key, None) is None:
+            return False
+
+        for gram in self._ngrams(key):
+            keys = self._postings.get(gram)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
+        return True
+
+    def _candidates(self, key: str) -> list[str]:
+        counts: Counter[str] = Counter()
+        for gram in self._ngrams(key):
+            counts.update(self._postings.get(gram, ()))
+
+        if not counts:
+            # Nothing shares a single n-gram, so fall back to every entry.
+            return list(self._entries)
+
+        if len(counts) <= self.max_candidates:
+            return list(counts)
+        return heapq.nlargest(self.max_candidates, counts, key=counts.__getitem__)
+
+    def lookup(self, query: str) -> IndexResult:
+        """
+        Resolves `query` to the best and runner-up indexed entries.
+
+        :param query: The string to resolve.
+        :type  query: str
+        :returns: The best and runner-up candidates with their confidence.
+        :rtype: IndexResult
+        """
+        key = self.normalize(query)
+        if not key or not self._entries:
+            return IndexResult(None, None)
+
+        ranked = process.extract(key, self._candidates(key), scorer=fuzz.ratio, limit=2)
+        matches = [IndexMatch(self._entries[choice], score) for choice, score, _ in ranked]
+
+        best        = matches[0] if matches else None
+        runner_up   = matches[1] if len(matches) > 1 else None
+        self.logger.debug(f"Resolved '{query}': best = {best}, runner-up = {runner_up}")
+        return IndexResult(best, runner_up)
+
+
+@lru_cache(maxsize=1024)
+def normalize_title(title: str) -> str:
+    """Casefold a window title, replace punctuation with spaces and collapse whitespace."""
+    return " ".join(re.sub(r"[^\w\s]", " ", title.casefold()).split())
+
+
+class TitleMatcher:
+    """
+    Identifies window and dialog titles against a set of known dialogs.
+    Known titles are normalized once and kept in a hash map, so a lookup is an
+    O(1) exact hit in the common case. Fuzzy scoring only runs on a miss, and
+    every result is memoized in a bounded LRU.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        threshold (float): Minimum `fuzz.ratio` confidence for a fuzzy match.
+    """
+
+    def __init__(
+            self,
+            known: Mapping[str, str] | Iterable[str] = (),
+            *,
+            threshold: float = 95.0,
+            cache_size: int = 256,
+            logger: logging.Logger | None = None,
+        ) -> None:
+        """
+        :param known:       Known dialogs as a `{dialog_id: title}` mapping, or titles that double as their own id.
+        :type  known:       Mapping[str, str] | Iterable[str] = ()
+        :param threshold:   Minimum confidence for a fuzzy match.
+        :type  threshold:   float = 95.0
+        :param cache_size:  Maximum number of memoized lookups.
+        :type  cache_size:  int = 256
+        """
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        if cache_size < 1:
+            raise ValueError("Parameter `cache_size` must be at least 1.")
+
+        self.threshold      = threshold
+        self._cache_size    = cache_size
+
+        # normalized title -> dialog id
+        self._known:    dict[str, str] = {}
+        # raw title -> dialog id (or None for an unknown title)
+        self._memo:     OrderedDict[str, str | None] = OrderedDict()
+
+        items = known.items() if isinstance(known, Mapping) else ((title, title) for title in known)
+        for dialog_id, title in items:
+            self.register(title, dialog_id)
+
+    def register(self, title: str, dialog_id: str | None = None) -> None:
+        """
+        Registers a known dialog title.
+
+        :param title:       The dialog's title as QuickBooks displays it.
+        :type  title:       str
+        :param dialog_id:   Identifier returned on a match. Defaults to `title`.
+        :type  dialog_id:   str | None = None
+        """
+        key = normalize_title(title)
+        if not key:
+            raise ValueError("Cannot register an empty title.")
+
+        self._known[key] = title if dialog_id is None else dialog_id
+        self._memo.clear()
+
+    def unregister(self, dialog_id: str) -> None:
+        """Removes every title registered under `dialog_id`."""
+        self._known = {key: value for key, value in self._known.items() if value != dialog_id}
+        self._memo.clear()
+
+    def identify(self, title: str | None) -> str | None:
+        """
+        Resolves a window title to the id of the known dialog it represents.
+
+        :param title: The title to identify.
+        :type  title: str | None
+        :returns: The matching dialog id, or None if the title is unknown.
+        :rtype: str | None
+        """
+        if not title:
+            return None
+
+        if title in self._memo:
+            self._memo.move_to_end(title)
+            return self._memo[title]
+
+        key = normalize_title(title)
+        dialog_id = self._known.get(key)
+
+        if dialog_id is None and key and self._known:
+            best = process.extractOne(key, self._known.keys(), scorer=fuzz.ratio, score_cutoff=self.threshold)
+            if best is not None:
+                dialog_id = self._known[best[0]]
+                self.logger.debug(f"Fuzzy matched title '{title}' to '{dialog_id}': Score = {best[1]}")
+
+        self._memo[title] = dialog_id
+        if len(self._memo) > self._cache_size:
+            self._memo.popitem(last=False)
+
+        return dialog_id
+
+    def matches(self, title: str | None, dialog_id: str) -> bool:
+        """Determines if `title` identifies as `dialog_id`."""
+        return self.identify(title) == dialog_id
+
+    def any_matches(self, titles: Iterable[str], dialog_id: str) -> bool:
+        """Determines if any of `titles` identifies as `dialog_id`."""
+        return any(self.identify(title) == dialog_id for title in titles)
+
+
+class OCRScorer:
+    """
+    Similarity scorer for OCR'd text. Uses a weighted edit distance where the
+    typical OCR confusions (0/O, 1/l/I, rn/m, 5/S, ...) cost a fraction of an
+    edit, while substituting one digit for another costs as much as deleting
+    and inserting it, since OCR rarely confuses two digits and a different digit
+    usually means a different name. Rows of the distance matrix are computed as
+    numpy vectors.
+    Attributes:
+        case_cost (float): Cost of substituting a character for itself in a different case.
+        digit_cost (float): Cost of substituting one digit for a different digit.
+    """
+
+    def __init__(
+            self,
+            confusions: Mapping[tuple[str, str], float] = OCR_CONFUSION_COSTS,
+            sequences: Mapping[tuple[str, str], float] = OCR_SEQUENCE_COSTS,
+            *,
+            case_cost: float = 0.25,
+            digit_cost: float = 2.0,
+        ) -> None:
+        self.case_cost  = case_cost
+        self.digit_cost = digit_cost
+
+        # char -> {confused char: cost}
+        self._confusions: dict[str, dict[str, float]] = {}
+        for (a, b), cost in confusions.items():
+            self._confusions.setdefault(a, {})[b] = cost
+            self._confusions.setdefault(b, {})[a] = cost
+
+        # (sequence read, sequence expected, cost), both directions
+        self._sequences: list[tuple[str, str, float]] = []
+        for (a, b), cost in sequences.items():
+            self._sequences.append((a, b, cost))
+            self._sequences.append((b, a, cost))
+
+    @staticmethod
+    def _clean(text: str) -> str:
+        return " ".join(text.split())
+
+    @staticmethod
+    def _trim_edge_noise(text: str, target: str) -> str:
+        start, end = 0, len(text)
+        while start < end and text[start] in OCR_EDGE_NOISE and not target.startswith(text[start]):
+            start += 1
+        while end > start and text[end - 1] in OCR_EDGE_NOISE and not target.endswith(text[end - 1]):
+            end -= 1
+        return text[start:end]
+
+    def _substitution_costs(self, char: str, codes: numpy.ndarray, lowered: numpy.ndarray) -> numpy.ndarray:
+        costs = numpy.where(codes == ord(char), 0.0, 1.0)
+
+        if self.case_cost < 1.0:
+            costs[(lowered == ord(char.lower())) & (costs > 0)] = self.case_cost
+
+        if char.isdigit():
+            digits = (codes >= ord("0")) & (codes <= ord("9")) & (costs > 0)
+            costs[digits] = self.digit_cost
+
+        for other, cost in self._confusions.get(char, {}).items():
+            mask = codes == ord(other)
+            costs[mask] = numpy.minimum(costs[mask], cost)
+
+        return costs
+
+    def distance(self, input: str, target: str) -> float:
+        """
+        Computes the weighted edit distance between OCR'd `input` and `target`.
+
+        :param input: The OCR'd text.
+        :type  input: str
+        :param target: The text expected on screen.
+        :type  target: str
+        :returns: The weighted edit distance. Insertions and deletions cost 1, except `OCR_EDGE_NOISE` at the ends of `input`.
+        :rtype: float
+        """
+        a = self._clean(input)
+        b = self._clean(target)
+        trimmed = self._trim_edge_noise(a, b)
+        if trimmed != a:
+            # A stray border character is free, but a misread last character (`;` for `:`) is cheaper kept.
+            return min(self._distance(a, b), self._distance(trimmed, b))
+        return self._distance(a, b)
+
+    def _distance(self, a: str, b: str) -> float:
+        m = len(b)
+
+        if not a:
+            return float(m)
+        if not b:
+            return float(len(a))
+
+        codes   = numpy.fromiter((ord(c) for c in b), dtype=numpy.int64, count=m)
+        lowered = numpy.fromiter((ord(c.lower()[0]) for c in b), dtype=numpy.int64, count=m)
+        columns = numpy.arange(m + 1, dtype=numpy.float64)
+
+        # For each sequence confusion, the target columns `j` where b[:j] ends with the expected sequence.
+        sequence_masks = [
+            (read, expected, cost, numpy.array([j >= len(expected) and b.endswith(expected, 0, j) for j in range(m + 1)]))
+            for read, expected, cost in self._sequences
+            if expected in b and read in a
+        ]
+        depth = max((len(read) for read, *_ in sequence_masks), default=1)
+
+        substitution_cache: dict[str, numpy.ndarray] = {}
+        rows: list[numpy.ndarray] = [columns.copy()]
+
+        for i in range(1, len(a) + 1):
+            char = a[i - 1]
+            substitution = substitution_cache.get(char)
+            if substitution is None:
+                substitution = substitution_cache[char] = self._substitution_costs(char, codes, lowered)
+
+            previous = rows[-1]
+            row = numpy.empty(m + 1)
+            row[0] = previous[0] + 1.0
+            row[1:] = numpy.minimum(previous[:-1] + substitution, previous[1:] + 1.0)
+
+            for read, expected, cost, mask in sequence_masks:
+                span = len(read)
+                if i < span or not a.endswith(read, 0, i):
+                    continue
+                shift = len(expected)
+                origin = rows[-span]
+                candidate = numpy.full(m + 1, numpy.inf)
+                candidate[shift:] = origin[:m + 1 - shift] + cost
+                row = numpy.where(mask, numpy.minimum(row, candidate), row)
+
+            # Insertions chain along the row: row[j] = min(row[j], row[j-1] + 1).
+            row = numpy.minimum.accumulate(row - columns) + columns
+
+            rows.append(row)
+            if len(rows) > depth:
+                rows.pop(0)
+
+        return float(rows[-1][m])
+
+    def score(self, input: str, target: str) -> float:
+        """
+        Scores the similarity of OCR'd `input` to `target` on the same 0-100 scale as `fuzz.ratio`.
+
+        :param input: The OCR'd text.
+        :type  input: str
+        :param target: The text expected on screen.
+        :type  target: str
+        :returns: Similarity score between 0 and 100.
+        :rtype: float
+        """
+        length = max(len(self._clean(input)), len(self._clean(target)))
+        if length == 0:
+            return 100.0
+        return max(0.0, 100.0 * (1.0 - self.distance(input, target) / length))
+
+    def cost_per_char(self, input: str, target: str) -> float:
+        """Returns the weighted edit distance of `input` from `target` per character of `target`."""
+        return self.distance(input, target) / max(1, len(self._clean(target)))
+
+    def is_match(
+            self,
+            input: str,
+            target: str,
+            max_cost_per_char: float,
+            max_cost: float = OCR_MAX_COST,
+            min_cost: float = OCR_MIN_COST,
+        ) -> bool:
+        """
+        Determines if OCR'd `input` reads as `target`. The allowed distance grows with
+        the length of `target`, since a long name collects more confusions, from
+        `min_cost` up to `max_cost`.
+
+        :param input: The OCR'd text.
+        :type  input: str
+        :param target: The text expected on screen.
+        :type  target: str
+        :param max_cost_per_char: Allowed weighted edit distance per character of `target`.
+        :type  max_cost_per_char: float
+        :param max_cost: Allowed weighted edit distance for any length.
+        :type  max_cost: float = OCR_MAX_COST
+        :param min_cost: Allowed weighted edit distance for the shortest names.
+        :type  min_cost: float = OCR_MIN_COST
+        :rtype: bool
+        """
+        allowed = min(max(max_cost_per_char * len(self._clean(target)), min_cost), max_cost)
+        return self.distance(input, target) <= allowed
+
+    def calibrate(
+            self,
+            matches: Iterable[tuple[str, str]] = OCR_CALIBRATION_MATCHES,
+            distinct: Iterable[tuple[str, str]] = OCR_CALIBRATION_DISTINCT,
+        ) -> tuple[float, float, float]:
+        """
+        Derives the allowed cost per character from sample OCR output.
+
+        :param matches: (OCR output, on-screen text) pairs that must match.
+        :type  matches: Iterable[tuple[str, str]]
+        :param distinct: (OCR output, on-screen text) pairs of look-alike names that must not match.
+        :type  distinct: Iterable[tuple[str, str]]
+        :returns: Suggested cost per character, highest matching cost, lowest distinct cost.
+        :rtype: tuple[float, float, float]
+        :raises ValueError: If the samples cannot be separated by any cost.
+        """
+        highest_match   = max(self.cost_per_char(ocr, text) for ocr, text in matches)
+        lowest_distinct = min(self.cost_per_char(ocr, text) for ocr, text in distinct)
+
+        if highest_match >= lowest_distinct:
+            raise ValueError(f"Calibration samples overlap: highest match `{highest_match}` >= lowest distinct `{lowest_distinct}`.")
+
+        return (highest_match + lowest_distinct) / 2, highest_match, lowest_distinct
+
+
+# Calibrated once, on import.
+OCR_SCORER: Final[OCRScorer] = OCRScorer()
+OCR_MAX_COST_PER_CHAR, _, _ = OCR_SCORER.calibrate()
 
 
 class StringManager:
@@ -19,6 +577,8 @@ class StringManager:
         else:
             raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
 
+        self.ocr_scorer = OCR_SCORER
+
     def rank_matches(
             self, 
             options: list[str] , 
@@ -39,12 +599,86 @@ class StringManager:
 
         return results
     
+    def build_index(
+            self,
+            options: Iterable[str],
+            *,
+            ngram_size: int = 3,
+            max_candidates: int = 32,
+            ) -> StringIndex:
+        """
+        Builds a persistent `StringIndex` over `options` for repeated lookups.
+
+        :param options: The catalog of strings to index.
+        :type  options: Iterable[str]
+        :param ngram_size: Length of the character n-grams used for blocking.
+        :type  ngram_size: int = 3
+        :param max_candidates: Maximum number of blocked candidates rescored per lookup.
+        :type  max_candidates: int = 32
+        :returns: The populated index.
+        :rtype: StringIndex
+        """
+        return StringIndex(options, ngram_size=ngram_size, max_candidates=max_candidates, logger=self.logger)
+
+    def title_matcher(
+            self,
+            known: Mapping[str, str] | Iterable[str],
+            threshold: float = 95.0,
+            ) -> TitleMatcher:
+        """
+        Builds a `TitleMatcher` for repeated dialog title checks.
+
+        :param known: Known dialogs as a `{dialog_id: title}` mapping, or titles that double as their own id.
+        :type  known: Mapping[str, str] | Iterable[str]
+        :param threshold: Minimum confidence for a fuzzy match.
+        :type  threshold: float = 95.0
+        :returns: The populated matcher.
+        :rtype: TitleMatcher
+        """
+        return TitleMatcher(known, threshold=threshold, logger=self.logger)
+
     def match(
             self, 
             input: str, 
             target: str
             ) -> float:
         return fuzz.ratio(input,target)
+
+    def ocr_match(
+            self, 
+            input: str, 
+            target: str
+            ) -> float:
+        """
+        Scores OCR'd text against its expected value, discounting typical OCR confusions.
+
+        :param input: The OCR'd text.
+        :type  input: str
+        :param target: The text expected on screen.
+        :type  target: str
+        :returns: Similarity score between 0 and 100.
+        :rtype: float
+        """
+        confidence = self.ocr_scorer.score(input, target)
+        self.logger.debug(f"OCR comparing '{input.strip()}' to '{target}': Score = {confidence}")
+        return confidence
+
+    def is_ocr_match(
+            self,
+            input: str,
+            target: str
+            ) -> bool:
+        """
+        Determines if OCR'd text reads as its expected value, allowing the calibrated
+        cost per character of typical OCR confusions, up to less than one plain edit.
+
+        :param input: The OCR'd text.
+        :type  input: str
+        :param target: The text expected on screen.
+        :type  target: str
+        :rtype: bool
+        """
+        return self.ocr_scorer.is_match(input, target, OCR_MAX_COST_PER_CHAR)
         
     @overload        
     def is_match(self,threshold: float = 100,*,input: str, target: str,) -> bool: ...
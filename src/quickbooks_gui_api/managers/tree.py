@@ -0,0 +1,314 @@
+# src\quickbooks_gui_api\managers\tree.py
+
+from __future__ import annotations
+
+import time
+import logging
+import threading
+
+from abc    import ABC, abstractmethod
+from typing import Any, Callable, Iterator, Literal, NamedTuple, Sequence
+
+from quickbooks_gui_api.managers.manager_exceptions import WindowNotFound
+
+
+TreeScope = Literal["windows", "full"]
+
+
+class TreeNode(NamedTuple):
+    """
+    Immutable snapshot of a single UI Automation element.
+    Attributes:
+        name (str): The element's name (window text).
+        class_name (str): The element's window class name.
+        control_type (str): The element's UIA control type, e.g. `Window`, `Pane`, `Edit`.
+        handle (int): The native window handle, 0 for windowless elements.
+        rectangle (tuple[int, int, int, int]): Bounding rectangle as (left, top, right, bottom).
+        depth (int): Distance from the snapshot root, which has depth 0.
+        enabled (bool): Whether the element accepts input.
+        children (tuple[TreeNode, ...]): Child nodes in UIA order.
+    """
+    name:           str
+    class_name:     str
+    control_type:   str
+    handle:         int
+    rectangle:      tuple[int, int, int, int]
+    depth:          int
+    enabled:        bool = True
+    children:       tuple["TreeNode", ...] = ()
+
+    @property
+    def is_dialog(self) -> bool:
+        """UIA `Window` controls are the ones pywinauto reports as `Dialog`."""
+        return self.control_type == "Window" and bool(self.name.strip())
+
+    @property
+    def center(self) -> tuple[int, int]:
+        left, top, right, bottom = self.rectangle
+        return (left + right) // 2, (top + bottom) // 2
+
+    def walk(self) -> Iterator[TreeNode]:
+        """Yields this node and all of its descendants in pre-order."""
+        stack: list[TreeNode] = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+class TreeSnapshot:
+    """
+    Immutable, in-memory view of a window subtree fetched in a single request.
+    Shared by every title and dialog query until it expires or is invalidated.
+    Attributes:
+        root (TreeNode): The snapshot's root node.
+        taken_at (float): `time.monotonic()` timestamp of the fetch.
+    """
+
+    def __init__(self, root: TreeNode, taken_at: float | None = None) -> None:
+        self._root      = root
+        self._taken_at  = time.monotonic() if taken_at is None else taken_at
+        self._nodes:    tuple[TreeNode, ...] = tuple(root.walk())
+
+    @property
+    def root(self) -> TreeNode:
+        return self._root
+
+    @property
+    def taken_at(self) -> float:
+        return self._taken_at
+
+    def age(self) -> float:
+        return time.monotonic() - self._taken_at
+
+    def __iter__(self) -> Iterator[TreeNode]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def find(self, predicate: Callable[[TreeNode], bool]) -> list[TreeNode]:
+        """Returns every node matching `predicate` in pre-order."""
+        return [node for node in self._nodes if predicate(node)]
+
+    def by_handle(self, handle: int) -> TreeNode | None:
+        for node in self._nodes:
+            if node.handle == handle:
+                return node
+        return None
+
+    def dialogs(self, include_root: bool = True) -> list[TreeNode]:
+        """Returns every dialog node in pre-order."""
+        return [
+            node for node in self._nodes
+            if node.is_dialog and (include_root or node is not self._root)
+        ]
+
+    def dialog_titles(self) -> list[str]:
+        """Returns the unique, stripped titles of every dialog, root first."""
+        titles: list[str] = []
+        seen: set[str] = set()
+
+        for node in self.dialogs():
+            text = node.name.strip()
+            if text in seen:
+                continue
+            titles.append(text)
+            seen.add(text)
+
+        return titles
+
+
+def windows_only(root: TreeNode) -> TreeNode:
+    """
+    Returns `root` with every descendant that is not a `Window` removed and its
+    children lifted to the nearest kept ancestor, as a UIA tree filter does.
+    """
+    def _kept(node: TreeNode, depth: int) -> list[TreeNode]:
+        if node.control_type == "Window":
+            children = tuple(kept for child in node.children for kept in _kept(child, depth + 1))
+            return [node._replace(depth=depth, children=children)]
+        return [kept for child in node.children for kept in _kept(child, depth)]
+
+    children = tuple(kept for child in root.children for kept in _kept(child, 1))
+    return root._replace(depth=0, children=children)
+
+
+class TreeProvider(ABC):
+    """Fetches a window subtree as an immutable `TreeNode`."""
+
+    @abstractmethod
+    def fetch(self, app: Any, scope: TreeScope = "windows") -> TreeNode:
+        """
+        Fetches the subtree of the application's main window.
+
+        :param app: The application to snapshot.
+        :type  app: Any
+        :param scope: `windows` for only the main window's `Window` descendants, which is
+            all title and dialog queries need, or `full` for every control.
+        :type  scope: TreeScope = "windows"
+        :returns: The root node of the fetched subtree.
+        :rtype: TreeNode
+        :raises WindowNotFound: If the main window does not exist.
+        """
+
+
+class UIATreeProvider(TreeProvider):
+    """
+    Fetches the subtree under the QuickBooks main window with a single UIA cache
+    request. Name, class, control type, handle and rectangle are read from the
+    cache, so walking the result makes no further cross-process calls. The
+    `windows` scope filters the request to `Window` controls, so grid cells and
+    edits are never marshalled for title and dialog queries.
+    Attributes:
+        title_re (str): Regular expression locating the main window.
+    """
+
+    def __init__(self, title_re: str = ".*QuickBooks.*") -> None:
+        self.title_re = title_re
+
+    def fetch(self, app: Any, scope: TreeScope = "windows") -> TreeNode:
+        import pywinauto
+        from pywinauto.uia_defines import IUIA
+
+        try:
+            main_wrap = app.window(title_re=self.title_re).wrapper_object()
+        except (pywinauto.findwindows.ElementNotFoundError, pywinauto.timings.TimeoutError) as e:
+            raise WindowNotFound(f"Could not wrap main QuickBooks window: {e}") from e
+
+        uia = IUIA()
+        request = uia.iuia.CreateCacheRequest()
+        for prop in (
+            uia.UIA_dll.UIA_NamePropertyId,
+            uia.UIA_dll.UIA_ClassNamePropertyId,
+            uia.UIA_dll.UIA_ControlTypePropertyId,
+            uia.UIA_dll.UIA_NativeWindowHandlePropertyId,
+            uia.UIA_dll.UIA_BoundingRectanglePropertyId,
+            uia.UIA_dll.UIA_IsEnabledPropertyId,
+        ):
+            request.AddProperty(prop)
+        request.TreeScope   = uia.tree_scope["subtree"]
+        if scope == "windows":
+            request.TreeFilter = uia.iuia.CreatePropertyCondition(
+                uia.UIA_dll.UIA_ControlTypePropertyId,
+                uia.UIA_dll.UIA_WindowControlTypeId,
+            )
+        else:
+            request.TreeFilter = uia.true_condition
+
+        cached = main_wrap.element_info.element.BuildUpdatedCache(request)
+        control_types = uia.known_control_type_ids
+
+        def _build(element: Any, depth: int) -> TreeNode:
+            rect = element.CachedBoundingRectangle
+            children = element.GetCachedChildren()
+            count = children.Length if children is not None else 0
+            return TreeNode(
+                name            = element.CachedName or "",
+                class_name      = element.CachedClassName or "",
+                control_type    = control_types.get(element.CachedControlType, ""),
+                handle          = element.CachedNativeWindowHandle or 0,
+                rectangle       = (rect.left, rect.top, rect.right, rect.bottom),
+                depth           = depth,
+                enabled         = bool(element.CachedIsEnabled),
+                children        = tuple(_build(children.GetElement(i), depth + 1) for i in range(count)),
+            )
+
+        return _build(cached, 0)
+
+
+class StaticTreeProvider(TreeProvider):
+    """
+    Fake provider that serves prepared trees, for exercising snapshot logic without UIA.
+    Each fetch returns the next tree in `trees`; the last one is repeated once exhausted.
+    The `windows` scope is served through `windows_only`.
+    Attributes:
+        fetch_count (int): Number of fetches served so far.
+        scopes (list[TreeScope]): The scope of every fetch, in order.
+    """
+
+    def __init__(self, trees: TreeNode | Sequence[TreeNode | None]) -> None:
+        self._trees: list[TreeNode | None] = [trees] if isinstance(trees, TreeNode) else list(trees)
+        if not self._trees:
+            raise ValueError("At least one tree must be provided.")
+        self.fetch_count = 0
+        self.scopes:    list[TreeScope] = []
+
+    def fetch(self, app: Any, scope: TreeScope = "windows") -> TreeNode:
+        tree = self._trees[min(self.fetch_count, len(self._trees) - 1)]
+        self.fetch_count += 1
+        self.scopes.append(scope)
+        if tree is None:
+            raise WindowNotFound("The scripted tree has no main window.")
+        return windows_only(tree) if scope == "windows" else tree
+
+
+class SnapshotCache:
+    """
+    Holds the most recent `TreeSnapshot` per application and scope, and refetches
+    it once it is older than `max_age` or has been invalidated. Safe to invalidate
+    from other threads, e.g. window event hooks; a fetch that an invalidation raced
+    is returned to its caller but not cached.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        provider (TreeProvider): Source of fresh trees.
+        max_age (float): Seconds a snapshot may be served before it is refetched.
+    """
+
+    def __init__(
+            self,
+            provider: TreeProvider,
+            max_age: float = 0.25,
+            logger: logging.Logger | None = None,
+        ) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.provider   = provider
+        self.max_age    = max_age
+        self._snapshots: dict[tuple[int, TreeScope], TreeSnapshot] = {}
+        self._lock          = threading.Lock()
+        self._generation    = 0
+
+    def get(self, app: Any, max_age: float | None = None, scope: TreeScope = "windows") -> TreeSnapshot:
+        """
+        Returns a snapshot of `app` no older than `max_age`, fetching a new one if needed.
+
+        :param app: The application to snapshot.
+        :type  app: Any
+        :param max_age: Overrides the cache's `max_age` for this call. `0` forces a refetch.
+        :type  max_age: float | None = None
+        :param scope: `windows` for dialog and title queries, `full` for every control.
+        :type  scope: TreeScope = "windows"
+        :returns: The snapshot.
+        :rtype: TreeSnapshot
+        """
+        limit = self.max_age if max_age is None else max_age
+        key = (id(app), scope)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            generation = self._generation
+
+        if snapshot is None or snapshot.age() > limit or limit <= 0:
+            start = time.perf_counter()
+            snapshot = TreeSnapshot(self.provider.fetch(app, scope))
+            with self._lock:
+                if generation == self._generation:
+                    self._snapshots[key] = snapshot
+            self.logger.debug(f"Fetched `{scope}` UI tree snapshot of `{len(snapshot)}` nodes in `{time.perf_counter() - start:.4f}`s.")
+
+        return snapshot
+
+    def invalidate(self, app: Any | None = None) -> None:
+        """Drops the cached snapshots of `app`, or of every application if `app` is None."""
+        with self._lock:
+            self._generation += 1
+            if app is None:
+                self._snapshots.clear()
+            else:
+                for key in [key for key in self._snapshots if key[0] == id(app)]:
+                    del self._snapshots[key]
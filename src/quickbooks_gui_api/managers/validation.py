@@ -0,0 +1,137 @@
+# src\quickbooks_gui_api\managers\validation.py
+
+from __future__ import annotations
+
+import io
+import os
+import re
+import csv
+
+from pathlib    import Path
+from collections import Counter
+from typing     import Callable, NamedTuple
+
+
+PDF_HEAD_BYTES: int = 1024
+PDF_TAIL_BYTES: int = 2048
+CSV_TAIL_BYTES: int = 64 * 1024
+CSV_TAIL_ROWS:  int = 32
+
+_STARTXREF = re.compile(rb"startxref\s+(\d+)\s+%%EOF\s*$")
+
+
+class ExportCheck(NamedTuple):
+    """
+    Whether an exported file is structurally whole.
+    Attributes:
+        complete (bool): True if every check passed.
+        reason (str): What failed, or `complete`.
+    """
+    complete:   bool
+    reason:     str = "complete"
+
+
+def _read_at(fh, offset: int, count: int) -> bytes:
+    fh.seek(max(0, offset))
+    return fh.read(count)
+
+
+def check_pdf(path: Path) -> ExportCheck:
+    """
+    Checks that a PDF has its header, ends with `startxref <offset> %%EOF`, and that
+    the offset points at a cross-reference table or stream. Only the head, the tail
+    and a few bytes at the offset are read.
+    """
+    with path.open("rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if b"%PDF-" not in _read_at(fh, 0, PDF_HEAD_BYTES):
+            return ExportCheck(False, "missing %PDF header")
+
+        match = _STARTXREF.search(_read_at(fh, size - PDF_TAIL_BYTES, PDF_TAIL_BYTES))
+        if match is None:
+            return ExportCheck(False, "missing startxref/%%EOF trailer")
+
+        offset = int(match.group(1))
+        if offset >= size:
+            return ExportCheck(False, f"startxref offset {offset} beyond end of file")
+
+        # A classic `xref` table, or an `N G obj` holding a cross-reference stream.
+        target = _read_at(fh, offset, 32).lstrip()
+        if not (target.startswith(b"xref") or re.match(rb"\d+\s+\d+\s+obj", target)):
+            return ExportCheck(False, f"startxref offset {offset} does not point at a cross-reference")
+
+    return ExportCheck(True)
+
+
+def check_csv(path: Path) -> ExportCheck:
+    """
+    Checks that a CSV ends with a newline and that its last record has the column
+    count shared by most records in its last `CSV_TAIL_BYTES` bytes, which a
+    record cut short does not.
+    """
+    with path.open("rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size == 0:
+            return ExportCheck(False, "empty file")
+
+        start = max(0, size - CSV_TAIL_BYTES)
+        tail = _read_at(fh, start, CSV_TAIL_BYTES)
+
+    if not tail.endswith(b"\n"):
+        return ExportCheck(False, "does not end with a newline")
+
+    if start > 0:
+        # Skip the partial record the tail starts in.
+        tail = tail[tail.find(b"\n") + 1:]
+
+    # Latin-1 decodes any byte, and delimiters and quotes are ASCII in every encoding QuickBooks writes.
+    try:
+        rows = [row for row in csv.reader(io.StringIO(tail.decode("latin-1"), newline="")) if row]
+    except csv.Error as e:
+        return ExportCheck(False, f"malformed tail: {e}")
+    rows = rows[-CSV_TAIL_ROWS:]
+    if not rows:
+        return ExportCheck(True)
+
+    # The first tail record may still be a fragment of a quoted multi-line field.
+    counts = Counter(len(row) for row in (rows[1:] if start > 0 and len(rows) > 1 else rows))
+    expected, _ = counts.most_common(1)[0]
+    if len(rows[-1]) != expected:
+        return ExportCheck(False, f"last record has {len(rows[-1])} columns, expected {expected}")
+
+    return ExportCheck(True)
+
+
+VALIDATORS: dict[str, Callable[[Path], ExportCheck]] = {
+    ".pdf": check_pdf,
+    ".csv": check_csv,
+}
+
+
+def supports(path: Path) -> bool:
+    """Returns True if files with the suffix of `path` can be validated."""
+    return path.suffix.lower() in VALIDATORS
+
+
+def check(path: Path) -> ExportCheck:
+    """
+    Validates the structure of the export at `path`.
+
+    :raises ValueError: If its suffix has no validator.
+    """
+    validator = VALIDATORS.get(path.suffix.lower())
+    if validator is None:
+        raise ValueError(f"No completeness check for `{path.suffix}` files.")
+    try:
+        return validator(path)
+    except OSError as e:
+        return ExportCheck(False, f"unreadable: {e}")
+
+
+def is_complete(path: Path) -> bool:
+    """
+    Returns True if the export at `path` is provably whole.
+
+    :raises ValueError: If its suffix has no validator.
+    """
+    return check(path).complete
@@ -0,0 +1,136 @@
+# src\quickbooks_gui_api\managers\watch.py
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import ctypes
+import select
+import logging
+
+from abc        import ABC, abstractmethod
+from pathlib    import Path
+
+
+class DirectoryWatcher(ABC):
+    """
+    Wakes a waiter when entries in one directory are created, renamed, written or
+    resized. Callers re-check their own condition after every wake, so a watcher may
+    wake spuriously but should not sleep through a change.
+    """
+
+    @abstractmethod
+    def wait(self, timeout: float) -> bool:
+        """
+        Blocks until the directory changes or `timeout` seconds pass.
+
+        :returns: True if woken by a change, False on timeout.
+        :rtype: bool
+        """
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> DirectoryWatcher:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PollingWatcher(DirectoryWatcher):
+    """Fallback that sleeps out the timeout; every wait ends as a timeout."""
+
+    def wait(self, timeout: float) -> bool:
+        time.sleep(max(0.0, timeout))
+        return False
+
+
+class InotifyWatcher(DirectoryWatcher):
+    """Linux `inotify`, through libc with ctypes."""
+
+    IN_MODIFY       = 0x00000002
+    IN_ATTRIB       = 0x00000004
+    IN_CLOSE_WRITE  = 0x00000008
+    IN_MOVED_TO     = 0x00000080
+    IN_CREATE       = 0x00000100
+    IN_NONBLOCK     = 0o4000
+    IN_CLOEXEC      = 0o2000000
+
+    MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+    def __init__(self, directory: Path) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), self.MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            self._fd = -1
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    def wait(self, timeout: float) -> bool:
+        readable, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if not readable:
+            return False
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class Win32ChangeWatcher(DirectoryWatcher):
+    """Windows `FindFirstChangeNotification`, through kernel32 with ctypes."""
+
+    FILE_NOTIFY_CHANGE_FILE_NAME    = 0x00000001
+    FILE_NOTIFY_CHANGE_SIZE         = 0x00000008
+    FILE_NOTIFY_CHANGE_LAST_WRITE   = 0x00000010
+    WAIT_OBJECT_0                   = 0x00000000
+    INVALID_HANDLE_VALUE            = ctypes.c_void_p(-1).value
+
+    FILTER = FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_SIZE | FILE_NOTIFY_CHANGE_LAST_WRITE
+
+    def __init__(self, directory: Path) -> None:
+        self._kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+        self._handle = self._kernel32.FindFirstChangeNotificationW(str(directory), False, self.FILTER)
+        if not self._handle or self._handle == self.INVALID_HANDLE_VALUE:
+            self._handle = None
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def wait(self, timeout: float) -> bool:
+        result = self._kernel32.WaitForSingleObject(ctypes.c_void_p(self._handle), int(max(0.0, timeout) * 1000))
+        if result != self.WAIT_OBJECT_0:
+            return False
+        self._kernel32.FindNextChangeNotification(ctypes.c_void_p(self._handle))
+        return True
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._kernel32.FindCloseChangeNotification(ctypes.c_void_p(self._handle))
+            self._handle = None
+
+
+def open_watcher(directory: Path, logger: logging.Logger | None = None) -> DirectoryWatcher:
+    """
+    Returns the platform's change notification watcher for `directory`, or a
+    `PollingWatcher` where notifications are unavailable.
+    """
+    logger = logger or logging.getLogger(__name__)
+    try:
+        if sys.platform == "win32":
+            return Win32ChangeWatcher(directory)
+        if sys.platform.startswith("linux"):
+            return InotifyWatcher(directory)
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Change notifications unavailable for `{directory}`, polling instead: {e}")
+    return PollingWatcher()
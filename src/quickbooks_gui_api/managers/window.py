@@ -2,33 +2,92 @@
 
 import time
 import logging
+import threading
+
+from collections                    import defaultdict, deque
 import win32gui
 from ctypes.wintypes import RECT
-import pyautogui
 import pywinauto
 import pywinauto.mouse
 import pywinauto.timings
 
-from typing                         import List, Tuple, overload, Dict, Any
+from typing                         import List, Tuple, overload, Dict, Any, Callable, Mapping, Literal, Sequence
 from pywinauto                      import Application, WindowSpecification
 from pywinauto.controls.uiawrapper  import UIAWrapper
 
+from quickbooks_gui_api.managers.tree               import TreeNode, TreeProvider, TreeScope, TreeSnapshot, SnapshotCache, UIATreeProvider
+from quickbooks_gui_api.managers.desktop            import WindowBackend, Win32WindowBackend, select_top_dialog
+from quickbooks_gui_api.managers.events             import DialogRegistry, EventSource, WinEventSource, WindowEvent
+from quickbooks_gui_api.managers.keyboard           import InputBackend, Win32InputBackend, compile_input
+from quickbooks_gui_api.managers.focus              import FocusBackend, FocusTracker
+from quickbooks_gui_api.managers.latency            import LatencyRecorder
+from quickbooks_gui_api.managers.string             import normalize_title
+from quickbooks_gui_api.models.element              import ELEMENT_CACHE
+from quickbooks_gui_api.managers.manager_exceptions import WindowNotFound, TextEntryFailed
+
+
+TextEntryStrategy = Literal["value", "clipboard", "keys"]
+PressPath = Literal["invoke", "toggle", "select", "default_action", "click"]
+
 
 class WindowManager:
     """
     Manages windows in Windows. 
     Attributes:
         logger (logging.Logger): Logger instance for logging operations.
+        input_lock (threading.RLock): Held while input is delivered. Shared by every instance,
+            since there is one keyboard and one foreground window. Hold it across a multi-step
+            input sequence to keep background helpers from interleaving their own input.
     """
+
+    input_lock = threading.RLock()
     
 
-    def __init__(self, logger: logging.Logger | None = None) -> None:
+    def __init__(
+            self, 
+            logger: logging.Logger | None = None,
+            *,
+            tree_provider: TreeProvider | None = None,
+            snapshot_max_age: float = 0.25,
+            window_backend: WindowBackend | None = None,
+            input_backend: InputBackend | None = None,
+            focus_backend: FocusBackend | None = None,
+            measure_latency: bool = False,
+        ) -> None:
+        """
+        :param  logger:             Logger instance for logging operations.
+        :type   logger:             logging.Logger | None = None
+        :param  tree_provider:      Source of UI tree snapshots. Defaults to a batched UIA cache request.
+        :type   tree_provider:      TreeProvider | None = None
+        :param  snapshot_max_age:   Seconds a snapshot is shared between queries before it is refetched.
+        :type   snapshot_max_age:   float = 0.25
+        :param  window_backend:     Native window lister used by `top_dialog`. Defaults to Win32.
+        :type   window_backend:     WindowBackend | None = None
+        :param  input_backend:      Keyboard input deliverer used by `send_input`. Defaults to batched `SendInput`.
+        :type   input_backend:      InputBackend | None = None
+        :param  focus_backend:      Focus state reader used to skip redundant `set_focus` calls. Defaults to Win32.
+        :type   focus_backend:      FocusBackend | None = None
+        :param  measure_latency:    Record the time from each input to its first observed effect in `latency`.
+        :type   measure_latency:    bool = False
+        """
         if logger is None:
             self.logger = logging.getLogger(__name__)
         elif isinstance(logger, logging.Logger):
             self.logger = logger
         else:
             raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.snapshots = SnapshotCache(tree_provider or UIATreeProvider(), snapshot_max_age, self.logger)
+        self.window_backend = window_backend or Win32WindowBackend()
+        self.input_backend  = input_backend or Win32InputBackend()
+        self.focus          = FocusTracker(focus_backend, self.logger)
+        self.latency        = LatencyRecorder(enabled=measure_latency, logger=self.logger)
+
+        self.dialogs:       DialogRegistry | None = None
+        self._event_source: EventSource | None = None
+
+        self.press_timings:     defaultdict[str, deque[float]] = defaultdict(lambda: deque(maxlen=256))
+        self.press_failures:    defaultdict[str, int] = defaultdict(int)
         
     @staticmethod
     def rect_to_size_pos(rect: RECT) -> tuple[tuple[int, int], tuple[int, int]]:
@@ -39,44 +98,208 @@ class WindowManager:
         return (rect.width(), rect.height()), (rect.left, rect.top)
 
 
+    def snapshot(self, app: Application, max_age: float | None = None, scope: TreeScope = "windows") -> TreeSnapshot:
+        """
+        Return a cached snapshot of the UI tree under the main QuickBooks window.
+
+        :param  app:        The application to snapshot.
+        :type   app:        Application
+        :param  max_age:    Maximum acceptable age of a cached snapshot. `0` forces a refetch.
+        :type   max_age:    float | None = None
+        :param  scope:      `windows` for dialogs and titles only, `full` for every control.
+        :type   scope:      TreeScope = "windows"
+        :raises WindowNotFound: If the main window does not exist.
+        """
+        return self.snapshots.get(app, max_age, scope)
+
+    def invalidate_snapshot(self, app: Application | None = None) -> None:
+        """Discard cached snapshots so the next query sees the current UI."""
+        self.snapshots.invalidate(app)
+
+    @property
+    def watching(self) -> bool:
+        """True while a live `DialogRegistry` is fed by window events."""
+        return self.dialogs is not None
+
+    def start_watching(self, app: Application, source: EventSource | None = None) -> bool:
+        """
+        Start a background watcher that keeps `self.dialogs` current from window
+        open, close and focus events. While watching, `top_dialog` is an O(1) read.
+
+        :param  app:    The application whose process is watched.
+        :type   app:    Application
+        :param  source: Event source. Defaults to Win32 window event hooks.
+        :type   source: EventSource | None = None
+        :returns: True if the watcher started, False if events are unavailable.
+        :rtype: bool
+        """
+        if self.watching:
+            return True
+
+        source = source or WinEventSource(self.logger)
+        try:
+            main, _ = select_top_dialog(self.window_backend.list_windows(app.process))
+
+            registry = DialogRegistry(main.handle if main is not None else 0)
+            registry.add_listener(self._on_window_event)
+
+            # Hook before listing, so a window opening in between is queued rather than missed.
+            registry.hold()
+            source.start(app.process, registry.apply)
+            registry.seed(self.window_backend.list_windows(app.process))
+        except Exception:
+            self.logger.warning("Unable to start the dialog watcher. Falling back to polling.", exc_info=True)
+            try:
+                source.stop()
+            except Exception:
+                pass
+            return False
+
+        self.dialogs        = registry
+        self._event_source  = source
+        self.logger.debug(f"Dialog watcher started. Open windows: `{registry.titles()}`.")
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop the background dialog watcher, if running."""
+        if self._event_source is not None:
+            try:
+                self._event_source.stop()
+            except Exception:
+                self.logger.exception("Error stopping the dialog watcher.")
+        self.dialogs        = None
+        self._event_source  = None
+
+    def _on_window_event(self, event: WindowEvent) -> None:
+        self.invalidate_snapshot()
+        self.latency.observe(f"{event.title.strip()} {event.kind}", event.kind)
+        if event.kind == "closed":
+            ELEMENT_CACHE.invalidate_handle(event.handle)
+
+    def wait_for_dialog(self, app: Application, title: str, timeout: float, poll_interval: float = 0.05) -> bool:
+        """
+        Block until a dialog titled `title` is the top dialog, as reported by `top_dialog`.
+
+        Waits on the watcher's condition variable when watching, otherwise polls `top_dialog`.
+
+        :param  app:            The application to inspect.
+        :type   app:            Application
+        :param  title:          The dialog title to wait for.
+        :type   title:          str
+        :param  timeout:        Maximum time to wait in seconds.
+        :type   timeout:        float
+        :param  poll_interval:  Interval between checks when not watching.
+        :type   poll_interval:  float = 0.05
+        :returns: True if the dialog appeared before the timeout, False otherwise.
+        :rtype: bool
+        """
+        if self.dialogs is not None:
+            return self.dialogs.wait_for_dialog(title, timeout) is not None
+
+        key = normalize_title(title)
+        end_time = time.monotonic() + timeout
+        while True:
+            if normalize_title(self.top_dialog(app)) == key:
+                self.latency.observe(f"{title} opened", "opened")
+                return True
+            if time.monotonic() >= end_time:
+                return False
+            time.sleep(poll_interval)
+
+    def set_focus(self, element: UIAWrapper | WindowSpecification) -> bool:
+        """
+        Focus `element` unless it, or a control inside it, already has focus.
+
+        :param  element:    The window or control to focus.
+        :type   element:    UIAWrapper | WindowSpecification
+        :returns: True if focus had to be changed.
+        :rtype: bool
+        """
+        wrapper = ELEMENT_CACHE.resolve(element) if isinstance(element, WindowSpecification) else element
+        with self.input_lock:
+            changed = self.focus.ensure(wrapper)
+        if changed:
+            self.invalidate_snapshot()
+        return changed
+
+    def wait_any(
+            self,
+            conditions: Mapping[str, Callable[[], bool]],
+            timeout: float,
+            *,
+            initial_interval: float = 0.01,
+            max_interval: float = 0.25,
+            backoff: float = 1.5,
+        ) -> str | None:
+        """
+        Wait for the first of several UI conditions in a single polling loop.
+
+        Every condition is evaluated on each pass, in order. Passes start
+        `initial_interval` apart and back off by `backoff` up to `max_interval`, so a
+        condition that holds quickly is seen quickly while long waits stay cheap.
+        While the dialog watcher runs, the pause between passes ends early on any
+        window event.
+
+        :param  conditions:         Named predicates, e.g. from `element_condition` and `dialog_condition`.
+        :type   conditions:         Mapping[str, Callable[[], bool]]
+        :param  timeout:            Maximum time to wait in seconds. Conditions are evaluated at least once.
+        :type   timeout:            float
+        :param  initial_interval:   First pause between passes.
+        :type   initial_interval:   float = 0.01
+        :param  max_interval:       Longest pause between passes.
+        :type   max_interval:       float = 0.25
+        :param  backoff:            Growth factor of the pause after each pass.
+        :type   backoff:            float = 1.5
+        :returns: The name of the condition that held, or None on timeout.
+        :rtype: str | None
+        """
+        if not conditions:
+            raise ValueError("At least one condition must be provided.")
+
+        end_time = time.monotonic() + timeout
+        interval = initial_interval
+        passes = 0
+
+        while True:
+            passes += 1
+            for name, condition in conditions.items():
+                try:
+                    if condition():
+                        self.latency.observe(name)
+                        self.logger.debug(f"Condition `{name}` held after `{passes}` pass(es).")
+                        return name
+                except Exception:
+                    self.logger.debug(f"Condition `{name}` raised while polling.", exc_info=True)
+
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                self.logger.debug(f"None of `{list(conditions)}` held within `{timeout}` seconds.")
+                return None
+
+            pause = min(interval, remaining)
+            if self.dialogs is not None:
+                self.dialogs.wait_for_change(pause)
+            else:
+                time.sleep(pause)
+            interval = min(interval * backoff, max_interval)
+
+    def element_condition(self, element: UIAWrapper | WindowSpecification, attempt_focus: bool = False) -> Callable[[], bool]:
+        """Return a `wait_any` predicate that holds when `element` is active, probing without waiting."""
+        return lambda: self.is_element_active(element, timeout=0, attempt_focus=attempt_focus)
+
+    def dialog_condition(self, app: Application, title: str) -> Callable[[], bool]:
+        """Return a `wait_any` predicate that holds when `title` is the top dialog."""
+        key = normalize_title(title)
+        return lambda: normalize_title(self.top_dialog(app)) == key
+
     def get_all_dialog_titles(self, app: Application) -> List[str]:
         """
         Return every caption of every UIA “Dialog” under `app`.
         """
-        # 1) Locate and wrap the main window
-        main_spec = app.window(title_re=".*QuickBooks.*")
         try:
-            main_wrap: UIAWrapper = (
-                main_spec
-                if isinstance(main_spec, UIAWrapper)
-                else main_spec.wrapper_object()
-            )
-        except (pywinauto.findwindows.ElementNotFoundError, pywinauto.timings.TimeoutError) as e:
-            raise RuntimeError(f"Could not wrap main QuickBooks window: {e}") from e
-
-        titles: List[str] = []
-        seen = set()
-
-        # 2) Include the main window itself *if* it's a Dialog
-        if main_wrap.friendly_class_name() == "Dialog":
-            text = main_wrap.window_text().strip()
-            if text:
-                titles.append(text)
-                seen.add(text)
-
-        # 3) Walk all Window controls beneath it
-        for win in main_wrap.descendants(control_type="Window"):
-            # 4) Filter by the friendly class name
-            if win.friendly_class_name() != "Dialog":
-                continue
-            # 5) Grab its text
-            text = win.window_text().strip()
-            if not text or text in seen:
-                continue
-            titles.append(text)
-            seen.add(text)
-
-        return titles
+            return self.snapshot(app).dialog_titles()
+        except WindowNotFound as e:
+            raise RuntimeError(str(e)) from e
         
 
     def is_element_active(
@@ -109,7 +332,8 @@ class WindowManager:
         # 2) obtain a concrete wrapper to avoid repeated lookups
         if isinstance(element, WindowSpecification):
             try:
-                element = element.wrapper_object()
+                # Probe only; a missing element would otherwise wait the global find timeout.
+                element = ELEMENT_CACHE.resolve(element, timeout=0)
             except Exception:
                 # fall back to waiting if the control isn't ready yet
                 if timeout > 0:
@@ -152,7 +376,7 @@ class WindowManager:
         # 3) optionally focus it
         if attempt_focus:
             try:
-                element.set_focus()
+                self.set_focus(element)
             except Exception:
                 pass
 
@@ -170,40 +394,88 @@ class WindowManager:
         Return the title of the topmost modal dialog in the given
         ``Application``.  If no dialog is found an empty string is
         returned.
+
+        The QuickBooks process's native windows are listed in z-order first,
+        which answers in one cheap call. The UIA tree is only walked if that
+        fails or the main window cannot be identified. While the dialog
+        watcher runs, the registry answers without any lookup.
         """
+        if self.dialogs is not None:
+            return self.dialogs.top_title()
 
-        main_spec = app.window(title_re=".*QuickBooks.*")
         try:
-            # Wait for the main window to exist before proceeding. This handles
-            # transient states, like after login when the main window is re-loading.
-            # It will use the global pywinauto timeout.
-            main_wrap = main_spec.wait('exists')
-        except pywinauto.timings.TimeoutError:
-            self.logger.warning("Main QuickBooks window not found while searching for popups (timed out). This is likely normal during window transitions.")
-            # If the main window isn't found, there can't be a dialog on top of it.
-            return ""
-
-        dialogs: list[tuple[int, UIAWrapper]] = []
-
-        def _collect(node: UIAWrapper, depth: int) -> None:
-            for child in node.children():
-                try:
-                    if child.friendly_class_name() == "Dialog" and child.window_text().strip():
-                        dialogs.append((depth + 1, child))
-                except Exception:
-                    pass
-                _collect(child, depth + 1)
+            title = self._top_dialog_native(app)
+            if title is not None:
+                return title
+        except Exception:
+            self.logger.debug("Native top dialog lookup failed. Falling back to UIA.", exc_info=True)
 
-        _collect(main_wrap, 0)
+        return self._top_dialog_uia(app)
 
-        dialogs.sort(key=lambda t: t[0], reverse=True)
+    def _top_dialog_native(self, app: Application) -> str | None:
+        """
+        Return the top dialog's title from the native window list, or None if
+        the main window is not among the process's windows.
+        """
+        main, top = select_top_dialog(self.window_backend.list_windows(app.process))
+        if main is None:
+            return None
+        return top.title if top is not None else ""
+
+    def _top_dialog_uia(self, app: Application) -> str:
+        """
+        Return the top dialog's title by hit-testing the dialogs of the UIA
+        tree snapshot, deepest first.
+        """
+        try:
+            snapshot = self.snapshot(app)
+        except WindowNotFound:
+            try:
+                # Wait for the main window to exist before proceeding. This handles
+                # transient states, like after login when the main window is re-loading.
+                # It will use the global pywinauto timeout.
+                app.window(title_re=".*QuickBooks.*").wait('exists')
+                snapshot = self.snapshot(app, max_age=0)
+            except (pywinauto.timings.TimeoutError, WindowNotFound):
+                self.logger.warning("Main QuickBooks window not found while searching for popups (timed out). This is likely normal during window transitions.")
+                # If the main window isn't found, there can't be a dialog on top of it.
+                return ""
+
+        dialogs = snapshot.dialogs(include_root=False)
+        dialogs.sort(key=lambda node: node.depth, reverse=True)
 
-        for _, dlg in dialogs:
-            if self.is_element_active(dlg, timeout=0.2, retry_interval=0.05):
-                return dlg.window_text()
+        for dlg in dialogs:
+            if self._is_node_on_top(dlg):
+                return dlg.name
 
-        return dialogs[0][1].window_text() if dialogs else ""
+        return dialogs[0].name if dialogs else ""
+
+    @staticmethod
+    def _is_node_on_top(node: TreeNode) -> bool:
+        """
+        Return True if the snapshot node is enabled, has an area, and wins a Win32 hit-test
+        at its center. Uses only the cached rectangle and handle, no UIA round trips.
+        """
+        left, top, right, bottom = node.rectangle
+        if not node.handle or not node.enabled or right <= left or bottom <= top:
+            return False
+
+        hwnd_at_point = win32gui.WindowFromPoint(node.center)
+        return hwnd_at_point == node.handle or bool(win32gui.IsChild(node.handle, hwnd_at_point))
     
+    @staticmethod
+    def _input_label(keys: str | List[str] | List[List[str]] | None, string: str | None, send_count: int) -> str:
+        """Names an input for latency measurement, e.g. `ctrl+f` or `tab x3`."""
+        if keys is None:
+            label = "type"
+        elif isinstance(keys, str):
+            label = keys
+        elif all(isinstance(k, list) for k in keys):
+            label = " ".join("+".join(batch) for batch in keys)
+        else:
+            label = "+".join(keys)
+        return label if send_count == 1 else f"{label} x{send_count}"
+
     @overload
     def send_input(self, keys: str | List[str] | None = None, *, send_count: int = 1, delay: float = 0) -> None:...
     @overload
@@ -227,48 +499,222 @@ class WindowManager:
         :type   string:         str | None = None
         :param  send_count:     Number of times to repeat the send.
         :type   send_count:     int = 1
-        :param  char_at_a_time: When ``True`` characters of ``string`` are sent individually.
-        :param  delay:          Delay between repeated sends or batches.
+        :param  char_at_a_time: When ``True`` ``delay`` is applied after every character of ``string``.
+        :param  delay:          Delay between repeated sends or batches. Without one, the whole input is delivered in a single batch.
         :type   delay:          float = 0.0 
         :raises ValueError:     If neither ``keys`` nor ``string`` is provided.
         """
-        if keys is None and string is None:
-            raise ValueError("Either 'keys' or 'string' must be provided.")
+        strokes = compile_input(
+            keys,
+            string          = string,
+            send_count      = send_count,
+            char_at_a_time  = char_at_a_time,
+            delay           = delay,
+        )
+
+        self.invalidate_snapshot()
+        self.latency.begin(self._input_label(keys, string, send_count))
 
-        # Handle keys
         if keys is not None:
-            for _ in range(send_count):
-                # Single string (e.g., "enter" or "a")
-                if isinstance(keys, str):
-                    self.logger.debug(f"Sending single key input: `{keys}`.")
-                    pyautogui.press(keys)
-                # Flat list (e.g., ["ctrl", "a"])
-                elif isinstance(keys, list) and all(isinstance(k, str) for k in keys):
-                    # Send all as a hotkey (simultaneous press)
-                    self.logger.debug(f"Sending key input as hotkey: `{keys}`.")
-                    pyautogui.hotkey(*keys)
-                else:
-                    raise ValueError("Invalid format for 'keys'. Must be str or List[str].")
-                if delay and not (isinstance(keys, list) and all(isinstance(k, list) for k in keys)):
-                    time.sleep(delay)
-            # If keys was provided, don't send string (even if not None)
-            return
-
-        # Handle string input
-        if string is not None:
-            for _ in range(send_count):
-                if char_at_a_time:
-                    self.logger.debug(f"Sending string `{string}` char at a time with a delay of `{delay}`.")
-                    for char in string:
-                        pyautogui.typewrite(char)
-                        if delay:
-                            time.sleep(delay)
-                else:
-                    self.logger.debug(f"Sending string `{string}` all at once a delay after of `{delay}`.")
-                    pyautogui.typewrite(string)
-                    if delay:
-                        time.sleep(delay)
+            self.logger.debug(f"Sending key input `{keys}` x`{send_count}` as `{len(strokes)}` key events.")
+        else:
+            self.logger.debug(f"Sending string `{string}` x`{send_count}` with a delay of `{delay}`{' per char' if char_at_a_time else ''}.")
+
+        # If keys was provided, string is ignored (even if not None)
+        with self.input_lock:
+            self.input_backend.send(strokes)
+
+
+    @staticmethod
+    def read_text(element: UIAWrapper) -> str | None:
+        """
+        Read an edit control's current text, preferring its accessibility value.
+
+        :returns: The text, or None if the control does not expose it (e.g. password fields).
+        :rtype: str | None
+        """
+        try:
+            if element.element_info.element.CurrentIsPassword:
+                return None
+        except Exception:
+            pass
+        try:
+            return element.iface_value.CurrentValue
+        except Exception:
+            pass
+        try:
+            return element.window_text()
+        except Exception:
+            return None
+
+    def _set_clipboard_text(self, text: str) -> str | None:
+        """Places `text` on the clipboard and returns the text it replaced, if any."""
+        import win32clipboard
+
+        win32clipboard.OpenClipboard()
+        try:
+            try:
+                previous = win32clipboard.GetClipboardData(win32clipboard.CF_UNICODETEXT)
+            except Exception:
+                previous = None
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
+        finally:
+            win32clipboard.CloseClipboard()
+        return previous
+
+    def enter_text(
+            self,
+            element: UIAWrapper | WindowSpecification,
+            text: str,
+            *,
+            strategies: Sequence[TextEntryStrategy] = ("value", "clipboard", "keys"),
+            verify: bool = True,
+        ) -> TextEntryStrategy:
+        """
+        Replace the text of an edit control, trying each strategy in turn until the
+        value reads back as `text`.
+
+        - `value`:      Set it through the UIA value pattern. No focus or keystrokes needed.
+        - `clipboard`:  Focus the control, select all and paste. The previous clipboard text is restored.
+        - `keys`:       Focus the control, select all and type it as one batched input.
+
+        All three take the same time regardless of the length of `text`.
+
+        :param  element:    The edit control.
+        :type   element:    UIAWrapper | WindowSpecification
+        :param  text:       The text to enter.
+        :type   text:       str
+        :param  strategies: Strategies to try, in order.
+        :type   strategies: Sequence[TextEntryStrategy] = ("value", "clipboard", "keys")
+        :param  verify:     Confirm the value by reading it back. Skipped for controls that cannot be read.
+        :type   verify:     bool = True
+        :returns: The strategy that succeeded.
+        :rtype: TextEntryStrategy
+        :raises TextEntryFailed: If no strategy could set and confirm the value.
+        """
+        unknown = [strategy for strategy in strategies if strategy not in ("value", "clipboard", "keys")]
+        if unknown:
+            raise ValueError(f"Unknown text entry strategies `{unknown}`.")
+
+        attempts: dict[str, str] = {}
+        try:
+            wrapper = ELEMENT_CACHE.resolve(element) if isinstance(element, WindowSpecification) else element
+        except Exception as e:
+            raise TextEntryFailed(str(element), {"resolve": str(e)}) from e
+
+        for strategy in strategies:
+            start = time.perf_counter()
+            try:
+                with self.input_lock:
+                    if strategy == "value":
+                        wrapper.iface_value.SetValue(text)
+                    elif strategy == "clipboard":
+                        self.set_focus(wrapper)
+                        previous = self._set_clipboard_text(text)
+                        try:
+                            self.send_input(keys=[["ctrl", "a"], ["ctrl", "v"]])
+                        finally:
+                            if previous is not None:
+                                self._set_clipboard_text(previous)
+                    else:
+                        self.set_focus(wrapper)
+                        self.send_input(keys=["ctrl", "a"])
+                        self.send_input(string=text)
+            except Exception as e:
+                attempts[strategy] = f"{type(e).__name__}: {e}"
+                self.logger.debug(f"Text entry strategy `{strategy}` failed: {e}")
+                continue
+
+            self.invalidate_snapshot()
+            current = self.read_text(wrapper) if verify else None
+            if current is None or current == text:
+                self.logger.debug(f"Entered text with strategy `{strategy}` in `{time.perf_counter() - start:.4f}`s.")
+                return strategy
+
+            attempts[strategy] = f"read back `{current}`"
+            self.logger.debug(f"Text entry strategy `{strategy}` read back `{current}` instead of `{text}`.")
+
+        error = TextEntryFailed(str(element), attempts)
+        self.logger.error(error)
+        raise error
+
+
+    def press(
+            self,
+            element: UIAWrapper | WindowSpecification,
+            *,
+            paths: Sequence[PressPath] = ("invoke", "toggle", "select", "default_action", "click"),
+            opens_modal: bool = False,
+        ) -> PressPath:
+        """
+        Press a button through its accessibility actions, falling back to a physical click.
+
+        The accessibility paths (UIA invoke, toggle and selection-item select, then the
+        MSAA default action) need neither focus, visibility nor a free cursor. Only
+        `click` moves the mouse. Each path's duration is recorded in `press_timings`
+        and each failed attempt in `press_failures`.
+
+        UIA `Invoke` on a button that opens a modal dialog may not return until the
+        dialog closes, which would hold `input_lock` the whole time. Such buttons are
+        pressed with `opens_modal`, which goes straight to `click`.
+
+        :param  element:    The button.
+        :type   element:    UIAWrapper | WindowSpecification
+        :param  paths:      Paths to try, in order.
+        :type   paths:      Sequence[PressPath] = ("invoke", "toggle", "select", "default_action", "click")
+        :param  opens_modal: The button opens a modal dialog; only `click` is tried.
+        :type   opens_modal: bool = False
+        :returns: The path that pressed the button.
+        :rtype: PressPath
+        :raises RuntimeError: If every path failed.
+        """
+        wrapper = ELEMENT_CACHE.resolve(element) if isinstance(element, WindowSpecification) else element
+        # Read before pressing; the button's dialog may be gone afterwards.
+        name = wrapper.window_text()
+        actions: Dict[str, Callable[[], Any]] = {
+            "invoke":           lambda: wrapper.iface_invoke.Invoke(),
+            "toggle":           lambda: wrapper.iface_toggle.Toggle(),
+            "select":           lambda: wrapper.iface_selection_item.Select(),
+            "default_action":   lambda: wrapper.iface_legacy_iaccessible.DoDefaultAction(),
+            "click":            lambda: wrapper.click_input(),
+        }
+
+        if opens_modal:
+            paths = ("click",)
+
+        errors: List[str] = []
+        self.latency.begin(f"press {name}", "press")
+        for path in paths:
+            start = time.perf_counter()
+            try:
+                with self.input_lock:
+                    actions[path]()
+            except Exception as e:
+                self.press_failures[path] += 1
+                errors.append(f"{path}: {type(e).__name__}")
+                continue
+
+            elapsed = time.perf_counter() - start
+            self.press_timings[path].append(elapsed)
+            self.invalidate_snapshot()
+            self.logger.debug(f"Pressed `{name}` via `{path}` in `{elapsed:.4f}`s.")
+            return path
+
+        raise RuntimeError(f"Unable to press `{element}`. Attempts: {errors}.")
 
+    def press_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return the count, failures, mean and max duration of every press path used so far."""
+        stats: Dict[str, Dict[str, float]] = {}
+        for path in set(self.press_timings) | set(self.press_failures):
+            timings = self.press_timings.get(path, ())
+            stats[path] = {
+                "count":    len(timings),
+                "failures": self.press_failures.get(path, 0),
+                "mean":     sum(timings) / len(timings) if timings else 0.0,
+                "max":      max(timings, default=0.0),
+            }
+        return stats
 
 
     @overload
@@ -304,7 +750,10 @@ class WindowManager:
 
         coords = (x, y)
         if click:
-            pywinauto.mouse.click(coords=coords)
+            self.invalidate_snapshot()
+            self.latency.begin("click", "click")
+            with self.input_lock:
+                pywinauto.mouse.click(coords=coords)
         else:
             pywinauto.mouse.move(coords=coords)
     
@@ -3,11 +3,14 @@
 from .invoice   import Invoice
 from .report    import Report
 from .image     import Image
-from .element   import Element
+from .element   import Element, ElementCache, LocatorStore, ELEMENT_CACHE
 
 __all__ = [
            "Invoice",
            "Report",
            "Image",
            "Element",
+           "ElementCache",
+           "LocatorStore",
+           "ELEMENT_CACHE",
           ]
@@ -1,9 +1,419 @@
 # src\quickbooks_gui_api\models\element.py
 
-from typing import Literal
+import re
+import json
+import time
+import logging
+import threading
+
+from pathlib import Path
+from collections import OrderedDict
+from typing import Literal, Any, Hashable, NamedTuple
 
 from pywinauto import WindowSpecification
 
+CacheKey = tuple[int, int, Hashable]
+
+
+class LocatorStep(NamedTuple):
+    """
+    One hop of a compiled locator path.
+    Attributes:
+        index (int): Position of the child among its parent's UIA children.
+        auto_id (str): The child's automation id, checked when the path is replayed.
+        control_type (str): The child's control type, checked when the path is replayed.
+    """
+    index:          int
+    auto_id:        str
+    control_type:   str
+
+
+LocatorPath = tuple[LocatorStep, ...]
+
+
+class LocatorStore:
+    """
+    Compiled locator paths, kept per QuickBooks build since a different build may lay
+    its windows out differently. Optionally persisted as JSON so paths learned in one
+    run are replayed in the next.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        build (str): The QuickBooks build paths are read from and learned for.
+        path (Path | None): JSON file the store is persisted to, or None to keep it in memory.
+    """
+
+    def __init__(self, path: Path | None = None, build: str = "", logger: logging.Logger | None = None) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.build  = build
+        self.path   = path
+        self._lock  = threading.Lock()
+        self._paths: dict[str, dict[str, LocatorPath]] = {}
+        if path is not None:
+            self.load()
+
+    def configure(self, build: str, path: Path | None = None) -> None:
+        """Selects the QuickBooks build and, if it changed, the file backing the store."""
+        self.build = build
+        if path != self.path:
+            self.path = path
+            if path is not None:
+                self.load()
+
+    def get(self, key: str) -> LocatorPath | None:
+        with self._lock:
+            return self._paths.get(self.build, {}).get(key)
+
+    def put(self, key: str, path: LocatorPath) -> None:
+        with self._lock:
+            self._paths.setdefault(self.build, {})[key] = path
+        self.save()
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            removed = self._paths.get(self.build, {}).pop(key, None)
+        if removed is not None:
+            self.save()
+
+    def load(self) -> None:
+        """Loads the store from `path`. A missing or unreadable file leaves it empty."""
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            with self._lock:
+                self._paths = {
+                    build: {key: tuple(LocatorStep(*step) for step in steps) for key, steps in paths.items()}
+                    for build, paths in data.items()
+                }
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable locator store `{self.path}`: {e}")
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            data = {
+                build: {key: [list(step) for step in steps] for key, steps in paths.items()}
+                for build, paths in self._paths.items()
+            }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        except OSError as e:
+            self.logger.warning(f"Unable to save locator store `{self.path}`: {e}")
+
+
+class ElementCache:
+    """
+    Cache of resolved pywinauto wrappers keyed by (session, parent handle, locator).
+    The session is the QuickBooks process id, so a restart never serves stale
+    wrappers. Liveness and visibility are checked through the cached handle instead
+    of a new search.
+
+    On a miss, a child element is first located by replaying its compiled path from
+    `locators`, a walk of child indices checked against the expected attributes.
+    Only when there is no path, or the check fails, is the subtree searched; the path
+    of the element found is then learned.
+
+    A replay enumerates the children of every element on the path, which is not
+    necessarily cheaper than one `child_window` search. Both are timed, and once
+    `min_samples` of each have been taken, replay is skipped while its mean time
+    exceeds the search's. `stats` reports both means.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        locators (LocatorStore): Compiled locator paths.
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups that required a search.
+        invalidations (int): Entries dropped because their window closed or was hidden, or the session ended.
+        replays (int): Misses served by replaying a compiled path.
+        replay_failures (int): Compiled paths that no longer led to the expected element.
+        replay_seconds (float): Total time spent replaying paths that led to the element.
+        search_seconds (float): Total time spent in `child_window` searches.
+        searches (int): Number of timed searches.
+    """
+
+    # Criteria added by pywinauto itself that do not describe the element.
+    _IGNORED_CRITERIA = frozenset({"top_level_only", "backend"})
+    # Criteria that identify a process or session rather than the element, left out of path keys.
+    _SESSION_CRITERIA = frozenset({"app", "backend", "process", "top_level_only"})
+
+    def __init__(
+            self,
+            max_entries: int = 256,
+            logger: logging.Logger | None = None,
+            locators: LocatorStore | None = None,
+            min_samples: int = 5,
+        ) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.max_entries    = max_entries
+        self.hits           = 0
+        self.misses         = 0
+        self.invalidations  = 0
+        self.replays        = 0
+        self.replay_failures = 0
+        self.replay_seconds = 0.0
+        self.search_seconds = 0.0
+        self.searches       = 0
+        self.min_samples    = min_samples
+        self.locators       = locators or LocatorStore(logger=self.logger)
+
+        self._lock      = threading.RLock()
+        self._entries:  OrderedDict[CacheKey, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _locator(criteria: dict[str, Any]) -> Hashable:
+        return tuple(sorted((key, repr(value)) for key, value in criteria.items()))
+
+    @classmethod
+    def _path_key(cls, chain: list[dict[str, Any]]) -> str:
+        """
+        Key of a compiled path, built only from criteria that are stable across runs.
+        `app` (whose repr holds a memory address), `backend` and `process` are left out.
+        """
+        return json.dumps(
+            [sorted((key, repr(value)) for key, value in criteria.items() if key not in cls._SESSION_CRITERIA) for criteria in chain]
+        )
+
+    def _replay_pays(self) -> bool:
+        """False once enough samples show replaying is slower than searching."""
+        if self.replays < self.min_samples or self.searches < self.min_samples:
+            return True
+        return self.replay_seconds / self.replays <= self.search_seconds / self.searches
+
+    @staticmethod
+    def _session(spec: WindowSpecification) -> int:
+        app = getattr(spec, "app", None)
+        return getattr(app, "process", None) or spec.criteria[0].get("process") or 0
+
+    @staticmethod
+    def is_alive(wrapper: Any) -> bool:
+        """
+        Checks that a resolved wrapper still refers to a live, shown control without searching for it.
+        Windowed controls are checked with `IsWindow` and `IsWindowVisible`, so a hidden window is
+        not served; windowless ones with a single `IsOffscreen` property read.
+        """
+        handle = getattr(wrapper, "handle", None)
+        if handle:
+            import win32gui
+            return bool(win32gui.IsWindow(handle)) and bool(win32gui.IsWindowVisible(handle))
+        try:
+            return not wrapper.element_info.element.CurrentIsOffscreen
+        except Exception:
+            return False
+
+    def _get(self, key: CacheKey) -> Any | None:
+        with self._lock:
+            wrapper = self._entries.get(key)
+            if wrapper is None:
+                return None
+            if not self.is_alive(wrapper):
+                del self._entries[key]
+                self.invalidations += 1
+                return None
+            self._entries.move_to_end(key)
+            return wrapper
+
+    def _put(self, key: CacheKey, wrapper: Any) -> None:
+        with self._lock:
+            self._entries[key] = wrapper
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _lookup(self, key: CacheKey, search: Any) -> Any:
+        wrapper = self._get(key)
+        if wrapper is not None:
+            self.hits += 1
+            return wrapper
+
+        self.misses += 1
+        wrapper = search()
+        self._put(key, wrapper)
+        return wrapper
+
+    @staticmethod
+    def _find(spec: WindowSpecification, timeout: float | None) -> Any:
+        """
+        Searches for `spec`. `wrapper_object` waits the global `Timings.window_find_timeout`
+        for a missing element, so with a `timeout` the search is bounded by `exists` first.
+        """
+        if timeout is not None and not spec.exists(timeout=timeout):
+            from pywinauto.findwindows import ElementNotFoundError
+            raise ElementNotFoundError(spec.criteria[-1])
+        return spec.wrapper_object()
+
+    def resolve(self, spec: WindowSpecification, timeout: float | None = None) -> Any:
+        """
+        Resolves a window specification to its wrapper, serving live cached wrappers.
+
+        :param spec: The specification to resolve.
+        :type  spec: WindowSpecification
+        :param timeout: Seconds a search may wait for the element, 0 for a single probe.
+            Defaults to pywinauto's `Timings.window_find_timeout`.
+        :type  timeout: float | None = None
+        :returns: The resolved wrapper.
+        :rtype: pywinauto.controls.uiawrapper.UIAWrapper
+        :raises pywinauto.findwindows.ElementNotFoundError: If a search is needed and finds nothing.
+        """
+        session = self._session(spec)
+        root_criteria = spec.criteria[0]
+
+        if len(spec.criteria) == 1:
+            return self._lookup((session, 0, self._locator(root_criteria)), lambda: self._find(spec, timeout))
+
+        root = self._lookup(
+            (session, 0, self._locator(root_criteria)),
+            lambda: self._find(WindowSpecification(dict(root_criteria)), timeout),
+        )
+        locator = tuple(self._locator(criteria) for criteria in spec.criteria[1:])
+        path_key = self._path_key(spec.criteria)
+        return self._lookup((session, root.handle or 0, locator), lambda: self._search(spec, root, path_key, timeout))
+
+    @classmethod
+    def _matches(cls, info: Any, criteria: dict[str, Any]) -> bool | None:
+        """Checks `info` against `criteria`. Returns None if a criterion cannot be checked."""
+        for key, value in criteria.items():
+            if key in cls._IGNORED_CRITERIA:
+                continue
+            if key == "control_type":
+                actual, expected = info.control_type, value
+            elif key == "title":
+                actual, expected = info.name, value
+            elif key == "auto_id":
+                actual, expected = info.automation_id, str(value)
+            elif key == "class_name":
+                actual, expected = info.class_name, value
+            elif key == "title_re":
+                if re.match(value, info.name or "") is None:
+                    return False
+                continue
+            else:
+                return None
+            if actual != expected:
+                return False
+        return True
+
+    def _search(self, spec: WindowSpecification, root: Any, path_key: str, timeout: float | None = None) -> Any:
+        criteria = spec.criteria[-1]
+        replay = self._replay_pays()
+        path = self.locators.get(path_key) if replay else None
+
+        if path is not None:
+            start = time.perf_counter()
+            wrapper = self._replay(root, path, criteria)
+            if wrapper is not None:
+                self.replays += 1
+                self.replay_seconds += time.perf_counter() - start
+                return wrapper
+            self.replay_failures += 1
+            self.locators.discard(path_key)
+            self.logger.debug(f"Compiled locator path for `{criteria}` is stale, searching.")
+
+        start = time.perf_counter()
+        wrapper = self._find(spec, timeout)
+        self.searches += 1
+        self.search_seconds += time.perf_counter() - start
+        if replay and self._matches(wrapper.element_info, criteria):
+            learned = self._learn(root, wrapper)
+            if learned:
+                self.locators.put(path_key, learned)
+        return wrapper
+
+    def _replay(self, root: Any, path: LocatorPath, criteria: dict[str, Any]) -> Any | None:
+        from pywinauto.controls.uiawrapper import UIAWrapper
+
+        info = root.element_info
+        try:
+            for step in path:
+                children = info.children()
+                if step.index >= len(children):
+                    return None
+                info = children[step.index]
+                if info.automation_id != step.auto_id or info.control_type != step.control_type:
+                    return None
+            if not self._matches(info, criteria):
+                return None
+        except Exception:
+            return None
+        return UIAWrapper(info)
+
+    @staticmethod
+    def _learn(root: Any, wrapper: Any, max_depth: int = 32) -> LocatorPath:
+        """Walks from `wrapper` up to `root`, recording each hop. Returns () if `root` is not reached."""
+        root_info = root.element_info
+        info = wrapper.element_info
+        steps: list[LocatorStep] = []
+        try:
+            while info != root_info:
+                if len(steps) >= max_depth:
+                    return ()
+                parent = info.parent
+                if parent is None:
+                    return ()
+                steps.append(LocatorStep(parent.children().index(info), info.automation_id, info.control_type))
+                info = parent
+        except Exception:
+            return ()
+        return tuple(reversed(steps))
+
+    def invalidate_handle(self, handle: int) -> None:
+        """Drops every entry that is, or is parented by, the window `handle`."""
+        with self._lock:
+            stale = [
+                key for key, wrapper in self._entries.items()
+                if key[1] == handle or getattr(wrapper, "handle", None) == handle
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def invalidate_session(self, session: int) -> None:
+        """Drops every entry belonging to the QuickBooks process `session`."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == session]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Returns hit, miss and invalidation counts, the hit rate, and mean replay and search times."""
+        lookups = self.hits + self.misses
+        return {
+            "hits":             self.hits,
+            "misses":           self.misses,
+            "invalidations":    self.invalidations,
+            "replays":          self.replays,
+            "replay_failures":  self.replay_failures,
+            "replay_mean":      self.replay_seconds / self.replays if self.replays else 0.0,
+            "search_mean":      self.search_seconds / self.searches if self.searches else 0.0,
+            "entries":          len(self._entries),
+            "hit_rate":         self.hits / lookups if lookups else 0.0,
+        }
+
+
+ELEMENT_CACHE: ElementCache = ElementCache()
+
+
 class Element:
     def __init__(
             self,
@@ -12,13 +422,14 @@ class Element:
             auto_id:        str | int | None = None,
             parent:         WindowSpecification | None = None
         ) -> None:
-    
+
         self._control_type  = control_type
         self._title         = title
         self._auto_id       = str(auto_id)
         self._parent        = parent
-        
-        self._as_element: WindowSpecification | None = None
+
+        self._as_element:           WindowSpecification | None = None
+        self._as_element_parent:    WindowSpecification | None = None
 
     def __str__(self) -> str:
         return f"{{control_type: `{self._control_type}`, title: `{self._title}`, auto_id: `{self._auto_id}`}}"
@@ -26,11 +437,11 @@ class Element:
     @property
     def control_type(self) -> str | None:
         return self._control_type
-    
+
     @property
     def title(self) -> str | None:
         return self._title
-    
+
     @property
     def auto_id(self) -> str | None:
         return self._auto_id
@@ -48,18 +459,31 @@ class Element:
             for key, value in mapping.items()
             if value not in (None, "", "None")
         }
-    
+
     def as_element(self, parent: WindowSpecification | None = None) -> WindowSpecification:
 
-        if self._as_element is None:    
-            if parent is None:
-                if self._parent is not None:
-                    parent = self._parent
-                else:
-                    raise    
-                
-            self._as_element = parent.child_window(**self.kwargs)
+        if parent is None:
+            if self._parent is not None:
+                parent = self._parent
+            else:
+                raise ValueError(f"No parent provided for element {self}.")
+
+        # Rebuild the specification when the parent changes, e.g. after a restart.
+        if self._as_element is None or self._as_element_parent is not parent:
+            self._as_element        = parent.child_window(**self.kwargs)
+            self._as_element_parent = parent
 
         return self._as_element
-        
 
+    def resolve(self, parent: WindowSpecification | None = None, timeout: float | None = None) -> Any:
+        """
+        Resolves the element to a live wrapper through the shared `ELEMENT_CACHE`.
+
+        :param parent: Parent window to search under. Defaults to the element's own parent.
+        :type  parent: WindowSpecification | None = None
+        :param timeout: Seconds a search may wait for the element, 0 for a single probe.
+        :type  timeout: float | None = None
+        :returns: The resolved wrapper.
+        :rtype: pywinauto.controls.uiawrapper.UIAWrapper
+        """
+        return ELEMENT_CACHE.resolve(self.as_element(parent), timeout)
@@ -0,0 +1,356 @@
+# src\quickbooks_gui_api\warm_start.py
+
+from __future__ import annotations
+
+import time
+import bisect
+import logging
+import threading
+
+from pathlib    import Path
+from datetime   import datetime
+from typing     import Any, Callable, Iterable, Literal, NamedTuple
+
+
+WarmState = Literal["cold", "warming", "checking", "stopping", "warm", "in_use"]
+
+# States in which a thread is launching, checking or closing QuickBooks without the lock.
+_TRANSITIONAL: tuple[WarmState, ...] = ("warming", "checking", "stopping")
+
+
+def _join_com_apartment() -> Callable[[], None]:
+    """
+    Initializes COM on the calling thread in the multithreaded apartment, where the
+    UI Automation objects behind a `uia` `Application` can be shared between threads.
+
+    :returns: The matching uninitialize, to call when the thread is done with COM.
+    :rtype: Callable[[], None]
+    """
+    try:
+        import pythoncom
+    except ImportError:
+        return lambda: None
+    try:
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+    except pythoncom.com_error:
+        return lambda: None  # Already initialized as a single-threaded apartment.
+    return pythoncom.CoUninitialize
+
+
+class WarmSession(NamedTuple):
+    """
+    A started, logged in QuickBooks session.
+    Attributes:
+        app (Any): The connected `pywinauto.Application`.
+        window (Any): The main `pywinauto.WindowSpecification`.
+        started_at (float): Clock time the session became ready.
+    """
+    app:        Any
+    window:     Any
+    started_at: float
+
+
+class WarmStarter:
+    """
+    Starts QuickBooks, selects the company and logs in ahead of scheduled jobs, so a
+    job is handed a ready `(app, window)` instead of paying for a cold start.
+
+    `tick` advances the state machine once and is what `start` runs on a background
+    thread; it can equally be called from the caller's own loop. While warm and not in
+    use, the session is health checked every `health_interval` seconds and restarted
+    if it failed. It is shut down once idle for `idle_timeout` seconds with no job due.
+
+    QuickBooks is launched, health checked and closed without holding the lock, so
+    scheduling and status calls never wait on it; the state is flipped to `warming`,
+    `checking` or `stopping` first, and an `acquire` meanwhile waits for it to finish.
+    The background thread joins the multithreaded COM apartment before launching. A
+    session warmed there is handed over through `attach`, called on the acquiring
+    thread, so the job drives `pywinauto` objects created on its own thread.
+    Attributes:
+        logger (logging.Logger): Logger instance for logging operations.
+        lead_time (float): Seconds before a job to start warming.
+        idle_timeout (float): Seconds an unused session is kept when no job is due.
+        health_interval (float): Seconds between health checks of an idle session.
+        session (WarmSession | None): The current session.
+        state (WarmState): `cold`, `warming`, `checking`, `stopping`, `warm` or `in_use`.
+        stats (dict[str, int]): `warm_starts`, `cold_starts`, `hits`, `restarts` and `idle_shutdowns`.
+    """
+
+    def __init__(
+            self,
+            launch: Callable[[], tuple[Any, Any]],
+            close: Callable[[], None],
+            healthy: Callable[[], bool],
+            *,
+            attach: Callable[[], tuple[Any, Any]] | None = None,
+            lead_time: float = 300.0,
+            idle_timeout: float = 900.0,
+            health_interval: float = 60.0,
+            poll_interval: float = 5.0,
+            clock: Callable[[], float] = time.time,
+            logger: logging.Logger | None = None,
+        ) -> None:
+        if logger is None:
+            self.logger = logging.getLogger(__name__)
+        elif isinstance(logger, logging.Logger):
+            self.logger = logger
+        else:
+            raise TypeError("Provided parameter `logger` is not an instance of `logging.Logger`.")
+
+        self.lead_time          = lead_time
+        self.idle_timeout       = idle_timeout
+        self.health_interval    = health_interval
+        self.poll_interval      = poll_interval
+
+        self.session:   WarmSession | None = None
+        self.state:     WarmState = "cold"
+        self.stats:     dict[str, int] = {"warm_starts": 0, "cold_starts": 0, "hits": 0, "restarts": 0, "idle_shutdowns": 0}
+
+        self._launch        = launch
+        self._close         = close
+        self._healthy       = healthy
+        self._attach        = attach
+        self._clock         = clock
+        self._jobs:         list[float] = []
+        self._last_used     = 0.0
+        self._last_check    = 0.0
+        self._lock          = threading.Condition()
+        self._stop          = threading.Event()
+        self._thread:       threading.Thread | None = None
+
+    @classmethod
+    def for_api(
+            cls,
+            api: Any,
+            username: str,
+            password: str,
+            *,
+            config_directory: Path | None = None,
+            config_file_name: str | None = None,
+            **kwargs: Any,
+        ) -> WarmStarter:
+        """
+        Builds a warm starter around a `QuickBookGUIAPI`, reading the lead time, idle
+        timeout and health interval from its config unless given in `kwargs`.
+        """
+        startup_kwargs: dict[str, Any] = {}
+        if config_directory is not None:
+            startup_kwargs["config_directory"] = config_directory
+        if config_file_name is not None:
+            startup_kwargs["config_file_name"] = config_file_name
+
+        from quickbooks_gui_api.gui_api import DEFAULT_CONFIG_FOLDER_PATH, DEFAULT_CONFIG_FILE_NAME
+        api._load_config_basic(config_directory or DEFAULT_CONFIG_FOLDER_PATH, config_file_name or DEFAULT_CONFIG_FILE_NAME)
+        kwargs.setdefault("lead_time", api.warm_lead_time)
+        kwargs.setdefault("idle_timeout", api.warm_idle_timeout)
+        kwargs.setdefault("health_interval", api.warm_health_interval)
+        kwargs.setdefault("logger", api.logger if isinstance(api.logger, logging.Logger) else None)
+
+        return cls(
+            launch  = lambda: api.startup(username, password, **startup_kwargs),
+            close   = api.shutdown,
+            healthy = api.is_healthy,
+            attach  = api._connect_to_app,
+            **kwargs,
+        )
+
+    def schedule(self, times: Iterable[datetime | float]) -> None:
+        """
+        Adds upcoming job start times, as datetimes or clock timestamps.
+        """
+        with self._lock:
+            for when in times:
+                bisect.insort(self._jobs, when.timestamp() if isinstance(when, datetime) else float(when))
+
+    def next_job(self) -> float | None:
+        with self._lock:
+            return self._jobs[0] if self._jobs else None
+
+    def _job_due(self, now: float) -> bool:
+        return bool(self._jobs) and self._jobs[0] - now <= self.lead_time
+
+    def _warm(self, now: float, ready: WarmState = "warm") -> WarmSession:
+        """Launches QuickBooks without the lock, once the state is `warming`, then enters `ready`."""
+        try:
+            app, window = self._launch()
+        except Exception:
+            with self._lock:
+                self.state = "cold"
+                self.session = None
+                self._lock.notify_all()
+            raise
+        session = WarmSession(app, window, self._clock())
+        with self._lock:
+            self.session = session
+            self.state = ready
+            self._last_used = self._last_check = session.started_at
+            self._lock.notify_all()
+        self.logger.info(f"QuickBooks warm in `{session.started_at - now:.1f}`s.")
+        return session
+
+    def _retire(self) -> None:
+        """Takes the session out of use under the lock, before `_shutdown` closes it."""
+        self.session = None
+        self.state = "stopping"
+
+    def _shutdown(self, reason: str, then: WarmState | None = "cold") -> None:
+        """Closes QuickBooks without the lock, once retired, then enters `then` unless None."""
+        self.logger.info(f"Shutting down warm QuickBooks session: {reason}.")
+        try:
+            self._close()
+        except Exception:
+            self.logger.exception("Error while shutting down the warm QuickBooks session.")
+        if then is not None:
+            self._publish(then)
+
+    def _publish(self, state: WarmState) -> None:
+        with self._lock:
+            self.state = state
+            self._lock.notify_all()
+
+    def _is_healthy(self) -> bool:
+        try:
+            return bool(self._healthy())
+        except Exception as e:
+            self.logger.debug(f"Health check raised: {e}")
+            return False
+
+    def tick(self) -> WarmState:
+        """
+        Advances the state machine once: warms ahead of a due job, health checks and
+        restarts an idle session, and shuts down a session idle past the timeout.
+
+        :returns: The state afterwards.
+        :rtype: WarmState
+        """
+        with self._lock:
+            now = self._clock()
+            # Jobs that were never claimed are forgotten once the idle timeout has passed.
+            while self._jobs and self._jobs[0] < now - self.idle_timeout:
+                self._jobs.pop(0)
+
+            check = self.state == "warm" and now - self._last_check >= self.health_interval
+            if check:
+                self._last_check = now
+                self.state = "checking"
+
+        if check:
+            if self._is_healthy():
+                self._publish("warm")
+            else:
+                with self._lock:
+                    self.stats["restarts"] += 1
+                    self._retire()
+                self._shutdown("health check failed")
+
+        idle = None
+        with self._lock:
+            if self.state == "warm" and not self._job_due(now) and now - self._last_used >= self.idle_timeout:
+                self.stats["idle_shutdowns"] += 1
+                self._retire()
+                idle = now - self._last_used
+        if idle is not None:
+            self._shutdown(f"idle for `{idle:.0f}`s with no job due")
+
+        with self._lock:
+            if self.state != "cold" or not self._job_due(now):
+                return self.state
+            self.state = "warming"
+
+        try:
+            self._warm(now)
+            with self._lock:
+                self.stats["warm_starts"] += 1
+        except Exception:
+            self.logger.exception("Warm start failed; the job will start QuickBooks itself.")
+        return self.state
+
+    def acquire(self) -> tuple[Any, Any]:
+        """
+        Hands the session to a job that is starting, warming it first if needed. The
+        earliest job due within the lead time is claimed. A warm start, health check or
+        shutdown in progress is waited for rather than raced.
+
+        :returns: The ready `(app, window)`.
+        :rtype: tuple[pywinauto.Application, pywinauto.WindowSpecification]
+        """
+        with self._lock:
+            now = self._clock()
+            if self._job_due(now):
+                self._jobs.pop(0)
+
+            self._lock.wait_for(lambda: self.state not in _TRANSITIONAL)
+            claimed = self.state == "warm" and self.session is not None
+            stale = not claimed and self.session is not None
+            if stale:
+                self.stats["restarts"] += 1
+                self._retire()
+            # A claimed session is left alone by `tick` while it is checked below; a
+            # replacement is `warming` from here, so the close and launch are not raced.
+            self.state = "in_use" if claimed else "warming"
+
+        if stale:
+            self._shutdown("not healthy at hand-over", then=None)
+
+        if claimed:
+            try:
+                app, window = self._attach() if self._attach is not None else (self.session.app, self.session.window)
+                healthy = self._is_healthy()
+            except Exception as e:
+                self.logger.debug(f"Attaching to the warm session failed: {e}")
+                healthy = False
+            with self._lock:
+                if healthy:
+                    self.session = self.session._replace(app=app, window=window)
+                    self.stats["hits"] += 1
+                    return app, window
+                self.stats["restarts"] += 1
+                self.session = None
+                self.state = "warming"
+            self._shutdown("not healthy at hand-over", then=None)
+
+        self.logger.info("No warm QuickBooks session available; starting cold.")
+        session = self._warm(now, ready="in_use")
+        with self._lock:
+            self.stats["cold_starts"] += 1
+        return session.app, session.window
+
+    def release(self) -> None:
+        """Returns the session after a job, starting its idle timeout."""
+        with self._lock:
+            if self.state == "in_use":
+                self.state = "warm"
+            self._last_used = self._last_check = self._clock()
+
+    def start(self) -> None:
+        """Runs `tick` every `poll_interval` seconds on a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="WarmStarter", daemon=True)
+        self._thread.start()
+
+    def stop(self, shutdown: bool = True, timeout: float = 5.0) -> None:
+        """Stops the background thread and, by default, the session."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            stopping = shutdown and self.session is not None and self.state not in _TRANSITIONAL
+            if stopping:
+                self._retire()
+        if stopping:
+            self._shutdown("warm starter stopped")
+
+    def _run(self) -> None:
+        leave_com_apartment = _join_com_apartment()
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.tick()
+                except Exception:
+                    self.logger.exception("Warm start tick failed.")
+                self._stop.wait(self.poll_interval)
+        finally:
+            leave_com_apartment()
@@ -0,0 +1,24 @@
+# tests\conftest.py
+
+import sys
+import types
+import importlib
+
+from pathlib import Path
+
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+# The package `__init__` modules import pywinauto and pywin32, which only install on
+# Windows. Where they are missing, register the packages without running them, so the
+# modules that only need the standard library can still be imported and tested.
+for name in ("quickbooks_gui_api", "quickbooks_gui_api.managers"):
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        package = types.ModuleType(name)
+        package.__path__ = [str(SRC.joinpath(*name.split(".")))]
+        sys.modules[name] = package
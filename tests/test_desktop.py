@@ -0,0 +1,100 @@
+# tests\test_desktop.py
+
+from quickbooks_gui_api.managers.desktop import FakeWindowBackend, WindowRecord, select_top_dialog
+
+
+PID = 4242
+
+
+def _window(handle: int, title: str, z_order: int, *, owner: int = 0, frame: int = 0, visible: bool = True, enabled: bool = True) -> WindowRecord:
+    return WindowRecord(handle, title, "Window", owner, frame, z_order, visible, enabled)
+
+
+MAIN = _window(100, "Company - QuickBooks Desktop Enterprise", 2)
+
+
+def _select(*records: WindowRecord):
+    backend = FakeWindowBackend({PID: list(records)})
+    return select_top_dialog(backend.list_windows(PID))
+
+
+def test_owned_modal_above_the_main_window_is_on_top():
+    modal = _window(200, "Create Disk File", 0, owner=MAIN.handle)
+
+    main, top = _select(MAIN, modal, _window(300, "Untitled helper", 1))
+
+    assert main == MAIN
+    assert top == modal
+
+
+def test_modal_owned_through_a_chain_of_windows_is_on_top():
+    # Save As -> Send Report to Excel -> main window.
+    send_report = _window(200, "Send Report to Excel", 1, owner=MAIN.handle, enabled=False)
+    save_as = _window(201, "Create Disk File", 0, owner=send_report.handle)
+
+    main, top = _select(MAIN, send_report, save_as)
+
+    assert main == MAIN
+    assert top == save_as
+
+
+def test_disabled_owner_is_skipped_for_its_modal():
+    # The owner is above its modal in the list, but it is disabled while the modal is open.
+    owner = _window(200, "Memorized Report List", 0, owner=MAIN.handle, enabled=False)
+    modal = _window(201, "Confirm Save As", 1, owner=owner.handle)
+
+    _, top = _select(MAIN, owner, modal)
+
+    assert top == modal
+
+
+def test_windows_owned_by_other_windows_are_ignored():
+    stray = _window(500, "Tooltip", 0, owner=999)
+
+    _, top = _select(MAIN, stray)
+
+    assert top is None
+
+
+def test_mdi_child_is_the_fallback_without_owned_modals():
+    frame = _window(100, "Company - QuickBooks Desktop Enterprise", 0)
+    behind = _window(150, "Invoice List", 1, frame=frame.handle)
+    front = _window(151, "Sales by Customer Summary", 0, frame=frame.handle)
+    hidden = _window(152, "Hidden Report", 0, frame=frame.handle, visible=False)
+
+    main, top = _select(frame, behind, hidden, front)
+
+    assert main == frame
+    assert top == front
+
+
+def test_main_window_hosting_mdi_children_wins_over_other_titles():
+    splash = _window(90, "QuickBooks Update Service", 0)
+    frame = _window(100, "Company - QuickBooks Desktop Enterprise", 1)
+    child = _window(150, "Open Invoices", 0, frame=frame.handle)
+
+    main, top = _select(splash, frame, child)
+
+    assert main == frame
+    assert top == child
+
+
+def test_no_main_window():
+    assert _select() == (None, None)
+    assert _select(_window(200, "Excel", 0), _window(201, "QuickBooks Login", 1, visible=False)) == (None, None)
+
+
+def test_fake_backend_records_actions_and_closes_windows():
+    modal = _window(200, "Create Disk File", 0, owner=MAIN.handle)
+    backend = FakeWindowBackend({PID: [MAIN, modal]})
+    backend.unfocusable.add(modal.handle)
+
+    backend.activate(modal.handle)
+    assert backend.foreground() == 0
+    backend.activate(MAIN.handle)
+    assert backend.foreground() == MAIN.handle
+
+    backend.close(modal.handle)
+    assert select_top_dialog(backend.list_windows(PID)) == (MAIN, None)
+    assert backend.actions == [("activate", 200), ("activate", 100), ("close", 200)]
+    assert backend.call_count == 1
@@ -0,0 +1,132 @@
+# tests\test_element.py
+
+import pytest
+
+pytest.importorskip("pywinauto")
+
+from quickbooks_gui_api.models.element import ElementCache, LocatorStore
+
+
+class FakeInfo:
+    def __init__(self) -> None:
+        self.element = self
+        self.CurrentIsOffscreen = False
+
+
+class FakeWrapper:
+    """A windowless control, so liveness is read from `IsOffscreen` rather than win32gui."""
+
+    handle = None
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.element_info = FakeInfo()
+
+    def close(self) -> None:
+        self.element_info.CurrentIsOffscreen = True
+
+
+class FakeApp:
+    def __init__(self, process: int) -> None:
+        self.process = process
+
+
+class FakeSpec:
+    """A single-level window specification that counts its searches."""
+
+    def __init__(self, app: FakeApp, present: bool = True, **criteria) -> None:
+        self.app = app
+        self.criteria = [criteria]
+        self.present = present
+        self.searches = 0
+        self.exists_timeouts: list[float | None] = []
+
+    def exists(self, timeout=None, retry_interval=None) -> bool:
+        self.exists_timeouts.append(timeout)
+        return self.present
+
+    def wrapper_object(self) -> FakeWrapper:
+        self.searches += 1
+        return FakeWrapper(self.criteria[0].get("title", ""))
+
+
+@pytest.fixture
+def cache():
+    return ElementCache(max_entries=3, locators=LocatorStore())
+
+
+def test_equal_criteria_share_an_entry_per_session(cache):
+    first, second = FakeApp(10), FakeApp(20)
+    spec = FakeSpec(first, title="Create Disk File", control_type="Window")
+
+    wrapper = cache.resolve(spec)
+    # Same criteria in another order, same process: served from the cache.
+    assert cache.resolve(FakeSpec(first, control_type="Window", title="Create Disk File")) is wrapper
+    # Same criteria in a restarted process: searched again.
+    other = FakeSpec(second, title="Create Disk File", control_type="Window")
+    assert cache.resolve(other) is not wrapper
+    assert (spec.searches, other.searches) == (1, 1)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+
+def test_dead_wrappers_are_evicted_and_searched_again(cache):
+    spec = FakeSpec(FakeApp(10), title="Save")
+
+    wrapper = cache.resolve(spec)
+    wrapper.close()
+
+    assert cache.resolve(spec) is not wrapper
+    assert spec.searches == 2
+    assert cache.invalidations == 1
+
+
+def test_invalidate_session_drops_only_that_session(cache):
+    old, new = FakeApp(10), FakeApp(20)
+    old_spec, new_spec = FakeSpec(old, title="Save"), FakeSpec(new, title="Save")
+    cache.resolve(old_spec)
+    cache.resolve(FakeSpec(old, title="Print"))
+    new_wrapper = cache.resolve(new_spec)
+
+    cache.invalidate_session(10)
+
+    assert len(cache) == 1
+    assert cache.invalidations == 2
+    assert cache.resolve(new_spec) is new_wrapper
+    cache.resolve(old_spec)
+    assert old_spec.searches == 2
+
+
+def test_least_recently_used_entry_is_dropped(cache):
+    app = FakeApp(10)
+    specs = {title: FakeSpec(app, title=title) for title in ("a", "b", "c", "d")}
+    for title in ("a", "b", "c"):
+        cache.resolve(specs[title])
+
+    cache.resolve(specs["a"])      # "b" is now the oldest.
+    cache.resolve(specs["d"])
+
+    assert len(cache) == 3
+    cache.resolve(specs["a"])
+    cache.resolve(specs["c"])
+    assert (specs["a"].searches, specs["c"].searches) == (1, 1)
+    cache.resolve(specs["b"])
+    assert specs["b"].searches == 2
+
+
+def test_timeout_bounds_the_search(cache):
+    from pywinauto.findwindows import ElementNotFoundError
+
+    app = FakeApp(10)
+    missing = FakeSpec(app, present=False, title="Confirm Save As")
+
+    with pytest.raises(ElementNotFoundError):
+        cache.resolve(missing, timeout=0)
+    # Never reaches the search that waits the global find timeout.
+    assert missing.searches == 0
+    assert missing.exists_timeouts == [0]
+
+    present = FakeSpec(app, title="Create Disk File")
+    cache.resolve(present, timeout=0)
+    cache.resolve(FakeSpec(app, title="Save"))
+    assert present.exists_timeouts == [0]
+    assert present.searches == 1
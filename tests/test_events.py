@@ -0,0 +1,115 @@
+# tests\test_events.py
+
+import threading
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("rapidfuzz")
+
+from quickbooks_gui_api.managers.desktop import WindowRecord
+from quickbooks_gui_api.managers.events import DialogRegistry, SyntheticEventSource, WindowEvent
+
+
+MAIN = 100
+
+
+def _record(handle: int, title: str, z_order: int, *, owner: int = 0, frame: int = 0) -> WindowRecord:
+    return WindowRecord(handle, title, "Window", owner, frame, z_order)
+
+
+@pytest.fixture
+def watched():
+    registry = DialogRegistry(MAIN)
+    events: list[WindowEvent] = []
+    registry.add_listener(events.append)
+    source = SyntheticEventSource()
+    source.start(1, registry.apply)
+    yield registry, source, events
+    source.stop()
+
+
+def test_events_during_hold_are_replayed_after_seed():
+    registry = DialogRegistry(MAIN)
+    source = SyntheticEventSource()
+
+    registry.hold()
+    source.start(1, registry.apply)
+    # Opens while the window list is being taken, so the list misses it.
+    source.emit("opened", 201, "Confirm Save As", owner=MAIN)
+    assert registry.top() is None
+
+    registry.seed([_record(MAIN, "Company - QuickBooks", 1), _record(200, "Create Disk File", 0, owner=MAIN)])
+    assert registry.titles() == ["Confirm Save As", "Create Disk File", "Company - QuickBooks"]
+    assert registry.top() == (201, "Confirm Save As")
+
+
+def test_seed_filters_like_select_top_dialog():
+    registry = DialogRegistry(MAIN)
+    registry.seed([
+        _record(MAIN, "Company - QuickBooks", 3),
+        _record(300, "Other Top Level", 0),
+        _record(200, "Send Report to Excel", 1, owner=MAIN),
+        _record(201, "", 2, owner=MAIN),
+        _record(150, "Open Invoices", 0, frame=MAIN),
+        _record(151, "Elsewhere", 0, frame=999),
+    ])
+
+    assert registry.windows() == [(200, "Send Report to Excel"), (150, "Open Invoices"), (MAIN, "Company - QuickBooks")]
+
+
+def test_owned_chain_and_unrelated_windows(watched):
+    registry, source, _ = watched
+    registry.seed([_record(MAIN, "Company - QuickBooks", 0)])
+
+    source.emit("opened", 200, "Send Report to Excel", owner=MAIN)
+    source.emit("opened", 201, "Create Disk File", owner=200)
+    source.emit("opened", 300, "Some Other App", owner=999)
+
+    assert registry.top_title() == "Create Disk File"
+    assert registry.find("Some Other App") is None
+
+
+def test_listeners_receive_applied_events_with_known_titles(watched):
+    registry, source, events = watched
+    registry.seed([_record(MAIN, "Company - QuickBooks", 0)])
+
+    source.emit("opened", 200, "Create Disk File", owner=MAIN)
+    source.emit("focused", 200)
+    source.emit("closed", 200)
+    source.emit("closed", 200)          # Already gone: not applied, not dispatched.
+    source.emit("opened", 300, "Stray", owner=999)
+
+    assert [(event.kind, event.title) for event in events] == [
+        ("opened", "Create Disk File"),
+        ("focused", "Create Disk File"),
+        ("closed", "Create Disk File"),
+    ]
+    registry.remove_listener(events.append)
+    source.emit("opened", 201, "Confirm Save As", owner=MAIN)
+    assert len(events) == 3
+
+
+def test_wait_for_change_wakes_on_an_event(watched):
+    registry, source, _ = watched
+    registry.seed([_record(MAIN, "Company - QuickBooks", 0)])
+
+    assert not registry.wait_for_change(0.01)
+
+    timer = threading.Timer(0.05, source.emit, ("opened", 200, "Create Disk File"), {"owner": MAIN})
+    timer.start()
+    assert registry.wait_for_change(5.0)
+    timer.join()
+
+
+def test_wait_for_dialog_means_on_top(watched):
+    registry, source, _ = watched
+    registry.seed([_record(MAIN, "Company - QuickBooks", 0), _record(200, "Send Report to Excel", 0, owner=MAIN)])
+    source.emit("opened", 201, "Confirm Save As", owner=MAIN)
+
+    # Open, but under another dialog.
+    assert registry.wait_for_dialog("Send Report to Excel", 0.01) is None
+
+    threading.Timer(0.05, source.emit, ("closed", 201)).start()
+    assert registry.wait_for_dialog("send report to excel", 5.0) == 200
+    assert registry.wait_for_close("Confirm Save As", 0.01)
@@ -0,0 +1,80 @@
+# tests\test_file.py
+
+import sys
+import time
+import threading
+
+from pathlib import Path
+
+import pytest
+
+from quickbooks_gui_api.managers.file import FileManager, StabilityProgress
+
+
+PDF = b"%PDF-1.4\n1 0 obj\n<<>>\nendobj\nxref\n0 1\n0000000000 65535 f \ntrailer\n<<>>\nstartxref\n29\n%%EOF\n"
+
+needs_quiet_window = pytest.mark.skipif(sys.platform == "win32", reason="Writers are detected directly on Windows.")
+
+
+def test_complete_file_is_accepted(tmp_path: Path):
+    path = tmp_path / "invoice.pdf"
+    path.write_bytes(PDF)
+
+    start = time.monotonic()
+    FileManager().wait_till_complete(path, 5.0, quiet_window=0.0)
+    assert time.monotonic() - start < 0.2
+
+
+@needs_quiet_window
+def test_quiet_window_is_waited_out_without_a_writer_check(tmp_path: Path):
+    path = tmp_path / "invoice.pdf"
+    path.write_bytes(PDF)
+
+    start = time.monotonic()
+    FileManager().wait_till_complete(path, 5.0, quiet_window=0.4)
+    assert 0.4 <= time.monotonic() - start < 1.0
+
+
+def test_progress_is_reported_while_the_export_grows(tmp_path: Path):
+    path = tmp_path / "report.csv"
+    path.write_text("a,b\n1")
+    reports: list[StabilityProgress] = []
+
+    def grow() -> None:
+        # The last record stays cut short until the final write.
+        with path.open("a") as fh:
+            for _ in range(10):
+                time.sleep(0.05)
+                fh.write("1" * 100)
+                fh.flush()
+            fh.write(",2\n")
+
+    writer = threading.Thread(target=grow)
+    writer.start()
+    FileManager().wait_till_complete(
+        path,
+        5.0,
+        poll_frequency      = 0.05,
+        quiet_window        = 0.0,
+        expected_size       = 10_000,
+        progress            = reports.append,
+        progress_interval   = 0.1,
+    )
+    writer.join()
+
+    assert path.read_text().endswith(",2\n")
+    assert len(reports) >= 2
+    assert all(report.path == path for report in reports)
+    assert [report.size for report in reports] == sorted(report.size for report in reports)
+    assert any(report.eta is not None and report.eta > 0 for report in reports)
+
+
+def test_unsupported_types_pass_the_quiet_window_on(tmp_path: Path):
+    path = tmp_path / "export.txt"
+    path.write_text("done")
+    reports: list[StabilityProgress] = []
+
+    start = time.monotonic()
+    FileManager().wait_till_complete(path, 5.0, quiet_window=0.3, progress=reports.append, progress_interval=0.0)
+    assert time.monotonic() - start >= 0.3
+    assert reports
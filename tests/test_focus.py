@@ -0,0 +1,82 @@
+# tests\test_focus.py
+
+import logging
+
+import pytest
+
+from quickbooks_gui_api.managers.focus import FakeFocusBackend, FocusTracker
+
+
+MAIN, DIALOG, EDIT, OTHER = 100, 200, 201, 300
+
+
+class FakeWrapper:
+    """A control that records its `set_focus` calls. Windowless when `handle` is 0."""
+
+    def __init__(self, handle: int = 0, keyboard_focus: bool = False) -> None:
+        self.handle = handle
+        self.keyboard_focus = keyboard_focus
+        self.focus_calls = 0
+
+    def has_keyboard_focus(self) -> bool:
+        return self.keyboard_focus
+
+    def set_focus(self) -> "FakeWrapper":
+        self.focus_calls += 1
+        return self
+
+
+@pytest.fixture
+def backend():
+    return FakeFocusBackend(foreground=MAIN, focused=EDIT, parents={EDIT: DIALOG, DIALOG: MAIN})
+
+
+@pytest.mark.parametrize("handle", [MAIN, DIALOG, EDIT])
+def test_already_focused_windows_are_skipped(backend, handle):
+    tracker = FocusTracker(backend)
+    wrapper = FakeWrapper(handle)
+
+    # The foreground window, the focused control, and a window containing it.
+    assert not tracker.ensure(wrapper)
+    assert wrapper.focus_calls == 0
+    assert (tracker.needed, tracker.skipped) == (0, 1)
+
+
+def test_unfocused_windows_are_focused(backend):
+    tracker = FocusTracker(backend)
+    wrapper = FakeWrapper(OTHER)
+
+    assert tracker.ensure(wrapper)
+    assert wrapper.focus_calls == 1
+    assert (tracker.needed, tracker.skipped) == (1, 0)
+
+
+def test_windowless_controls_use_keyboard_focus(backend):
+    tracker = FocusTracker(backend)
+    focused, unfocused = FakeWrapper(keyboard_focus=True), FakeWrapper()
+
+    assert not tracker.ensure(focused)
+    assert tracker.ensure(unfocused)
+    assert (focused.focus_calls, unfocused.focus_calls) == (0, 1)
+
+
+def test_parent_cycles_do_not_hang():
+    tracker = FocusTracker(FakeFocusBackend(foreground=OTHER, focused=EDIT, parents={EDIT: DIALOG, DIALOG: EDIT}))
+
+    assert tracker.ensure(FakeWrapper(MAIN))
+
+
+def test_stats_report_the_skip_rate(backend):
+    tracker = FocusTracker(backend)
+    assert tracker.stats() == {"needed": 0, "skipped": 0, "skip_rate": 0.0}
+
+    for handle in (MAIN, EDIT, OTHER, MAIN):
+        tracker.ensure(FakeWrapper(handle))
+
+    assert tracker.stats() == {"needed": 1, "skipped": 3, "skip_rate": 0.75}
+
+
+def test_logger_must_be_a_logger(backend):
+    with pytest.raises(TypeError):
+        FocusTracker(backend, logger="focus")
+    assert FocusTracker(backend, logging.getLogger("focus")).logger.name == "focus"
@@ -0,0 +1,74 @@
+# tests\test_hashing.py
+
+import json
+
+from pathlib import Path
+
+from quickbooks_gui_api.managers.hashing import HashCache, digest_file
+
+
+def _write(directory: Path, name: str, text: str) -> Path:
+    path = directory / name
+    path.write_text(text)
+    return path
+
+
+def test_misses_are_written_once_on_save(tmp_path: Path):
+    store = tmp_path / "hash_cache.json"
+    cache = HashCache(store)
+    files = [_write(tmp_path, f"export_{i}.csv", f"a,b\n{i},{i}\n") for i in range(3)]
+
+    for path in files:
+        assert cache.digest(path, "crc32") == digest_file(path, "crc32")
+    assert cache.misses == 3
+    assert not store.exists()
+
+    cache.save()
+    assert len(json.loads(store.read_text())) == 3
+
+    reloaded = HashCache(store)
+    reloaded.digest(files[0], "crc32")
+    assert reloaded.hits == 1
+
+
+def test_save_prunes_missing_files(tmp_path: Path):
+    store = tmp_path / "hash_cache.json"
+    cache = HashCache(store)
+    kept = _write(tmp_path, "kept.pdf", "%PDF-1.4")
+    gone = _write(tmp_path, "gone.pdf", "%PDF-1.7")
+    cache.digest(kept, "crc32")
+    cache.digest(gone, "crc32")
+    cache.save()
+
+    gone.unlink()
+    cache.save()
+    assert list(json.loads(store.read_text())) == [HashCache.key(kept, "crc32")]
+
+
+def test_save_keeps_the_most_recently_used_entries(tmp_path: Path):
+    store = tmp_path / "hash_cache.json"
+    cache = HashCache(store, max_entries=2)
+    first, second, third = (_write(tmp_path, f"{name}.csv", name) for name in ("first", "second", "third"))
+
+    cache.digest(first, "crc32")
+    cache.digest(second, "crc32")
+    cache.digest(first, "crc32")
+    cache.digest(third, "crc32")
+    cache.save()
+
+    assert set(json.loads(store.read_text())) == {HashCache.key(first, "crc32"), HashCache.key(third, "crc32")}
+    assert len(cache) == 2
+
+
+def test_unchanged_cache_is_not_rewritten(tmp_path: Path):
+    store = tmp_path / "hash_cache.json"
+    cache = HashCache(store)
+    path = _write(tmp_path, "export.csv", "a\n")
+    cache.digest(path, "crc32")
+    cache.save()
+
+    store.unlink()
+    cache.digest(path, "crc32")
+    cache.save()
+    assert cache.hits == 1
+    assert not store.exists()
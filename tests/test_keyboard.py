@@ -0,0 +1,83 @@
+# tests\test_keyboard.py
+
+import pytest
+
+from quickbooks_gui_api.managers.keyboard import (
+    KeyStroke, RecordingInputBackend, Win32InputBackend, compile_input,
+    _KEYEVENTF_EXTENDEDKEY, _KEYEVENTF_KEYUP, _KEYEVENTF_UNICODE,
+)
+
+
+def _transitions(strokes: list[KeyStroke]) -> list[str]:
+    return [f"{'+' if stroke.down else '-'}{stroke.key}" for stroke in strokes]
+
+
+def test_single_key_is_tapped_with_the_delay_on_its_release():
+    strokes = compile_input("enter", send_count=2, delay=0.5)
+
+    assert _transitions(strokes) == ["+enter", "-enter", "+enter", "-enter"]
+    assert [stroke.delay for stroke in strokes] == [0.0, 0.5, 0.0, 0.5]
+
+
+def test_hotkeys_release_in_reverse_order():
+    assert _transitions(compile_input(["ctrl", "shift", "s"])) == ["+ctrl", "+shift", "+s", "-s", "-shift", "-ctrl"]
+    assert _transitions(compile_input([["ctrl", "a"], ["ctrl", "v"]], delay=0.1)) == [
+        "+ctrl", "+a", "-a", "-ctrl", "+ctrl", "+v", "-v", "-ctrl",
+    ]
+
+
+def test_strings_are_text_with_the_delay_once_or_per_character():
+    whole = compile_input(string="ab", delay=0.2)
+    each = compile_input(string="ab", delay=0.2, char_at_a_time=True)
+
+    assert all(stroke.text for stroke in whole)
+    assert [stroke.delay for stroke in whole] == [0.0, 0.0, 0.0, 0.2]
+    assert [stroke.delay for stroke in each] == [0.0, 0.2, 0.0, 0.2]
+
+
+def test_interval_is_a_minimum_delay():
+    strokes = compile_input(["alt", "f"], delay=0.5, interval=0.05)
+
+    assert [stroke.delay for stroke in strokes] == [0.05, 0.05, 0.05, 0.5]
+
+
+@pytest.mark.parametrize("keys", [[], [["ctrl"], []], [["ctrl"], "a"]])
+def test_malformed_keys_raise(keys):
+    with pytest.raises(ValueError):
+        compile_input(keys)
+    with pytest.raises(ValueError):
+        compile_input()
+
+
+def test_recording_backend_batches_until_a_delay():
+    backend = RecordingInputBackend()
+
+    backend.send(compile_input(["ctrl", "a"]))
+    backend.send(compile_input(string="Hi", char_at_a_time=True, delay=0.1))
+    backend.send(compile_input("tab", send_count=3))
+
+    assert backend.typed_text() == "Hi"
+    assert backend.presses() == ["ctrl", "a", "tab", "tab", "tab"]
+    # One batch for the hotkey, one per delayed character, one for the tabs.
+    assert backend.submissions == 4
+    assert backend.elapsed == pytest.approx(0.2)
+    assert [time for time, stroke in backend.strokes if stroke.text and stroke.down] == [0.0, pytest.approx(0.1)]
+
+    backend.clear()
+    assert (backend.strokes, backend.submissions, backend.elapsed) == ([], 0, 0.0)
+
+
+def test_native_inputs_for_named_keys_and_text():
+    backend = Win32InputBackend()
+
+    def flags(stroke: KeyStroke) -> list[tuple[int, int, int]]:
+        return [(i.union.ki.wVk, i.union.ki.wScan, i.union.ki.dwFlags) for i in backend._inputs(stroke)]
+
+    assert flags(KeyStroke("Enter")) == [(0x0D, 0, 0)]
+    assert flags(KeyStroke("down", down=False)) == [(0x28, 0, _KEYEVENTF_EXTENDEDKEY | _KEYEVENTF_KEYUP)]
+    assert flags(KeyStroke("é", text=True)) == [(0, ord("é"), _KEYEVENTF_UNICODE)]
+    assert flags(KeyStroke("\n", text=True, down=False)) == [(0x0D, 0, _KEYEVENTF_KEYUP)]
+    # Outside the BMP: a surrogate pair.
+    assert [scan for _, scan, _ in flags(KeyStroke("😀", text=True))] == [0xD83D, 0xDE00]
+    with pytest.raises(ValueError):
+        flags(KeyStroke("notakey"))
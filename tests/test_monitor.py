@@ -0,0 +1,33 @@
+# tests\test_monitor.py
+
+import pytest
+
+pytest.importorskip("psutil")
+
+from quickbooks_gui_api.managers.monitor import RecyclePolicy
+
+
+def test_slowdown_is_measured_per_job_kind():
+    policy = RecyclePolicy(max_slowdown=1.5, window=2)
+
+    # Alternating fast invoices and slow reports is not a slowdown of either.
+    for _ in range(3):
+        policy.record_job(10, 10.0, "invoices")
+        policy.record_job(2, 40.0, "reports")
+    assert not policy.evaluate({}).recycle
+
+    policy.record_job(10, 30.0, "invoices")
+    policy.record_job(10, 30.0, "invoices")
+    advice = policy.evaluate({})
+    assert advice.recycle
+    assert advice.reasons[0].startswith("invoices:")
+
+
+def test_reset_forgets_every_kind():
+    policy = RecyclePolicy(max_slowdown=1.5, window=1)
+    policy.record_job(1, 1.0, "reports")
+    policy.record_job(1, 5.0, "reports")
+    assert policy.evaluate({}).recycle
+
+    policy.reset()
+    assert not policy.evaluate({}).recycle
@@ -0,0 +1,71 @@
+# tests\test_processes.py
+
+import os
+from pathlib import Path
+
+import pytest
+
+psutil = pytest.importorskip("psutil")
+
+from quickbooks_gui_api.managers import processes
+from quickbooks_gui_api.managers.processes import ProcessManager
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    calls: list[int] = []
+    process_iter = psutil.process_iter
+
+    def counting_iter(*args, **kwargs):
+        calls.append(1)
+        return process_iter(*args, **kwargs)
+
+    monkeypatch.setattr(processes.psutil, "process_iter", counting_iter)
+    return calls
+
+
+def test_pids_scan_once_for_every_target(scans):
+    me = psutil.Process()
+    manager = ProcessManager()
+
+    found = manager.pids([me.name(), "no-such-process.exe"], [Path(me.exe()), Path("C:/no/such.exe")])
+
+    assert os.getpid() in found
+    assert len(scans) == 1
+
+
+def test_pids_scan_only_while_a_target_is_untracked(scans):
+    me = psutil.Process()
+    manager = ProcessManager()
+
+    assert os.getpid() in manager.pids([me.name()])
+    assert os.getpid() in manager.pids([me.name()])
+    assert len(scans) == 1
+
+    # One target is tracked, the other is not: the machine is still scanned.
+    manager.pids([me.name(), "no-such-process.exe"])
+    assert len(scans) == 2
+
+
+def test_find_pid_prefers_tracked_processes(scans):
+    manager = ProcessManager()
+    name = psutil.Process().name()
+
+    assert manager.find_pid(name=name) is not None
+    assert manager.find_pid(name=name) is not None
+    assert manager.find_pid(name="no-such-process.exe") is None
+    assert len(scans) == 2
+
+
+def test_a_process_dropped_by_another_thread_is_not_an_error(monkeypatch):
+    manager = ProcessManager()
+    entry = manager.track(psutil.Process())
+
+    def exited(pid):
+        # Another thread saw the exit first and dropped the entry.
+        del manager.tracked[pid]
+        raise psutil.NoSuchProcess(pid)
+
+    monkeypatch.setattr(processes.psutil, "Process", exited)
+    assert not manager.is_alive(entry.pid)
+    assert entry.pid not in manager.tracked
@@ -0,0 +1,83 @@
+# tests\test_readiness.py
+
+from quickbooks_gui_api.managers.readiness import FakeClock, ReadinessGate, ScriptedProbe, company_file_loaded
+
+
+COMPANY     = "Company File 2024"
+MAIN        = "QuickBooks Desktop Enterprise"
+SELECTION   = "No QuickBooks Company Loaded"
+LOGIN       = "QuickBooks Desktop Login"
+
+
+def _gate(clock: FakeClock) -> ReadinessGate:
+    return ReadinessGate(interval=0.25, clock=clock, sleep=clock.sleep)
+
+
+def _titles_probe(script: list[list[str]]):
+    """A company-load probe reading scripted dialog titles, repeating the last ones."""
+    calls = {"count": 0}
+
+    def probe() -> bool:
+        titles = script[min(calls["count"], len(script) - 1)]
+        calls["count"] += 1
+        return company_file_loaded(titles, COMPANY, lambda title: title == LOGIN)
+
+    return probe, calls
+
+
+def test_selection_window_closing_is_not_loaded():
+    assert not company_file_loaded([MAIN], COMPANY, lambda title: title == LOGIN)
+    assert company_file_loaded([MAIN, LOGIN], COMPANY, lambda title: title == LOGIN)
+    assert company_file_loaded([f"{COMPANY} - {MAIN}"], COMPANY, lambda title: title == LOGIN)
+
+
+def test_waits_past_the_selection_window_until_login_shows():
+    clock = FakeClock()
+    probe, calls = _titles_probe([
+        [MAIN, SELECTION],
+        [MAIN],             # Selection window gone, file still opening.
+        [MAIN],
+        [MAIN, LOGIN],
+    ])
+
+    result = _gate(clock).wait("Company file loaded", probe, ceiling=10.0)
+
+    assert result.ready
+    assert calls["count"] == 4
+    assert clock.now == 0.75
+
+
+def test_waits_until_the_main_title_names_the_company_without_login():
+    clock = FakeClock()
+    probe, calls = _titles_probe([
+        [MAIN, SELECTION],
+        [MAIN],
+        [f"{COMPANY} - {MAIN}"],
+    ])
+
+    result = _gate(clock).wait("Company file loaded", probe, ceiling=10.0)
+
+    assert result.ready
+    assert calls["count"] == 3
+
+
+def test_company_load_delay_is_the_ceiling():
+    clock = FakeClock()
+    probe, _ = _titles_probe([[MAIN, SELECTION], [MAIN]])
+
+    result = _gate(clock).wait("Company file loaded", probe, ceiling=10.0)
+
+    assert not result.ready
+    assert clock.now == 10.0
+    assert result.elapsed == 10.0
+
+
+def test_probe_errors_count_as_not_ready():
+    clock = FakeClock()
+    probe = ScriptedProbe([RuntimeError("window not found"), False, True])
+
+    result = _gate(clock).wait("Login complete", probe, ceiling=5.0)
+
+    assert result.ready
+    assert result.attempts == 3
+    assert probe.calls == 3
@@ -0,0 +1,56 @@
+# tests\test_string.py
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("rapidfuzz")
+
+from quickbooks_gui_api.managers.string import OCR_MAX_COST_PER_CHAR, StringManager
+
+
+@pytest.fixture(scope="module")
+def strings() -> StringManager:
+    return StringManager()
+
+
+@pytest.mark.parametrize("ocr, text", [
+    ("Acrne",                                   "Acme"),
+    ("B0B",                                     "BOB"),
+    ("Hel1o World!!",                           "Hello World!!"),
+    ("Company File 2024.QBW ]",                 "Company File 2024.QBW"),
+    ("| Cornpany Fi1e 2O24.QBW",                "Company File 2024.QBW"),
+    ("Microsoft Print to PDF on P0RTPR0MPT;",   "Microsoft Print to PDF on PORTPROMPT:"),
+    ("Data Export - A1l lnvoices - Quarter1y Summary by Cust0mer",
+     "Data Export - All Invoices - Quarterly Summary by Customer"),
+])
+def test_ocr_noise_matches(strings: StringManager, ocr: str, text: str):
+    assert strings.is_ocr_match(ocr, text)
+
+
+@pytest.mark.parametrize("ocr, text", [
+    ("Acne",                                    "Acme"),
+    ("BOB",                                     "ROB"),
+    ("Company File 2023.QBW",                   "Company File 2024.QBW"),
+    ("Yellow World!!",                          "Hello World!!"),
+    ("Microsoft XPS Document Writer",           "Microsoft Print to PDF on PORTPROMPT:"),
+    ("ACNE Industries International Holdings, Inc.",
+     "ACME Industries International Holdings, Inc."),
+    ("Data Export - All Invoices - Quarterly Summary by Customer 2",
+     "Data Export - All Invoices - Quarterly Summary by Customer 3"),
+])
+def test_look_alike_names_do_not_match(strings: StringManager, ocr: str, text: str):
+    assert not strings.is_ocr_match(ocr, text)
+
+
+def test_allowance_grows_with_length_but_stays_below_one_edit(strings: StringManager):
+    scorer = strings.ocr_scorer
+    assert 0 < OCR_MAX_COST_PER_CHAR < 0.05
+
+    # Five O/0 confusions cost 0.5: too many for a short name, not for a long one.
+    assert not scorer.is_match("B00K 0F 0RD", "BOOK OF ORD", OCR_MAX_COST_PER_CHAR)
+    assert scorer.is_match("B00K 0F 0RDERS - Inventory Valuation", "BOOK OF ORDERS - Inventory Valuation", OCR_MAX_COST_PER_CHAR)
+    assert not scorer.is_match("x" * 200, "y" * 199 + "x", 1.0)
+
+
+def test_managers_share_the_calibration(strings: StringManager):
+    assert StringManager().ocr_scorer is strings.ocr_scorer
@@ -0,0 +1,104 @@
+# tests\test_tree.py
+
+import pytest
+
+from quickbooks_gui_api.managers.manager_exceptions import WindowNotFound
+from quickbooks_gui_api.managers.tree import SnapshotCache, StaticTreeProvider, TreeNode, TreeSnapshot, windows_only
+
+
+def _node(name: str, control_type: str = "Window", handle: int = 0, children=(), depth: int = 0) -> TreeNode:
+    return TreeNode(name, "", control_type, handle, (0, 0, 10, 10), depth, True, tuple(children))
+
+
+MAIN = _node("Company - QuickBooks", handle=1, children=[
+    _node("", "Pane", children=[
+        _node("Memorized Report List", handle=2, depth=2, children=[
+            _node("Sales by Customer", "ListItem", depth=3),
+            _node("Open Invoices", "ListItem", depth=3),
+        ]),
+        _node("Memorized Report List", handle=3, depth=2),
+    ], depth=1),
+    _node("Enter text", "Edit", depth=1),
+    _node("Create Disk File", handle=4, depth=1),
+])
+
+
+def test_windows_only_lifts_windows_out_of_other_controls():
+    filtered = windows_only(MAIN)
+
+    assert [(node.name, node.depth) for node in filtered.walk()] == [
+        ("Company - QuickBooks", 0),
+        ("Memorized Report List", 1),
+        ("Memorized Report List", 1),
+        ("Create Disk File", 1),
+    ]
+    assert all(node.control_type == "Window" for node in filtered.walk())
+
+
+def test_dialog_titles_are_unique_and_root_first():
+    snapshot = TreeSnapshot(MAIN)
+
+    assert snapshot.dialog_titles() == ["Company - QuickBooks", "Memorized Report List", "Create Disk File"]
+    assert [node.handle for node in snapshot.dialogs(include_root=False)] == [2, 3, 4]
+    assert snapshot.by_handle(4).name == "Create Disk File"
+    assert snapshot.by_handle(99) is None
+
+
+def test_static_provider_serves_scopes_and_repeats_the_last_tree():
+    other = _node("Other - QuickBooks", handle=5)
+    provider = StaticTreeProvider([MAIN, other])
+
+    assert len(TreeSnapshot(provider.fetch(None, "full"))) == len(list(MAIN.walk()))
+    assert provider.fetch(None).name == "Other - QuickBooks"
+    assert provider.fetch(None).name == "Other - QuickBooks"
+    assert provider.scopes == ["full", "windows", "windows"]
+    assert provider.fetch_count == 3
+
+
+def test_static_provider_without_main_window_raises():
+    with pytest.raises(WindowNotFound):
+        StaticTreeProvider([None]).fetch(None)
+    with pytest.raises(ValueError):
+        StaticTreeProvider([])
+
+
+def test_snapshot_cache_shares_until_stale_or_invalidated():
+    provider = StaticTreeProvider(MAIN)
+    cache = SnapshotCache(provider, max_age=60.0)
+    app, other_app = object(), object()
+
+    windows = cache.get(app)
+    assert cache.get(app) is windows
+    assert all(node.control_type == "Window" for node in windows)
+
+    # Scopes are cached separately; only the full tree has the list rows.
+    full = cache.get(app, scope="full")
+    assert any(node.control_type == "ListItem" for node in full)
+    assert cache.get(app, scope="full") is full
+    assert provider.scopes == ["windows", "full"]
+
+    cache.get(other_app)
+    cache.invalidate(app)
+    assert cache.get(app) is not windows
+    assert cache.get(app, max_age=0) is not None
+    cache.get(other_app)
+    assert provider.scopes == ["windows", "full", "windows", "windows", "windows"]
+
+
+def test_snapshot_invalidated_during_fetch_is_not_cached():
+    cache = SnapshotCache(StaticTreeProvider(MAIN), max_age=60.0)
+    app = object()
+
+    class Provider(StaticTreeProvider):
+        def fetch(self, app, scope="windows"):
+            # A window event lands on the hook thread while the tree is walked.
+            cache.invalidate(app)
+            return super().fetch(app, scope)
+
+    cache.provider = Provider(MAIN)
+    stale = cache.get(app)
+    assert len(stale) == len(list(windows_only(MAIN).walk()))
+
+    cache.provider = StaticTreeProvider(MAIN)
+    assert cache.get(app) is not stale
+    assert cache.get(app) is cache.get(app)
@@ -0,0 +1,208 @@
+# tests\test_warm_start.py
+
+import threading
+
+from quickbooks_gui_api.managers.readiness import FakeClock
+from quickbooks_gui_api.warm_start import WarmStarter
+
+
+class FakeQuickBooks:
+    """Counts launches and closes; `gate`, when set, holds a launch until released."""
+
+    def __init__(self) -> None:
+        self.launches   = 0
+        self.closes     = 0
+        self.healthy    = True
+        self.gate:      threading.Event | None = None
+        self.launching  = threading.Event()
+
+    def launch(self):
+        self.launching.set()
+        if self.gate is not None:
+            assert self.gate.wait(5.0)
+        self.launches += 1
+        return f"app{self.launches}", f"window{self.launches}"
+
+    def close(self) -> None:
+        self.closes += 1
+
+    def is_healthy(self) -> bool:
+        return self.healthy
+
+
+def _starter(qb: FakeQuickBooks, clock: FakeClock, **kwargs) -> WarmStarter:
+    kwargs.setdefault("lead_time", 300.0)
+    kwargs.setdefault("idle_timeout", 900.0)
+    kwargs.setdefault("health_interval", 60.0)
+    return WarmStarter(qb.launch, qb.close, qb.is_healthy, clock=clock, **kwargs)
+
+
+def test_warms_within_the_lead_time_and_hands_over():
+    clock = FakeClock(1000.0)
+    qb = FakeQuickBooks()
+    starter = _starter(qb, clock)
+    starter.schedule([2000.0])
+
+    assert starter.tick() == "cold"
+    clock.advance(701.0)
+    assert starter.tick() == "warm"
+    assert qb.launches == 1
+
+    assert starter.acquire() == ("app1", "window1")
+    assert starter.state == "in_use"
+    assert starter.stats["hits"] == 1
+    assert starter.next_job() is None
+
+
+def test_idle_session_is_shut_down_after_the_timeout():
+    clock = FakeClock()
+    qb = FakeQuickBooks()
+    starter = _starter(qb, clock, health_interval=10_000.0)
+    starter.schedule([100.0])
+
+    assert starter.tick() == "warm"
+    starter.acquire()
+    starter.release()
+
+    clock.advance(899.0)
+    assert starter.tick() == "warm"
+    clock.advance(1.0)
+    assert starter.tick() == "cold"
+    assert qb.closes == 1
+    assert starter.stats["idle_shutdowns"] == 1
+
+
+def test_failed_health_check_restarts_while_a_job_is_due():
+    clock = FakeClock()
+    qb = FakeQuickBooks()
+    starter = _starter(qb, clock)
+    starter.schedule([200.0])
+
+    starter.tick()
+    qb.healthy = False
+    clock.advance(60.0)
+    # The job is still due, so the replacement is launched in the same tick.
+    assert starter.tick() == "warm"
+    assert qb.closes == 1
+    assert qb.launches == 2
+    assert starter.stats["restarts"] == 1
+
+
+def test_unhealthy_session_at_hand_over_starts_cold():
+    clock = FakeClock()
+    qb = FakeQuickBooks()
+    starter = _starter(qb, clock)
+    starter.schedule([0.0])
+    starter.tick()
+
+    qb.healthy = False
+    assert starter.acquire() == ("app2", "window2")
+    assert starter.stats == {"warm_starts": 1, "cold_starts": 1, "hits": 0, "restarts": 1, "idle_shutdowns": 0}
+
+
+def test_attach_runs_on_the_acquiring_thread():
+    clock = FakeClock()
+    qb = FakeQuickBooks()
+    attached: list[threading.Thread] = []
+
+    def attach():
+        attached.append(threading.current_thread())
+        return "attached_app", "attached_window"
+
+    starter = _starter(qb, clock, attach=attach)
+    starter.schedule([0.0])
+    worker = threading.Thread(target=starter.tick)
+    worker.start()
+    worker.join()
+
+    assert starter.acquire() == ("attached_app", "attached_window")
+    assert attached == [threading.current_thread()]
+    assert starter.session.app == "attached_app"
+
+
+def test_launch_does_not_hold_the_lock_and_acquire_waits_for_it():
+    clock = FakeClock()
+    qb = FakeQuickBooks()
+    qb.gate = threading.Event()
+    starter = _starter(qb, clock)
+    starter.schedule([0.0, 50.0])
+
+    worker = threading.Thread(target=starter.tick)
+    worker.start()
+    assert qb.launching.wait(5.0)
+
+    # Status and scheduling calls return while QuickBooks is still starting.
+    assert starter.state == "warming"
+    starter.schedule([5000.0])
+    assert starter.next_job() == 0.0
+
+    handed: list[tuple] = []
+    job = threading.Thread(target=lambda: handed.append(starter.acquire()))
+    job.start()
+    job.join(0.2)
+    assert job.is_alive() and not handed
+
+    qb.gate.set()
+    worker.join(5.0)
+    job.join(5.0)
+    assert handed == [("app1", "window1")]
+    assert qb.launches == 1
+    assert starter.stats["hits"] == 1
+
+
+def test_health_checks_and_shutdowns_do_not_hold_the_lock():
+    clock = FakeClock()
+    qb = FakeQuickBooks()
+    starter = _starter(qb, clock)
+    starter.schedule([200.0])
+    starter.tick()
+    seen: list[tuple[str, str, bool]] = []
+
+    def probe(step: str) -> None:
+        # Status calls from another thread return while the step runs.
+        other = threading.Thread(target=starter.next_job)
+        other.start()
+        other.join(1.0)
+        seen.append((step, starter.state, not other.is_alive()))
+
+    starter._healthy = lambda: probe("check") or False
+    starter._close = lambda: probe("close")
+    starter._launch = lambda: ("app2", "window2")
+
+    clock.advance(60.0)
+    assert starter.tick() == "warm"
+    assert seen == [("check", "checking", True), ("close", "stopping", True)]
+
+
+def test_acquire_waits_for_a_health_check():
+    clock = FakeClock()
+    qb = FakeQuickBooks()
+    starter = _starter(qb, clock)
+    starter.schedule([0.0, 200.0])
+    starter.tick()
+
+    checking, release = threading.Event(), threading.Event()
+
+    def slow_check() -> bool:
+        checking.set()
+        assert release.wait(5.0)
+        return True
+
+    starter._healthy = slow_check
+    clock.advance(60.0)
+    worker = threading.Thread(target=starter.tick)
+    worker.start()
+    assert checking.wait(5.0)
+
+    handed: list[tuple] = []
+    job = threading.Thread(target=lambda: handed.append(starter.acquire()))
+    job.start()
+    job.join(0.2)
+    assert job.is_alive() and not handed
+
+    starter._healthy = qb.is_healthy
+    release.set()
+    worker.join(5.0)
+    job.join(5.0)
+    assert handed == [("app1", "window1")]
+    assert qb.launches == 1
@@ -0,0 +1,78 @@
+# tests\test_watch.py
+
+import time
+import threading
+
+from pathlib import Path
+
+import pytest
+
+from quickbooks_gui_api.managers.file import FileManager
+from quickbooks_gui_api.managers.watch import PollingWatcher, open_watcher
+
+
+# Polls far apart enough that only a change notification can end the wait in time.
+POLL_FREQUENCY: float = 2.0
+DELAY:          float = 0.3
+MAX_WAKE:       float = 0.2
+
+
+@pytest.fixture
+def notifying_dir(tmp_path: Path) -> Path:
+    with open_watcher(tmp_path) as watcher:
+        if isinstance(watcher, PollingWatcher):
+            pytest.skip("No change notifications on this platform.")
+    return tmp_path
+
+
+def _after_delay(action) -> list[float]:
+    """
+    Runs `action` on a thread after `DELAY` seconds, recording when it started. The time is
+    recorded first, so it is already there when a waiter wakes on the action's effect.
+    """
+    started: list[float] = []
+
+    def run() -> None:
+        time.sleep(DELAY)
+        started.append(time.monotonic())
+        action()
+
+    threading.Thread(target=run, daemon=True).start()
+    return started
+
+
+def test_wait_for_file_wakes_on_create(notifying_dir: Path):
+    target = notifying_dir / "arriving.pdf"
+    created = _after_delay(lambda: target.write_bytes(b"%PDF-1.4"))
+
+    assert FileManager().wait_for_file(target, max_time=5.0, poll_frequency=POLL_FREQUENCY)
+    woke = time.monotonic()
+
+    assert created
+    assert woke - created[0] < MAX_WAKE
+
+
+def test_wait_for_file_wakes_on_rename(notifying_dir: Path):
+    partial = notifying_dir / "arriving.csv.part"
+    partial.write_text("a,b\n1,2\n")
+    target = notifying_dir / "arriving.csv"
+    renamed = _after_delay(lambda: partial.rename(target))
+
+    assert FileManager().wait_for_file(target, max_time=5.0, poll_frequency=POLL_FREQUENCY)
+    woke = time.monotonic()
+
+    assert renamed
+    assert woke - renamed[0] < MAX_WAKE
+
+
+def test_wait_for_file_times_out(tmp_path: Path):
+    start = time.monotonic()
+    assert not FileManager().wait_for_file(tmp_path / "never.pdf", max_time=0.3, poll_frequency=0.1)
+    assert time.monotonic() - start < 1.0
+
+
+def test_watcher_wakes_only_on_change(notifying_dir: Path):
+    with open_watcher(notifying_dir) as watcher:
+        assert not watcher.wait(0.05)
+        (notifying_dir / "touched.txt").write_text("x")
+        assert watcher.wait(1.0)
@@ -0,0 +1,64 @@
+# tests\test_window.py
+
+import time
+
+import pytest
+
+pytest.importorskip("pywinauto")
+pytest.importorskip("win32gui")
+
+from pywinauto import WindowSpecification
+
+from quickbooks_gui_api.managers.desktop import FakeWindowBackend, WindowRecord
+from quickbooks_gui_api.managers.focus import FakeFocusBackend
+from quickbooks_gui_api.managers.keyboard import RecordingInputBackend
+from quickbooks_gui_api.managers.tree import StaticTreeProvider, TreeNode
+from quickbooks_gui_api.managers.window import WindowManager
+
+
+MAIN = 100
+FIND_TIMEOUT = 5.0
+
+
+class FakeApp:
+    process = 1234
+
+
+class MissingSpec(WindowSpecification):
+    """A control that is not there. Its blocking search waits as long as pywinauto's global find timeout."""
+
+    def __init__(self, **criteria) -> None:
+        super().__init__(dict(criteria, process=FakeApp.process))
+        self.searched = False
+
+    def exists(self, timeout=None, retry_interval=None) -> bool:
+        return False
+
+    def wrapper_object(self):
+        self.searched = True
+        time.sleep(FIND_TIMEOUT)
+        raise AssertionError("The probe waited for a missing element.")
+
+
+@pytest.fixture
+def manager():
+    main = TreeNode("Company - QuickBooks", "", "Window", MAIN, (0, 0, 10, 10), 0, True, ())
+    return WindowManager(
+        tree_provider=StaticTreeProvider(main),
+        window_backend=FakeWindowBackend([WindowRecord(MAIN, "Company - QuickBooks", "QBPOPUP", 0, 0, 0)]),
+        input_backend=RecordingInputBackend(),
+        focus_backend=FakeFocusBackend(),
+    )
+
+
+def test_a_polling_pass_does_not_wait_for_missing_elements(manager):
+    specs = [MissingSpec(title=title, control_type="Window") for title in ("Memorized Report List", "Create Disk File")]
+    conditions = {spec.criteria[0]["title"]: manager.element_condition(spec) for spec in specs}
+    conditions["Save"] = manager.dialog_condition(FakeApp(), "Save")
+
+    start = time.perf_counter()
+    assert manager.wait_any(conditions, timeout=0) is None
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.1
+    assert not any(spec.searched for spec in specs)